@@ -89,6 +89,7 @@ from gradio.flagging import (
     CSVLogger,
     FlaggingCallback,
     SimpleCSVLogger,
+    SQLiteLogger,
 )
 from gradio.helpers import Info, Progress, Success, Warning, skip, update
 from gradio.helpers import create_examples as Examples  # noqa: N812
@@ -210,6 +211,7 @@ __all__ = [
     "Request",
     "RetryData",
     "Row",
+    "SQLiteLogger",
     "ScatterPlot",
     "SelectData",
     "Sidebar",
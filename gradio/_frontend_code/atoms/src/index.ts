@@ -0,0 +1,14 @@
+export { default as Block } from "./Block.svelte";
+export { default as BlockTitle } from "./BlockTitle.svelte";
+export { default as BlockLabel } from "./BlockLabel.svelte";
+export { default as IconButton } from "./IconButton.svelte";
+export { default as Empty } from "./Empty.svelte";
+export { default as Info } from "./Info.svelte";
+export { default as ShareButton } from "./ShareButton.svelte";
+export { default as UploadText } from "./UploadText.svelte";
+export { default as Toolbar } from "./Toolbar.svelte";
+export { default as SelectSource } from "./SelectSource.svelte";
+export { default as IconButtonWrapper } from "./IconButtonWrapper.svelte";
+export { default as FullscreenButton } from "./FullscreenButton.svelte";
+
+export const BLOCK_KEY = {};
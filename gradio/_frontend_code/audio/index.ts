@@ -0,0 +1,7 @@
+import { default as Index } from "./Index.svelte";
+export default Index;
+export { default as BaseStaticAudio } from "./static/StaticAudio.svelte";
+export { default as BaseInteractiveAudio } from "./interactive/InteractiveAudio.svelte";
+export { default as BasePlayer } from "./player/AudioPlayer.svelte";
+export type { WaveformOptions } from "./shared/types";
+export { default as BaseExample } from "./Example.svelte";
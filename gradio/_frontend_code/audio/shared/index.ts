@@ -0,0 +1 @@
+export { default as Audio } from "./Audio.svelte";
@@ -0,0 +1,2 @@
+export { default as default } from "./Index.svelte";
+export { default as BaseButton } from "./shared/Button.svelte";
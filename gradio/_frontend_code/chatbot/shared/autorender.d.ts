@@ -0,0 +1 @@
+declare module "katex/dist/contrib/auto-render.js";
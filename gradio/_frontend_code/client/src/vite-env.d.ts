@@ -0,0 +1,3 @@
+/// <reference types="vite/client" />
+
+declare const BROWSER_BUILD: boolean;
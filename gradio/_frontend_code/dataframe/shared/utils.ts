@@ -0,0 +1,17 @@
+export type Headers = string[];
+export type Data = (string | number)[][];
+export type Datatype = "str" | "markdown" | "html" | "number" | "bool" | "date";
+export type Metadata = {
+	[key: string]: string[][] | null;
+} | null;
+export type HeadersWithIDs = { value: string; id: string }[];
+export type DataframeValue = {
+	data: Data;
+	headers: Headers;
+	metadata: Metadata;
+	// only set if the rows are loaded a page at a time from the server
+	frame_id?: string;
+	total_rows?: number;
+	row_indices?: number[];
+	edits?: [number, number, string | number][];
+};
@@ -0,0 +1,5 @@
+export interface FileNode {
+	type: "file" | "folder";
+	name: string;
+	valid?: boolean;
+}
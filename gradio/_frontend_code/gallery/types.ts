@@ -0,0 +1,12 @@
+import type { FileData } from "@gradio/client";
+
+export interface GalleryImage {
+	image: FileData;
+	caption: string | null;
+	thumbnail?: FileData | null;
+}
+
+export interface GalleryVideo {
+	video: FileData;
+	caption: string | null;
+}
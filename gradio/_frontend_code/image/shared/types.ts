@@ -0,0 +1,9 @@
+export interface Base64File {
+	url: string;
+	alt_text: string;
+}
+
+export interface WebcamOptions {
+	mirror: boolean;
+	constraints: MediaStreamConstraints;
+}
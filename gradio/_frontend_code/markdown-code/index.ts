@@ -0,0 +1 @@
+export { default as MarkdownCode } from "./MarkdownCode.svelte";
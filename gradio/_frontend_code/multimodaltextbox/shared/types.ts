@@ -0,0 +1 @@
+export type { InputHTMLAttributes } from "../../textbox/shared/types";
@@ -0,0 +1,2 @@
+export * from "svelte/compiler";
+export * as default from "svelte/compiler";
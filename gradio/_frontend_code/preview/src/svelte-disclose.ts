@@ -0,0 +1,2 @@
+// @ts-ignore
+export * from "svelte/internal/disclose-version";
@@ -0,0 +1,5 @@
+export * from "svelte/transition";
+export { spring, tweened } from "svelte/motion";
+export * from "svelte/store";
+export * from "svelte/easing";
+export * from "svelte/animate";
@@ -0,0 +1,4 @@
+
+from .test import Test
+
+__all__ = ['Test']
@@ -0,0 +1 @@
+export declare function sanitize(source: string): string;
@@ -0,0 +1,6 @@
+export { default as StatusTracker } from "./static/index.svelte";
+export { default as Toast } from "./static/Toast.svelte";
+export { default as Loader } from "./static/Loader.svelte";
+export { default as StreamingBar } from "./static/StreamingBar.svelte";
+export type * from "./static/types";
+export { default } from "./static/index.svelte";
@@ -0,0 +1,6 @@
+export { default as StatusTracker } from "./index.svelte";
+export { default as Toast } from "./Toast.svelte";
+export { default as Loader } from "./Loader.svelte";
+export { default as StreamingBar } from "./StreamingBar.svelte";
+export type * from "./types";
+export { default } from "./index.svelte";
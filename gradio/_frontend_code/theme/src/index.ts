@@ -0,0 +1,6 @@
+// export { default as reset } from "./reset.css";
+// export { default as global } from "./global.css";
+// export { default as css } from "./pollen.css";
+// export { default as typography } from "./typography.css";
+
+export * from "./colors.js";
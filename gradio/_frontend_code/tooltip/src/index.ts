@@ -0,0 +1 @@
+export { tooltip } from "./tooltip";
@@ -0,0 +1,3 @@
+export { default as Upload } from "./Upload.svelte";
+export { default as ModifyUpload } from "./ModifyUpload.svelte";
+export { create_drag } from "./utils";
@@ -0,0 +1,2 @@
+export * from "./color.js";
+export * from "./utils.js";
@@ -0,0 +1,7 @@
+export { default as BaseInteractiveVideo } from "./shared/InteractiveVideo.svelte";
+export { default as BaseStaticVideo } from "./shared/VideoPreview.svelte";
+export { default as BasePlayer } from "./shared/Player.svelte";
+export { prettyBytes, playable, loaded } from "./shared/utils";
+export { default as BaseExample } from "./Example.svelte";
+import { default as Index } from "./Index.svelte";
+export default Index;
@@ -0,0 +1 @@
+export { default as Video } from "./Video.svelte";
@@ -0,0 +1,2 @@
+export { WorkerProxy, type WorkerProxyOptions } from "./worker-proxy";
+export { WasmWorkerEventSource } from "./sse";
@@ -0,0 +1,3 @@
+export * from "./context";
+export * from "./file-url";
+export { default as DownloadLink } from "./DownloadLink.svelte";
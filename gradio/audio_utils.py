@@ -0,0 +1,351 @@
+"""
+Reads the duration of audio files from their headers, and reads and writes the samples of WAV
+files directly with numpy, so that they do not have to go through ffmpeg (or pydub).
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class WavInfo(NamedTuple):
+    # The format of the samples, which is the subformat for WAVE_FORMAT_EXTENSIBLE files
+    format: int
+    channels: int
+    sample_rate: int
+    block_align: int
+    bits_per_sample: int
+    data_offset: int
+    data_size: int
+
+
+def _file_size(f: BinaryIO) -> int:
+    position = f.tell()
+    size = f.seek(0, 2)
+    f.seek(position)
+    return size
+
+
+def read_wav_info(f: BinaryIO) -> WavInfo | None:
+    """Reads the format of a WAV file and the position of its samples from its chunks, or
+    returns None if it is not a WAV file."""
+    f.seek(0)
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+    fmt = None
+    while len(chunk := f.read(8)) == 8:
+        chunk_id, size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+        if chunk_id == b"fmt ":
+            data = f.read(size)
+            if len(data) < 16:
+                return None
+            format, channels, sample_rate, _, block_align, bits = struct.unpack_from(
+                "<HHIIHH", data
+            )
+            if format == WAVE_FORMAT_EXTENSIBLE and len(data) >= 26:
+                # The first two bytes of the SubFormat GUID are the format of the samples
+                format = struct.unpack_from("<H", data, 24)[0]
+            fmt = (format, channels, sample_rate, block_align, bits)
+            f.seek(size % 2, 1)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            offset = f.tell()
+            # The size can be wrong in streamed files, which are written before it is known
+            size = min(size, _file_size(f) - offset)
+            return WavInfo(*fmt, data_offset=offset, data_size=size)
+        else:
+            f.seek(size + size % 2, 1)
+    return None
+
+
+def read_wav(filename: str | Path) -> tuple[int, np.ndarray] | None:
+    """
+    Reads the samples of an 8, 16, 24 or 32-bit PCM WAV file into a numpy array, in the same
+    format as processing_utils.audio_from_file(), i.e. 8-bit samples are converted to signed
+    integers and 24-bit samples to 32-bit integers. Returns None if the file is not such a WAV
+    file.
+    """
+    with open(filename, "rb") as f:
+        info = read_wav_info(f)
+        if (
+            info is None
+            or info.format != WAVE_FORMAT_PCM
+            or info.bits_per_sample not in (8, 16, 24, 32)
+            or info.channels == 0
+            or info.block_align != info.channels * info.bits_per_sample // 8
+        ):
+            return None
+        frames = info.data_size // info.block_align
+        f.seek(info.data_offset)
+        if info.bits_per_sample == 24:
+            raw = np.fromfile(f, dtype=np.uint8, count=frames * info.block_align)
+            raw = raw.reshape(-1, 3)
+            # The same conversion as pydub, which shifts the samples to the upper 3 bytes
+            data = np.empty((len(raw), 4), dtype=np.uint8)
+            data[:, 0] = np.where(raw[:, 2] > 0x7F, 0xFF, 0)
+            data[:, 1:] = raw
+            data = data.view("<i4").reshape(-1)
+        else:
+            dtype = {8: np.uint8, 16: "<i2", 32: "<i4"}[info.bits_per_sample]
+            data = np.fromfile(f, dtype=dtype, count=frames * info.channels)
+            if info.bits_per_sample == 8:
+                # 8-bit WAV samples are unsigned
+                data -= 128
+                data = data.view(np.int8)
+    data = data.astype(data.dtype.newbyteorder("="), copy=False)
+    if info.channels > 1:
+        data = data.reshape(-1, info.channels)
+    return info.sample_rate, data
+
+
+# The number of frames that are written at a time by write_wav()
+WAV_WRITE_CHUNK_FRAMES = 1 << 16
+
+
+def write_wav(filename: str | Path, sample_rate: int, data: np.ndarray):
+    """
+    Writes 16 or 32-bit integer samples to a PCM WAV file, with one column per channel if
+    `data` is 2-dimensional. The samples are written in chunks, so that they are not copied
+    into a single bytes object first.
+    """
+    if data.dtype not in (np.int16, np.int32) or data.ndim not in (1, 2):
+        raise ValueError(
+            f"Cannot write {data.dtype} samples of shape {data.shape} to a WAV file."
+        )
+    channels = 1 if data.ndim == 1 else data.shape[1]
+    sample_width = data.dtype.itemsize
+    data_size = data.size * sample_width
+    with open(filename, "wb") as f:
+        f.write(
+            struct.pack(
+                "<4sI4s4sIHHIIHH4sI",
+                b"RIFF",
+                36 + data_size,
+                b"WAVE",
+                b"fmt ",
+                16,
+                WAVE_FORMAT_PCM,
+                channels,
+                sample_rate,
+                sample_rate * channels * sample_width,
+                channels * sample_width,
+                sample_width * 8,
+                b"data",
+                data_size,
+            )
+        )
+        little_endian = data.dtype.newbyteorder("<")
+        for start in range(0, len(data), WAV_WRITE_CHUNK_FRAMES):
+            chunk = data[start : start + WAV_WRITE_CHUNK_FRAMES]
+            # Only copies the chunk if it is not contiguous or little-endian
+            f.write(np.ascontiguousarray(chunk, dtype=little_endian).data)
+
+
+def _wav_duration(f: BinaryIO) -> float | None:
+    info = read_wav_info(f)
+    if (
+        info is None
+        or info.format not in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT)
+        or not info.block_align
+        or not info.sample_rate
+    ):
+        return None
+    return info.data_size // info.block_align / info.sample_rate
+
+
+def _skip_id3v2(f: BinaryIO):
+    # Seeks to the end of the ID3v2 tag at the start of the file, if there is one
+    f.seek(0)
+    header = f.read(10)
+    if len(header) == 10 and header[:3] == b"ID3":
+        size = 0
+        for byte in header[6:10]:  # a "syncsafe" integer of 4 * 7 bits
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if header[5] & 0x10 else 0
+        f.seek(10 + size + footer)
+    else:
+        f.seek(0)
+
+
+def _flac_duration(f: BinaryIO) -> float | None:
+    _skip_id3v2(f)
+    if f.read(4) != b"fLaC":
+        return None
+    # The first metadata block is always the STREAMINFO block
+    block = f.read(4 + 34)
+    if len(block) < 38 or block[0] & 0x7F != 0:
+        return None
+    packed = int.from_bytes(block[4 + 10 : 4 + 18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def _ogg_duration(f: BinaryIO) -> float | None:
+    f.seek(0)
+    page = f.read(27)
+    if len(page) < 27 or page[:4] != b"OggS":
+        return None
+    serial = page[14:18]
+    segments = f.read(page[26])
+    packet = f.read(sum(segments))
+    if packet[:7] == b"\x01vorbis" and len(packet) >= 16:
+        sample_rate = struct.unpack_from("<I", packet, 12)[0]
+        pre_skip = 0
+    elif packet[:8] == b"OpusHead" and len(packet) >= 12:
+        sample_rate = 48000  # the granule positions of Opus are always at 48kHz
+        pre_skip = struct.unpack_from("<H", packet, 10)[0]
+    else:
+        return None
+
+    # The granule position of the last page of the stream is its number of samples
+    size = _file_size(f)
+    f.seek(max(0, size - 65536 - 27))  # the largest possible page
+    tail = f.read()
+    end = len(tail)
+    while (start := tail.rfind(b"OggS", 0, end)) != -1:
+        end = start
+        if len(tail) < start + 27 or tail[start + 14 : start + 18] != serial:
+            continue
+        granule = struct.unpack_from("<q", tail, start + 6)[0]
+        if granule >= 0:
+            if not sample_rate:
+                return None
+            return max(granule - pre_skip, 0) / sample_rate
+    return None
+
+
+_MP3_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = [44100, 48000, 32000]
+
+
+def _mp3_frame_header(data: bytes) -> tuple[int, int, int, int, int] | None:
+    # Returns the version bits, layer, bitrate index, sample rate and frame length of the
+    # MPEG audio frame header at the start of `data`, or None if it is not a valid header
+    if len(data) < 4 or data[0] != 0xFF or data[1] & 0xE0 != 0xE0:
+        return None
+    header = int.from_bytes(data[:4], "big")
+    version_bits = (header >> 19) & 3  # 0: MPEG 2.5, 2: MPEG 2, 3: MPEG 1
+    layer = 4 - ((header >> 17) & 3)
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 3
+    # Free-format frames (bitrate index 0) are rejected too, as their length is unknown
+    if (
+        version_bits == 1
+        or layer == 4
+        or bitrate_index in (0, 0xF)
+        or sample_rate_index == 3
+    ):
+        return None
+    version = 1 if version_bits == 3 else 2
+    sample_rate = (
+        _MP3_SAMPLE_RATES[sample_rate_index] >> {3: 0, 2: 1, 0: 2}[version_bits]
+    )
+    bitrate = _MP3_BITRATES[(version, layer)][bitrate_index] * 1000
+    padding = (header >> 9) & 1
+    if layer == 1:
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 3 and version == 2:
+        frame_length = 72 * bitrate // sample_rate + padding
+    else:
+        frame_length = 144 * bitrate // sample_rate + padding
+    return version_bits, layer, bitrate_index, sample_rate, frame_length
+
+
+def _mp3_duration(f: BinaryIO) -> float | None:
+    f.seek(0)
+    has_id3 = f.read(3) == b"ID3"
+    _skip_id3v2(f)
+    frame_offset = f.tell()
+    data = f.read(4096)
+    # Without an ID3v2 tag, an MP3 file has to start with a frame. Otherwise, the first
+    # frame is looked for in the padding after the tag.
+    for i in range(len(data) - 4 if has_id3 else 1):
+        frame_header = _mp3_frame_header(data[i : i + 4])
+        if frame_header is not None:
+            frame_offset += i
+            break
+    else:
+        return None
+    version_bits, layer, bitrate_index, sample_rate, frame_length = frame_header
+
+    # The sync bytes can also occur by chance in other files, so the next frame has to
+    # be a valid frame of the same stream too
+    f.seek(frame_offset)
+    frame = f.read(frame_length + 4)
+    next_frame_header = _mp3_frame_header(frame[frame_length:])
+    if next_frame_header is None or (
+        next_frame_header[:2] != (version_bits, layer)
+        or next_frame_header[3] != sample_rate
+    ):
+        return None
+
+    header = int.from_bytes(frame[:4], "big")
+    version = 1 if version_bits == 3 else 2
+    samples_per_frame = {1: 384, 2: 1152, 3: 1152 if version == 1 else 576}[layer]
+    mono = (header >> 6) & 3 == 3
+
+    # VBR files have a Xing (or Info) or a VBRI header in their first frame
+    side_info = (17 if mono else 32) if version == 1 else (9 if mono else 17)
+    xing = frame[4 + side_info :]
+    flags = int.from_bytes(xing[4:8], "big")
+    if xing[:4] in (b"Xing", b"Info") and flags & 1 and len(xing) >= 12:
+        samples = int.from_bytes(xing[8:12], "big") * samples_per_frame
+        # The LAME extension after the Xing header has the number of samples that the
+        # encoder added at the start and the end of the stream
+        lame = xing[8 + 4 * (flags & 0b1011).bit_count() + 100 * bool(flags & 4) :]
+        if lame[:4] in (b"LAME", b"Lavf", b"Lavc") and len(lame) >= 24:
+            delay_and_padding = int.from_bytes(lame[21:24], "big")
+            samples -= (delay_and_padding >> 12) + (delay_and_padding & 0xFFF)
+        return max(samples, 0) / sample_rate
+    vbri = frame[36 : 36 + 18]
+    if vbri[:4] == b"VBRI" and len(vbri) == 18:
+        return int.from_bytes(vbri[14:18], "big") * samples_per_frame / sample_rate
+
+    # Otherwise the bitrate is constant
+    bitrate = _MP3_BITRATES[(version, layer)][bitrate_index] * 1000
+    audio_size = _file_size(f) - frame_offset
+    f.seek(-128, 2)
+    if f.read(3) == b"TAG":  # ID3v1 tag
+        audio_size -= 128
+    return max(audio_size, 0) * 8 / bitrate
+
+
+def duration_from_header(filename: str | Path) -> float | None:
+    """
+    Returns the duration in seconds of a WAV, MP3, FLAC or Ogg (Vorbis or Opus) file, as read
+    from its headers without decoding it, or None if the file is not in one of these formats
+    or its duration is not in its headers.
+    """
+    try:
+        with open(filename, "rb") as f:
+            _skip_id3v2(f)
+            magic = f.read(4)
+            if magic == b"RIFF":
+                return _wav_duration(f)
+            if magic == b"fLaC":
+                return _flac_duration(f)
+            if magic == b"OggS":
+                return _ogg_duration(f)
+            return _mp3_duration(f)
+    except (OSError, struct.error, ValueError, IndexError):
+        return None
@@ -18,6 +18,7 @@ import warnings
 import webbrowser
 from collections import defaultdict
 from collections.abc import AsyncIterator, Callable, Coroutine, Sequence, Set
+from functools import partial
 from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Union, cast
@@ -73,9 +74,14 @@ from gradio.exceptions import (
 from gradio.helpers import create_tracker, skip, special_args
 from gradio.i18n import I18n, I18nData
 from gradio.node_server import start_node_server
-from gradio.route_utils import API_PREFIX, MediaStream
+from gradio.route_utils import (
+    API_PREFIX,
+    CacheIndex,
+    MediaStream,
+    TempFileSet,
+)
 from gradio.routes import INTERNAL_ROUTES, VERSION, App, Request
-from gradio.state_holder import SessionState, StateHolder
+from gradio.state_holder import SessionState, StateBackend, StateHolder
 from gradio.themes import Default as DefaultTheme
 from gradio.themes import ThemeClass as Theme
 from gradio.tunneling import (
@@ -156,7 +162,9 @@ class Block:
         self.is_rendered: bool = False
         self._constructor_args: list[dict]
         self.state_session_capacity = 10000
-        self.temp_files: set[str] = set()
+        self.state_memory_budget: int | None = None
+        self.state_backend: StateBackend | None = None
+        self.temp_files: set[str] = TempFileSet()
         self.GRADIO_CACHE = get_upload_folder()
         self.key = key
         self.preserved_by_key = (
@@ -346,7 +354,7 @@ class Block:
             url_or_file_path = str(utils.abspath(url_or_file_path))
             if not utils.is_in_or_equal(url_or_file_path, self.GRADIO_CACHE):
                 try:
-                    temp_file_path = processing_utils.save_file_to_cache(
+                    temp_file_path = await processing_utils.async_save_file_to_cache(
                         url_or_file_path, cache_dir=self.GRADIO_CACHE
                     )
                 except FileNotFoundError:
@@ -573,6 +581,9 @@ class BlockFunction:
         connection: Literal["stream", "sse"] = "sse",
         time_limit: float | None = None,
         stream_every: float = 0.5,
+        coalesce_window: float | None = None,
+        coalesce_max_bytes: int = 65536,
+        parallel_processing: bool = False,
         like_user_message: bool = False,
         event_specific_args: list[str] | None = None,
         page: str = "",
@@ -623,6 +634,9 @@ class BlockFunction:
         self.is_cancel_function = is_cancel_function
         self.time_limit = time_limit
         self.stream_every = stream_every
+        self.coalesce_window = coalesce_window
+        self.coalesce_max_bytes = coalesce_max_bytes
+        self.parallel_processing = parallel_processing
         self.connection = connection
         self.like_user_message = like_user_message
         self.event_specific_args = event_specific_args
@@ -688,6 +702,21 @@ class BlockFunction:
         }
 
 
+class _Identity:
+    """Compares equal to another _Identity only if they wrap the same object."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and self.obj is other.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
 def postprocess_update_dict(
     block: Component | BlockContext, update_dict: dict, postprocess: bool = True
 ):
@@ -791,6 +820,9 @@ class BlocksConfig:
         connection: Literal["stream", "sse"] = "sse",
         time_limit: float | None = None,
         stream_every: float = 0.5,
+        coalesce_window: float | None = None,
+        coalesce_max_bytes: int = 65536,
+        parallel_processing: bool = False,
         like_user_message: bool = False,
         event_specific_args: list[str] | None = None,
         js_implementation: str | None = None,
@@ -827,6 +859,9 @@ class BlocksConfig:
             connection: The connection format, either "sse" or "stream".
             time_limit: The time limit for the function to run. Parameter only used for the `.stream()` event.
             stream_every: The latency (in seconds) at which stream chunks are sent to the backend. Defaults to 0.5 seconds. Parameter only used for the `.stream()` event.
+            coalesce_window: If set, the maximum time (in seconds) that an intermediate output of a generator is held back so that the outputs yielded after it can be merged into the same message. If None, every yielded output is sent as its own message.
+            coalesce_max_bytes: The approximate maximum size (in bytes) of the diffs merged into a single message when `coalesce_window` is set.
+            parallel_processing: If True, the components (and the samples of a batch) are preprocessed and postprocessed concurrently in worker threads.
         Returns: dependency information, dependency index
         """
         # Support for singular parameter
@@ -966,6 +1001,9 @@ class BlocksConfig:
             connection=connection,
             time_limit=time_limit,
             stream_every=stream_every,
+            coalesce_window=coalesce_window,
+            coalesce_max_bytes=coalesce_max_bytes,
+            parallel_processing=parallel_processing,
             like_user_message=like_user_message,
             event_specific_args=event_specific_args,
             page=self.root_block.current_page,
@@ -1164,7 +1202,7 @@ class Blocks(BlockContext, BlocksEvents, metaclass=BlocksMeta):
         head_paths: str | Path | Sequence[str | Path] | None = None,
         fill_height: bool = False,
         fill_width: bool = False,
-        delete_cache: tuple[int, int] | None = None,
+        delete_cache: tuple[int, int] | tuple[int, int, int] | None = None,
         **kwargs,
     ):
         """
@@ -1180,7 +1218,7 @@ class Blocks(BlockContext, BlocksEvents, metaclass=BlocksMeta):
             head_paths: Custom html code as a pathlib.Path to a html file or a list of such paths. This html files will be read, concatenated, and included in the head of the demo webpage. If the `head` parameter is also set, the html from `head` will be included first.
             fill_height: Whether to vertically expand top-level child components to the height of the window. If True, expansion occurs when the scale value of the child components >= 1.
             fill_width: Whether to horizontally expand to fill container fully. If False, centers and constrains app to a maximum width. Only applies if this is the outermost `Blocks` in your Gradio app.
-            delete_cache: A tuple corresponding [frequency, age] both expressed in number of seconds. Every `frequency` seconds, the temporary files created by this Blocks instance will be deleted if more than `age` seconds have passed since the file was created. For example, setting this to (86400, 86400) will delete temporary files every day. The cache will be deleted entirely when the server restarts. If None, no cache deletion will occur.
+            delete_cache: A tuple corresponding [frequency, age] both expressed in number of seconds, optionally followed by a maximum cache size in bytes, i.e. [frequency, age, max_bytes]. Every `frequency` seconds, the temporary files created by this Blocks instance will be deleted if more than `age` seconds have passed since the file was created or last served. If `max_bytes` is provided, the least recently served files will also be deleted until the cache takes up at most `max_bytes`. For example, setting this to (86400, 86400) will delete temporary files every day. The cache will be deleted entirely when the server restarts. If None, no cache deletion will occur.
         """
         self.limiter = None
         if theme is None:
@@ -1212,6 +1250,10 @@ class Blocks(BlockContext, BlocksEvents, metaclass=BlocksMeta):
         self.max_threads = 40
         self.pending_streams = defaultdict(dict)
         self.pending_diff_streams = defaultdict(dict)
+        # The frames of the Dataframes whose rows are loaded a page at a time
+        from gradio.components.dataframe import LazyFrameStore
+
+        self.lazy_frames = LazyFrameStore()
         self.show_error = True
         self.fill_height = fill_height
         self.fill_width = fill_width
@@ -1265,8 +1307,9 @@ class Blocks(BlockContext, BlocksEvents, metaclass=BlocksMeta):
         self.auth = None
         self.dev_mode = bool(os.getenv("GRADIO_WATCH_DIRS", ""))
         self.app_id = random.getrandbits(64)
-        self.upload_file_set = set()
+        self.upload_file_set = TempFileSet()
         self.temp_file_sets = [self.upload_file_set]
+        self.cache_index: CacheIndex | None = None
         self.title = title
         self.show_api_in_footer = not wasm_utils.IS_WASM
 
@@ -1612,6 +1655,7 @@ class Blocks(BlockContext, BlocksEvents, metaclass=BlocksMeta):
             root_context.fn_id = max(root_context.fns.keys(), default=-1) + 1
             Context.root_block.temp_file_sets.extend(self.temp_file_sets)
             Context.root_block.proxy_urls.update(self.proxy_urls)
+            Context.root_block.lazy_frames.merge(self.lazy_frames)
             Context.root_block.extra_startup_events.extend(self.extra_startup_events)
 
         render_context = get_render_context()
@@ -1863,41 +1907,68 @@ Received inputs:
 
         self.validate_inputs(block_fn, inputs)
 
-        processed_input = []
-        for i, block in enumerate(block_fn.inputs):
+        for block in block_fn.inputs:
             if not isinstance(block, components.Component):
                 raise InvalidComponentError(
                     f"{block.__class__} Component not a valid input component."
                 )
+
+        async def preprocess_input(block: Component, value: Any) -> Any:
             if block.stateful:
-                processed_input.append(state[block._id])
+                return state[block._id]
+            if block._id in state:
+                block = state[block._id]
+            inputs_cached = await processing_utils.async_move_files_to_cache(
+                value,
+                block,
+                check_in_upload_folder=not explicit_call,
+            )
+            if getattr(block, "data_model", None) and inputs_cached is not None:
+                data_model = cast(Union[GradioModel, GradioRootModel], block.data_model)
+                inputs_cached = data_model.model_validate(
+                    inputs_cached, context={"validate_meta": True}
+                )
+            if isinstance(inputs_cached, (GradioModel, GradioRootModel)):
+                inputs_serialized = inputs_cached.model_dump()
             else:
-                if block._id in state:
-                    block = state[block._id]
-                inputs_cached = await processing_utils.async_move_files_to_cache(
-                    inputs[i],
-                    block,
-                    check_in_upload_folder=not explicit_call,
+                inputs_serialized = inputs_cached
+            if block._id not in state:
+                state[block._id] = block
+            state._update_value_in_config(block._id, inputs_serialized)
+            if block_fn.preprocess:
+                return await self.run_processing(
+                    block_fn, block.preprocess, inputs_cached
                 )
-                if getattr(block, "data_model", None) and inputs_cached is not None:
-                    data_model = cast(
-                        Union[GradioModel, GradioRootModel], block.data_model
-                    )
-                    inputs_cached = data_model.model_validate(
-                        inputs_cached, context={"validate_meta": True}
-                    )
-                if isinstance(inputs_cached, (GradioModel, GradioRootModel)):
-                    inputs_serialized = inputs_cached.model_dump()
-                else:
-                    inputs_serialized = inputs_cached
-                if block._id not in state:
-                    state[block._id] = block
-                state._update_value_in_config(block._id, inputs_serialized)
-                if block_fn.preprocess:
-                    processed_input.append(block.preprocess(inputs_cached))
-                else:
-                    processed_input.append(inputs_serialized)
-        return processed_input
+            return inputs_serialized
+
+        return await self.gather_processing(
+            block_fn,
+            [
+                partial(preprocess_input, block, value)  # type: ignore
+                for block, value in zip(block_fn.inputs, inputs, strict=False)
+            ],
+        )
+
+    async def run_processing(
+        self, block_fn: BlockFunction, fn: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Runs a preprocess or postprocess function, in a worker thread if the event
+        processes its components in parallel."""
+        if block_fn.parallel_processing and not wasm_utils.IS_WASM:
+            return await anyio.to_thread.run_sync(fn, *args, limiter=self.limiter)
+        return fn(*args)
+
+    async def gather_processing(
+        self,
+        block_fn: BlockFunction,
+        fns: list[Callable[[], Coroutine[Any, Any, Any]]],
+    ) -> list[Any]:
+        """Runs the async functions that process each component (or each sample of a
+        batch) one after another, or concurrently if the event processes its components
+        in parallel. The results are returned in the order of `fns` either way."""
+        if block_fn.parallel_processing and len(fns) > 1:
+            return list(await asyncio.gather(*(fn() for fn in fns)))
+        return [await fn() for fn in fns]
 
     def validate_outputs(self, block_fn: BlockFunction, predictions: Any | list[Any]):
         dep_outputs = block_fn.outputs
@@ -1971,12 +2042,10 @@ Received inputs:
 
         self.validate_outputs(block_fn, predictions)  # type: ignore
 
-        output = []
-        for i, block in enumerate(block_fn.outputs):
+        async def postprocess_output(i: int, block: Block) -> Any:
             try:
                 if predictions[i] is components._Keywords.FINISHED_ITERATING:
-                    output.append(None)
-                    continue
+                    return None
             except (IndexError, KeyError) as err:
                 raise ValueError(
                     "Number of output components does not match number "
@@ -1986,70 +2055,72 @@ Received inputs:
             if block.stateful:
                 if not utils.is_prop_update(predictions[i]):
                     state[block._id] = predictions[i]
-                output.append(None)
-            else:
-                prediction_value = predictions[i]
-                if utils.is_prop_update(
-                    prediction_value
-                ):  # if update is passed directly (deprecated), remove Nones
-                    prediction_value = utils.delete_none(
-                        prediction_value, skip_value=True
-                    )
-
-                if isinstance(prediction_value, Block):
-                    prediction_value = prediction_value.constructor_args.copy()
-                    prediction_value["__type__"] = "update"
-                if utils.is_prop_update(prediction_value):
-                    kwargs = state[block._id].constructor_args.copy()
-                    kwargs.update(prediction_value)
-                    kwargs.pop("value", None)
-                    kwargs.pop("__type__")
-                    kwargs["render"] = False
-
-                    state[block._id] = block.__class__(**kwargs)
-                    state._update_config(block._id)
-                    prediction_value = postprocess_update_dict(
-                        block=state[block._id],
-                        update_dict=prediction_value,
-                        postprocess=block_fn.postprocess,
-                    )
-                    if "value" in prediction_value:
-                        state._update_value_in_config(
-                            block._id, prediction_value.get("value")
-                        )
-                elif block_fn.postprocess:
-                    if not isinstance(block, components.Component):
-                        raise InvalidComponentError(
-                            f"{block.__class__} Component not a valid output component."
-                        )
-                    if block._id in state:
-                        block = state[block._id]
-                    prediction_value = block.postprocess(prediction_value)
-                    if isinstance(prediction_value, (GradioModel, GradioRootModel)):
-                        prediction_value_serialized = prediction_value.model_dump()
-                    else:
-                        prediction_value_serialized = prediction_value
-                    prediction_value_serialized = (
-                        await processing_utils.async_move_files_to_cache(
-                            prediction_value_serialized,
-                            block,
-                            postprocess=True,
-                        )
-                    )
-                    if block._id not in state:
-                        state[block._id] = block
+                return None
+
+            prediction_value = predictions[i]
+            if utils.is_prop_update(
+                prediction_value
+            ):  # if update is passed directly (deprecated), remove Nones
+                prediction_value = utils.delete_none(prediction_value, skip_value=True)
+
+            if isinstance(prediction_value, Block):
+                prediction_value = prediction_value.constructor_args.copy()
+                prediction_value["__type__"] = "update"
+            if utils.is_prop_update(prediction_value):
+                kwargs = state[block._id].constructor_args.copy()
+                kwargs.update(prediction_value)
+                kwargs.pop("value", None)
+                kwargs.pop("__type__")
+                kwargs["render"] = False
+
+                state[block._id] = block.__class__(**kwargs)
+                state._update_config(block._id)
+                prediction_value = await self.run_processing(
+                    block_fn,
+                    postprocess_update_dict,
+                    state[block._id],
+                    prediction_value,
+                    block_fn.postprocess,
+                )
+                if "value" in prediction_value:
                     state._update_value_in_config(
-                        block._id, prediction_value_serialized
+                        block._id, prediction_value.get("value")
                     )
-
+            elif block_fn.postprocess:
+                if not isinstance(block, components.Component):
+                    raise InvalidComponentError(
+                        f"{block.__class__} Component not a valid output component."
+                    )
+                if block._id in state:
+                    block = state[block._id]
+                prediction_value = await self.run_processing(
+                    block_fn, block.postprocess, prediction_value
+                )
+                # The value is serialized and its files are moved to the cache once,
+                # and the result is used both in the session's config and the output
                 outputs_cached = await processing_utils.async_move_files_to_cache(
                     prediction_value,
                     block,
                     postprocess=True,
                 )
-                output.append(outputs_cached)
+                if block._id not in state:
+                    state[block._id] = block
+                state._update_value_in_config(block._id, outputs_cached)
+                return outputs_cached
 
-        return output
+            return await processing_utils.async_move_files_to_cache(
+                prediction_value,
+                block,
+                postprocess=True,
+            )
+
+        return await self.gather_processing(
+            block_fn,
+            [
+                partial(postprocess_output, i, block)
+                for i, block in enumerate(block_fn.outputs)
+            ],
+        )
 
     async def handle_streaming_outputs(
         self,
@@ -2073,8 +2144,6 @@ Received inputs:
                 and block.streaming
                 and not utils.is_prop_update(data[i])
             ):
-                if final:
-                    stream_run[output_id].end_stream()
                 first_chunk = output_id not in stream_run
                 binary_data, output_data = await block.stream_output(
                     data[i],
@@ -2082,15 +2151,25 @@ Received inputs:
                     first_chunk,
                 )
                 if first_chunk:
+                    # The stream replaces the ended streams of this output in the
+                    # previous runs of the session
+                    self.discard_streams(session_hash, output_id, ended_only=True)
                     desired_output_format = None
                     if orig_name := output_data.get("orig_name"):
                         desired_output_format = Path(orig_name).suffix[1:]
-                    stream_run[output_id] = MediaStream(
-                        desired_output_format=desired_output_format
+                    stream = MediaStream(
+                        desired_output_format=desired_output_format,
+                        cache_dir=block.GRADIO_CACHE,
                     )
-                    stream_run[output_id]
+                    if stream.path is not None:
+                        block.temp_files.add(stream.path)
+                    stream_run[output_id] = stream
 
                 await stream_run[output_id].add_segment(binary_data)
+                if final:
+                    # The stream is only ended once its last segment is added, so that the
+                    # file of the stream is not opened again for it
+                    stream_run[output_id].end_stream()
                 output_data = await processing_utils.async_move_files_to_cache(
                     output_data,
                     block,
@@ -2104,6 +2183,42 @@ Received inputs:
 
         return data
 
+    def discard_streams(
+        self,
+        session_hash: str,
+        component_id: int | None = None,
+        ended_only: bool = False,
+    ):
+        """
+        Closes and forgets the media streams of a session (or only those of one of its
+        outputs, or only those that have ended), so that their files and memory maps are
+        released once they can no longer be played.
+        """
+        runs = self.pending_streams.get(session_hash)
+        if not runs:
+            self.pending_streams.pop(session_hash, None)
+            return
+        if component_id is None and not ended_only:
+            # Runs that are still streaming keep a reference to their dict of streams,
+            # and find them closed
+            for stream_run in self.pending_streams.pop(session_hash).values():
+                for stream in stream_run.values():
+                    stream.close()
+            return
+        for run in list(runs):
+            stream_run = runs[run]
+            discarded = False
+            for output_id in list(stream_run):
+                stream = stream_run[output_id]
+                if (component_id is None or output_id == component_id) and (
+                    stream.ended or not ended_only
+                ):
+                    del stream_run[output_id]
+                    stream.close()
+                    discarded = True
+            if discarded and not stream_run:
+                del runs[run]
+
     def handle_streaming_diffs(
         self,
         block_fn: BlockFunction,
@@ -2183,6 +2298,7 @@ Received inputs:
         state_ids_to_track, hashed_values = self.get_state_ids_to_track(block_fn, state)
         changed_state_ids = []
         LocalContext.blocks.set(self)
+        LocalContext.session_hash.set(session_hash)
 
         if batch:
             max_batch_size = block_fn.max_batch_size
@@ -2200,10 +2316,15 @@ Received inputs:
                 raise ValueError(
                     f"Batch size ({batch_size}) exceeds the max_batch_size for this function ({max_batch_size})"
                 )
-            inputs = [
-                await self.preprocess_data(block_fn, list(i), state, explicit_call)
-                for i in zip(*inputs, strict=False)
-            ]
+            inputs = await self.gather_processing(
+                block_fn,
+                [
+                    partial(
+                        self.preprocess_data, block_fn, list(i), state, explicit_call
+                    )
+                    for i in zip(*inputs, strict=False)
+                ],
+            )
             result = await self.call_function(
                 block_fn,
                 list(zip(*inputs, strict=False)),
@@ -2215,10 +2336,13 @@ Received inputs:
                 state,
             )
             preds = result["prediction"]
-            data = [
-                await self.postprocess_data(block_fn, list(o), state)
-                for o in zip(*preds, strict=False)
-            ]
+            data = await self.gather_processing(
+                block_fn,
+                [
+                    partial(self.postprocess_data, block_fn, list(o), state)
+                    for o in zip(*preds, strict=False)
+                ],
+            )
             if root_path is not None:
                 data = processing_utils.add_root_url(data, root_path, None)  # type: ignore
             data = list(zip(*data, strict=False))
@@ -2249,7 +2373,10 @@ Received inputs:
                     for hash_value, state_id in zip(
                         hashed_values, state_ids_to_track, strict=False
                     )
-                    if hash_value != utils.deep_hash(state[state_id])
+                    if hash_value
+                    != self.hash_state_value(
+                        state.blocks_config.blocks[state_id], state[state_id]
+                    )
                 ]
 
             if root_path is not None:
@@ -2311,9 +2438,22 @@ Received inputs:
             ):
                 value = state[block._id]
                 state_ids_to_track.append(block._id)
-                hashed_values.append(utils.deep_hash(value))
+                hashed_values.append(self.hash_state_value(block, value))
         return state_ids_to_track, hashed_values
 
+    @staticmethod
+    def hash_state_value(block: Block, value: Any) -> Any:
+        """Returns what is compared before and after a function runs to detect whether
+        it changed the value of a gr.State. If the State detects changes by identity, this
+        is the value itself (which is compared with `is`), so it is never hashed, and if it
+        detects changes by version, this is the value and the version it reports."""
+        change_detection = getattr(block, "change_detection", "value")
+        if change_detection == "identity":
+            return _Identity(value)
+        if callable(change_detection):
+            return _Identity(value), change_detection(value)
+        return utils.deep_hash(value)
+
     def create_limiter(self):
         self.limiter = (
             None
@@ -2525,6 +2665,8 @@ Received inputs:
         root_path: str | None = None,
         app_kwargs: dict[str, Any] | None = None,
         state_session_capacity: int = 10000,
+        state_memory_budget: int | None = None,
+        state_backend: StateBackend | None = None,
         share_server_address: str | None = None,
         share_server_protocol: Literal["http", "https"] | None = None,
         share_server_tls_certificate: str | None = None,
@@ -2569,6 +2711,8 @@ Received inputs:
             root_path: The root path (or "mount point") of the application, if it's not served from the root ("/") of the domain. Often used when the application is behind a reverse proxy that forwards requests to the application. For example, if the application is served at "https://example.com/myapp", the `root_path` should be set to "/myapp". A full URL beginning with http:// or https:// can be provided, which will be used as the root path in its entirety. Can be set by environment variable GRADIO_ROOT_PATH. Defaults to "".
             app_kwargs: Additional keyword arguments to pass to the underlying FastAPI app as a dictionary of parameter keys and argument values. For example, `{"docs_url": "/docs"}`
             state_session_capacity: The maximum number of sessions whose information to store in memory. If the number of sessions exceeds this number, the oldest sessions will be removed. Reduce capacity to reduce memory usage when using gradio.State or returning updated components from functions. Defaults to 10000.
+            state_memory_budget: The maximum estimated size (in bytes) of the session information to store in memory. If the sessions exceed this size, the oldest sessions will be removed from memory. If None, only `state_session_capacity` limits the number of sessions stored in memory.
+            state_backend: A `gradio.state_holder.StateBackend` (e.g. `InMemoryStateBackend` or `SQLiteStateBackend`) that the `gradio.State` values of sessions removed from memory are spilled to, so they are restored when the session is used again instead of being lost. If None, the state of removed sessions is lost.
             share_server_address: Use this to specify a custom FRP server and port for sharing Gradio apps (only applies if share=True). If not provided, will use the default FRP server at https://gradio.live. See https://github.com/huggingface/frp for more information.
             share_server_protocol: Use this to specify the protocol to use for the share links. Defaults to "https", unless a custom share_server_address is provided, in which case it defaults to "http". If you are using a custom share_server_address and want to use https, you must set this to "https".
             share_server_tls_certificate: The path to a TLS certificate file to use when connecting to a custom share server. This parameter is not used with the default FRP server at https://gradio.live. Otherwise, you must provide a valid TLS certificate file (e.g. a "cert.pem") relative to the current working directory, or the connection will not use TLS encryption, which is insecure.
@@ -2639,6 +2783,8 @@ Received inputs:
         self.favicon_path = favicon_path
         self.ssl_verify = ssl_verify
         self.state_session_capacity = state_session_capacity
+        self.state_memory_budget = state_memory_budget
+        self.state_backend = state_backend
         if root_path is None:
             self.root_path = os.environ.get("GRADIO_ROOT_PATH", "")
         else:
@@ -44,6 +44,9 @@ INTERFACE_TEMPLATE = '''
         show_api: bool = True,
         key: int | str | tuple[int | str, ...] | None = None,
         api_description: str | None | Literal[False] = None,
+        coalesce_window: float | None = None,
+        coalesce_max_bytes: int = 65536,
+        parallel_processing: bool = False,
     {% for arg in event.event_specific_args %}
         {{ arg.name }}: {{ arg.type }},
     {% endfor %}
@@ -71,6 +74,9 @@ INTERFACE_TEMPLATE = '''
             show_api: whether to show this event in the "view API" page of the Gradio app, or in the ".view_api()" method of the Gradio clients. Unlike setting api_name to False, setting show_api to False will still allow downstream apps as well as the Clients to use this event. If fn is None, show_api will automatically be set to False.
             key: A unique key for this event listener to be used in @gr.render(). If set, this value identifies an event as identical across re-renders when the key is identical.
             api_description: Description of the API endpoint. Can be a string, None, or False. If set to a string, the endpoint will be exposed in the API docs with the given description. If None, the function's docstring will be used as the API endpoint description. If False, then no description will be displayed in the API docs.
+            coalesce_window: If set, intermediate outputs of a generator that are yielded within this many seconds of each other are merged into a single message to the browser, which reduces overhead when a generator yields many small updates (e.g. tokens from an LLM). Each intermediate output is delayed by at most this amount. If None, every yielded output is sent as its own message.
+            coalesce_max_bytes: The approximate maximum size (in bytes) of the updates merged into a single message when `coalesce_window` is set.
+            parallel_processing: If True, the preprocessing and postprocessing of the input and output components (and of each sample, if `batch=True`) run concurrently in worker threads instead of one after another. This speeds up events whose components do CPU-heavy processing, e.g. decoding a batch of images. The outputs are returned in the same order either way.
         {% for arg in event.event_specific_args %}
             {{ arg.name }}: {{ arg.doc }},
         {% endfor %}
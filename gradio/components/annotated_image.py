@@ -180,7 +180,6 @@ class AnnotatedImage(Component):
                 "AnnotatedImage only accepts filepaths, PIL images or numpy arrays for the base image."
             )
 
-        sections = []
         color_map = self.color_map or {}
 
         def hex_to_rgb(value):
@@ -188,7 +187,8 @@ class AnnotatedImage(Component):
             lv = len(value)
             return [int(value[i : i + lv // 3], 16) for i in range(0, lv, lv // 3)]
 
-        for mask, label in value[1]:
+        def _save_mask(annotation):
+            mask, label = annotation
             mask_array = np.zeros((base_img.shape[0], base_img.shape[1]))
             if isinstance(mask, np.ndarray):
                 mask_array = mask
@@ -221,9 +221,9 @@ class AnnotatedImage(Component):
                 colored_mask_img, cache_dir=self.GRADIO_CACHE, format="png"
             )
             mask_file_path = str(utils.abspath(mask_file))
-            sections.append(
-                Annotation(image=FileData(path=mask_file_path), label=label)
-            )
+            return Annotation(image=FileData(path=mask_file_path), label=label)
+
+        sections = processing_utils.map_in_image_encoder_pool(_save_mask, value[1])
 
         return AnnotatedImageData(
             image=FileData(path=base_img_path),
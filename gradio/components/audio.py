@@ -9,6 +9,7 @@ from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+import aiofiles
 import anyio
 import httpx
 import numpy as np
@@ -17,7 +18,7 @@ from gradio_client import utils as client_utils
 from gradio_client.documentation import document
 from pydub import AudioSegment
 
-from gradio import processing_utils, utils, wasm_utils
+from gradio import processing_utils, transcoding_utils, utils, wasm_utils
 from gradio.components.base import Component, StreamingInput, StreamingOutput
 from gradio.data_classes import FileData, FileDataDict, MediaStreamChunk
 from gradio.events import Events
@@ -252,9 +253,14 @@ class Audio(
         if self.format is not None and original_suffix != f".{self.format}":
             needs_conversion = True
 
+        audio = None
         if self.min_length is not None or self.max_length is not None:
-            sample_rate, data = processing_utils.audio_from_file(payload.path)
-            duration = len(data) / sample_rate
+            duration = processing_utils.get_audio_duration(payload.path)
+            if duration is None:
+                # The decoded audio is also returned or converted below, so that the file
+                # is only decoded once
+                audio = processing_utils.audio_from_file(payload.path)
+                duration = len(audio[1]) / audio[0]
             if self.min_length is not None and duration < self.min_length:
                 raise Error(
                     f"Audio is too short, and must be at least {self.min_length} seconds"
@@ -265,11 +271,15 @@ class Audio(
                 )
 
         if self.type == "numpy":
+            if audio is not None:
+                return audio
             return processing_utils.audio_from_file(payload.path)
         elif self.type == "filepath":
             if not needs_conversion:
                 return payload.path
-            sample_rate, data = processing_utils.audio_from_file(payload.path)
+            if audio is None:
+                audio = processing_utils.audio_from_file(payload.path)
+            sample_rate, data = audio
             output_file = str(Path(payload.path).with_suffix(f".{self.format}"))
             assert self.format is not None  # noqa: S101
             processing_utils.audio_to_file(
@@ -335,6 +345,8 @@ class Audio(
             raise wasm_utils.WasmUnsupportedError(
                 "Audio streaming is not supported in the Wasm mode."
             )
+        if transcoding_utils.pyav_installed():
+            return transcoding_utils.convert_audio_to_adts(data)
         segment = AudioSegment.from_file(io.BytesIO(data))
 
         buffer = io.BytesIO()
@@ -368,13 +380,12 @@ class Audio(
                 "extension": ".aac",
             }, output_file
         if client_utils.is_http_url_like(value["path"]):
-            response = httpx.get(value["path"])
+            response = await processing_utils.get_async_client().get(value["path"])
             binary_data = response.content
         else:
             output_file["orig_name"] = value["orig_name"]
-            file_path = value["path"]
-            with open(file_path, "rb") as f:
-                binary_data = f.read()
+            async with aiofiles.open(value["path"], "rb") as f:
+                binary_data = await f.read()
         value, duration = await self.covert_to_adts(binary_data)
         return {"data": value, "duration": duration, "extension": ".aac"}, output_file
 
@@ -393,8 +404,10 @@ class Audio(
         )
         if desired_output_format and desired_output_format != "mp3":
             new_path = Path(output_file.path).with_suffix(f".{desired_output_format}")
-            AudioSegment.from_file(output_file.path).export(
-                new_path, format=desired_output_format
+            await anyio.to_thread.run_sync(
+                lambda: AudioSegment.from_file(output_file.path).export(
+                    new_path, format=desired_output_format
+                )
             )
             output_file.path = str(new_path)
         return output_file
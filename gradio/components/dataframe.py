@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import re
+import secrets
+import threading
+import time
 import warnings
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from typing import (
     TYPE_CHECKING,
@@ -16,10 +21,13 @@ from typing import (
 import numpy as np
 import semantic_version
 from gradio_client.documentation import document
+from pydantic import model_serializer
 
-from gradio.components.base import Component
+from gradio.components.base import Component, server
+from gradio.context import Context, LocalContext
 from gradio.data_classes import GradioModel
 from gradio.events import Events
+from gradio.exceptions import Error
 from gradio.i18n import I18nData
 
 if TYPE_CHECKING:
@@ -47,6 +55,168 @@ class DataframeData(GradioModel):
     headers: list[Any]
     data: Union[list[list[Any]], list[tuple[Any, ...]]]
     metadata: Optional[dict[str, Optional[list[Any]]]] = None
+    # Only set if the rows are loaded a page at a time (see `page_size`): the id of the frame
+    # kept on the server, its number of rows (after filtering), the positions in the frame of
+    # the rows in `data`, and the cells edited by the user as [row position, column, value]
+    frame_id: Optional[str] = None
+    total_rows: Optional[int] = None
+    row_indices: Optional[list[int]] = None
+    edits: Optional[list[tuple[int, int, Any]]] = None
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_page_fields(self, handler):
+        # Tables that are sent at once are serialized as before
+        data = handler(self)
+        for field in ("frame_id", "total_rows", "row_indices", "edits"):
+            if data.get(field) is None:
+                data.pop(field, None)
+        return data
+
+
+class LazyFrame:
+    """A frame whose rows are loaded a page at a time, as kept by a LazyFrameStore."""
+
+    def __init__(
+        self,
+        session_hash: str | None,
+        component_id: int,
+        frame: pd.DataFrame,
+        headers: list[str],
+    ):
+        self.session_hash = session_hash
+        self.component_id = component_id
+        self.frame = frame
+        self.headers = headers
+        # The positions of the rows after the last sort and filter of the table (and the
+        # sort and filter as a key), so that paging through the sorted and filtered rows
+        # does not sort and filter them again
+        self.rows: tuple[str, np.ndarray] | None = None
+        self.nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        self.last_used = time.monotonic()
+
+
+class LazyFrameStore:
+    """
+    Keeps the frames of the Dataframes of a Blocks whose rows are loaded a page at a time
+    (see `page_size`), by session. A session only keeps the last frame that each Dataframe
+    sent to it, and can only load the rows of its own frames. Frames that have not been used
+    for `ttl` seconds are dropped, as are the least recently used frames once all frames
+    take more than `max_bytes`. Frames sent outside of a session (e.g. the initial value of
+    a Dataframe) are not dropped after `ttl` seconds, and only once no frames of sessions
+    are left to drop to stay within `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 2**30, ttl: float = 3600):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # The frames of sessions and the frames sent outside of a session, each from the
+        # least to the most recently used
+        self.frames: OrderedDict[str, LazyFrame] = OrderedDict()
+        self.unscoped_frames: OrderedDict[str, LazyFrame] = OrderedDict()
+        self.frame_ids: dict[tuple[str | None, int], str] = {}
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def add(
+        self,
+        session_hash: str | None,
+        component_id: int,
+        frame: pd.DataFrame,
+        headers: list[str],
+    ) -> str:
+        frame_id = secrets.token_urlsafe(16)
+        lazy_frame = LazyFrame(session_hash, component_id, frame, headers)
+        with self.lock:
+            previous_id = self.frame_ids.get((session_hash, component_id))
+            if previous_id is not None:
+                self._drop(previous_id)
+            self.frame_ids[(session_hash, component_id)] = frame_id
+            if session_hash is None:
+                self.unscoped_frames[frame_id] = lazy_frame
+            else:
+                self.frames[frame_id] = lazy_frame
+            self.size += lazy_frame.nbytes
+            self._evict(keep=frame_id)
+        return frame_id
+
+    def merge(self, other: LazyFrameStore):
+        """Moves the frames of another store into this one, e.g. those of a Blocks that is
+        rendered in another Blocks."""
+        if other is self:
+            return
+        with other.lock:
+            frames = [*other.unscoped_frames.items(), *other.frames.items()]
+            other.frames.clear()
+            other.unscoped_frames.clear()
+            other.frame_ids.clear()
+            other.size = 0
+        with self.lock:
+            for frame_id, lazy_frame in frames:
+                key = (lazy_frame.session_hash, lazy_frame.component_id)
+                if (previous_id := self.frame_ids.get(key)) is not None:
+                    self._drop(previous_id)
+                self.frame_ids[key] = frame_id
+                if lazy_frame.session_hash is None:
+                    self.unscoped_frames[frame_id] = lazy_frame
+                else:
+                    self.frames[frame_id] = lazy_frame
+                self.size += lazy_frame.nbytes
+                if lazy_frame.rows is not None:
+                    self.size += lazy_frame.rows[1].nbytes
+            self._evict()
+
+    def get(self, session_hash: str | None, frame_id: str) -> LazyFrame | None:
+        with self.lock:
+            self._evict()
+            if frame_id in self.unscoped_frames:
+                self.unscoped_frames.move_to_end(frame_id)
+                return self.unscoped_frames[frame_id]
+            lazy_frame = self.frames.get(frame_id)
+            if lazy_frame is None or lazy_frame.session_hash != session_hash:
+                return None
+            self.frames.move_to_end(frame_id)
+            lazy_frame.last_used = time.monotonic()
+            return lazy_frame
+
+    def set_rows(self, lazy_frame: LazyFrame, key: str, positions: np.ndarray):
+        with self.lock:
+            if lazy_frame.rows is not None:
+                self.size -= lazy_frame.rows[1].nbytes
+            self.size += positions.nbytes
+            lazy_frame.rows = (key, positions)
+
+    def _drop(self, frame_id: str):
+        lazy_frame = self.frames.pop(frame_id, None) or self.unscoped_frames.pop(
+            frame_id, None
+        )
+        if lazy_frame is None:
+            return
+        key = (lazy_frame.session_hash, lazy_frame.component_id)
+        if self.frame_ids.get(key) == frame_id:
+            del self.frame_ids[key]
+        self.size -= lazy_frame.nbytes
+        if lazy_frame.rows is not None:
+            self.size -= lazy_frame.rows[1].nbytes
+
+    def _evict(self, keep: str | None = None):
+        expired_before = time.monotonic() - self.ttl
+        while self.frames:
+            frame_id, lazy_frame = next(iter(self.frames.items()))
+            if frame_id == keep or (
+                lazy_frame.last_used > expired_before and self.size <= self.max_bytes
+            ):
+                break
+            self._drop(frame_id)
+        while self.unscoped_frames and self.size > self.max_bytes:
+            frame_id = next(iter(self.unscoped_frames))
+            if frame_id == keep:
+                break
+            self._drop(frame_id)
+
+
+# The store of the Dataframes that are created outside of a Blocks (e.g. before they are
+# passed to an Interface), which are looked up if a frame is not in the store of the Blocks
+_standalone_lazy_frames = LazyFrameStore()
 
 
 @document()
@@ -108,6 +278,7 @@ class Dataframe(Component):
         show_search: Literal["none", "search", "filter"] = "none",
         pinned_columns: int | None = None,
         static_columns: list[int] | None = None,
+        page_size: int | None = None,
     ):
         """
         Parameters:
@@ -143,10 +314,12 @@ class Dataframe(Component):
             show_search: Show a search input in the toolbar. If "search", a search input is shown. If "filter", a search input and filter buttons are shown. If "none", no search input is shown.
             pinned_columns: If provided, will pin the specified number of columns from the left.
             static_columns: List of column indices (int) that should not be editable. Only applies when interactive=True. When specified, col_count is automatically set to "fixed" and columns cannot be inserted or deleted.
+            page_size: If provided, values with more rows than this are kept on the server and only sent to the browser a page of `page_size` rows at a time. Sorting and filtering the table then run on the server, and only the edited cells are sent back. Not supported for Styler values. When specified, row_count and col_count are automatically set to "fixed".
         """
         self.wrap = wrap
         self.row_count = self.__process_counts(row_count)
         self.static_columns = static_columns or []
+        self.page_size = page_size
 
         self.col_count = self.__process_counts(
             col_count, len(headers) if headers else 3
@@ -154,6 +327,9 @@ class Dataframe(Component):
 
         if self.static_columns and isinstance(self.col_count, tuple):
             self.col_count = (self.col_count[0], "fixed")
+        if self.page_size is not None:
+            self.row_count = (self.row_count[0], "fixed")
+            self.col_count = (self.col_count[0], "fixed")
 
         self.__validate_headers(headers, self.col_count[0])
 
@@ -243,6 +419,16 @@ class Dataframe(Component):
         """
         import pandas as pd
 
+        if payload.frame_id is not None:
+            _, lazy_frame = self._get_lazy_frame(payload.frame_id)
+            if lazy_frame is None:
+                # Passing only the displayed rows (without the edits to the other rows)
+                # would silently lose data
+                raise Error(
+                    "The rows of the Dataframe are no longer stored on the server. Please reload the page."
+                )
+            return self._preprocess_lazy_frame(lazy_frame.frame, payload)
+
         if self.type == "pandas":
             if payload.headers is not None:
                 return pd.DataFrame(
@@ -270,6 +456,166 @@ class Dataframe(Component):
                 + ". Please choose from: 'pandas', 'numpy', 'array', 'polars'."
             )
 
+    def _preprocess_lazy_frame(
+        self, frame: pd.DataFrame, payload: DataframeData
+    ) -> pd.DataFrame | np.ndarray | pl.DataFrame | list[list]:
+        """
+        Applies the cells edited by the user to a copy of a frame whose rows were loaded a
+        page at a time, and converts it to the type of the component.
+        """
+        frame = frame.copy()
+        for row, col, value in payload.edits or []:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", FutureWarning)
+                    frame.iat[row, col] = value
+            except (FutureWarning, TypeError, ValueError):
+                # e.g. a string edited into a numeric column
+                frame.isetitem(col, frame.iloc[:, col].astype(object))
+                frame.iat[row, col] = value
+        if payload.headers is not None and len(payload.headers) == frame.shape[1]:
+            frame = frame.set_axis(payload.headers, axis=1)
+        if self.type == "pandas":
+            return frame
+        if self.type == "numpy":
+            return frame.to_numpy()
+        if self.type == "polars":
+            return _import_polars().DataFrame(frame.to_dict(orient="list"))
+        return self.get_cell_data(frame)
+
+    @property
+    def lazy_frames(self) -> LazyFrameStore:
+        """The store of the frames of the Blocks that is running or being created."""
+        blocks = LocalContext.blocks.get() or Context.root_block
+        return _standalone_lazy_frames if blocks is None else blocks.lazy_frames
+
+    def _get_lazy_frame(self, frame_id: str) -> tuple[LazyFrameStore, LazyFrame | None]:
+        """Returns a frame of the session and the store that it is kept in."""
+        session_hash = LocalContext.session_hash.get()
+        store = self.lazy_frames
+        lazy_frame = store.get(session_hash, frame_id)
+        if lazy_frame is None and store is not _standalone_lazy_frames:
+            store = _standalone_lazy_frames
+            lazy_frame = store.get(session_hash, frame_id)
+        return store, lazy_frame
+
+    @server
+    def get_rows(self, body: dict) -> dict:
+        """
+        Returns a page of rows of a frame whose rows are loaded a page at a time (see
+        `page_size`), after sorting and filtering the whole frame.
+        Parameters:
+            body: a dict with the `frame_id`, the `start` and `end` of the page (as positions in
+                the sorted and filtered rows), and optionally the `sort_columns` and
+                `filter_columns` of the table.
+        Returns:
+            the page of rows, as a `DataframeData` dict.
+        """
+        store, lazy_frame = self._get_lazy_frame(body["frame_id"])
+        if lazy_frame is None:
+            raise Error(
+                "The rows of the Dataframe are no longer stored on the server. Please reload the page."
+            )
+        frame, headers = lazy_frame.frame, lazy_frame.headers
+        filter_columns = body.get("filter_columns") or []
+        sort_columns = body.get("sort_columns") or []
+        key = json.dumps([filter_columns, sort_columns])
+        if lazy_frame.rows is not None and lazy_frame.rows[0] == key:
+            positions = lazy_frame.rows[1]
+        else:
+            positions = self._filter_rows(frame, filter_columns)
+            positions = self._sort_rows(frame, positions, sort_columns)
+            store.set_rows(lazy_frame, key, positions)
+        page_positions = positions[body["start"] : body["end"]]
+        return DataframeData(
+            headers=headers,
+            data=self.get_cell_data(frame.iloc[page_positions]),
+            frame_id=body["frame_id"],
+            total_rows=len(positions),
+            row_indices=page_positions.tolist(),
+        ).model_dump()
+
+    @staticmethod
+    def _filter_rows(frame: pd.DataFrame, filter_columns: list[dict]) -> np.ndarray:
+        """
+        Returns the positions of the rows that pass the filters of the table, which have the
+        same semantics as the filters applied in the browser.
+        """
+        import pandas as pd
+
+        mask = np.ones(len(frame), dtype=bool)
+        for column in filter_columns:
+            series = frame.iloc[:, column["col"]]
+            value, op = column["value"], column["filter"]
+            if column["datatype"] == "number" and op != "Is empty":
+                numbers = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+                if op == "Is not empty":
+                    mask &= ~np.isnan(numbers)
+                    continue
+                try:
+                    target = float(value)
+                except ValueError:
+                    mask[:] = False
+                    continue
+                compare = {
+                    "=": np.equal,
+                    "≠": np.not_equal,
+                    ">": np.greater,
+                    "<": np.less,
+                    "≥": np.greater_equal,
+                    "≤": np.less_equal,
+                }.get(op)
+                if compare is not None:
+                    mask &= ~np.isnan(numbers) & compare(numbers, target)
+                continue
+            text = series.astype(str).where(series.notna(), "")
+            if op == "Is empty":
+                mask &= (text == "").to_numpy()
+            elif op == "Contains":
+                mask &= text.str.contains(value, regex=False).to_numpy()
+            elif op == "Does not contain":
+                mask &= ~text.str.contains(value, regex=False).to_numpy()
+            elif op == "Starts with":
+                mask &= text.str.startswith(value).to_numpy()
+            elif op == "Ends with":
+                mask &= text.str.endswith(value).to_numpy()
+            elif op == "Is":
+                mask &= (text == value).to_numpy()
+            elif op == "Is not":
+                mask &= (text != value).to_numpy()
+            elif op == "Is not empty":
+                mask &= (text != "").to_numpy()
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def _sort_rows(
+        frame: pd.DataFrame, positions: np.ndarray, sort_columns: list[dict]
+    ) -> np.ndarray:
+        """Sorts the positions of the rows by the sort columns of the table (stable)."""
+        import pandas as pd
+
+        if not sort_columns or len(positions) == 0:
+            return positions
+        keys = pd.DataFrame(
+            {
+                i: frame.iloc[positions, column["col"]].to_numpy()
+                for i, column in enumerate(sort_columns)
+            }
+        )
+        ascending = [column["direction"] == "asc" for column in sort_columns]
+        try:
+            order = keys.sort_values(
+                list(keys.columns), ascending=ascending, kind="stable"
+            ).index
+        except TypeError:
+            # e.g. a column of mixed strings and numbers
+            order = (
+                keys.astype(str)
+                .sort_values(list(keys.columns), ascending=ascending, kind="stable")
+                .index
+            )
+        return positions[order.to_numpy()]
+
     @staticmethod
     def is_empty(
         value: pd.DataFrame
@@ -452,6 +798,14 @@ class Dataframe(Component):
             )
 
         headers = self.get_headers(value) or self.headers
+        if self.page_size is not None and not isinstance(value, (Styler, dict)):
+            frame = None if self.is_empty(value) else self._to_frame(value)
+            if frame is not None and len(frame) > self.page_size:
+                if frame is value:
+                    # The frame is kept to serve its other pages later, so it must not
+                    # change if the DataFrame that was returned is changed afterwards
+                    frame = frame.copy()
+                return self._postprocess_lazy_frame(frame, headers)
         data = [] if self.is_empty(value) else self.get_cell_data(value)
         if len(data) == 0:
             return DataframeData(headers=headers, data=[], metadata=None)
@@ -469,6 +823,48 @@ class Dataframe(Component):
             metadata=metadata,  # type: ignore
         )
 
+    def _postprocess_lazy_frame(
+        self, frame: pd.DataFrame, headers: list[str]
+    ) -> DataframeData:
+        """
+        Keeps the frame on the server and returns its first page of rows, so that the other
+        pages are only loaded through `get_rows` when they are displayed.
+        """
+        page = frame.iloc[: self.page_size]
+        data = self.get_cell_data(page)
+        if len(headers) > frame.shape[1]:
+            headers = headers[: frame.shape[1]]
+        elif len(headers) < frame.shape[1]:
+            headers = [
+                *headers,
+                *[str(i) for i in range(len(headers) + 1, frame.shape[1] + 1)],
+            ]
+        frame_id = self.lazy_frames.add(
+            LocalContext.session_hash.get(), self._id, frame, headers
+        )
+        return DataframeData(
+            headers=headers,
+            data=data,
+            frame_id=frame_id,
+            total_rows=len(frame),
+            row_indices=list(range(len(page))),
+        )
+
+    @staticmethod
+    def _to_frame(
+        value: pd.DataFrame | np.ndarray | pl.DataFrame | list | str,
+    ) -> pd.DataFrame:
+        """Converts a value to a pandas DataFrame, without copying pandas DataFrames."""
+        import pandas as pd
+
+        if isinstance(value, pd.DataFrame):
+            return value
+        if isinstance(value, str):
+            return pd.read_csv(value)
+        if _is_polars_available() and isinstance(value, _import_polars().DataFrame):
+            return pd.DataFrame(value.to_dict(as_series=False))
+        return pd.DataFrame(Dataframe.get_cell_data(value))
+
     def set_auto_datatype(self, value):
         """
         Automatically sets the datatype of each column based on the data provided. If the datatype can't be inferred, it defaults to "str".
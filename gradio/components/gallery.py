@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -20,8 +19,9 @@ from gradio_client import handle_file
 from gradio_client import utils as client_utils
 from gradio_client.documentation import document
 from gradio_client.utils import is_http_url_like
+from pydantic import model_serializer
 
-from gradio import image_utils, processing_utils, utils, wasm_utils
+from gradio import image_utils, processing_utils, utils
 from gradio.components.base import Component
 from gradio.data_classes import FileData, GradioModel, GradioRootModel, ImageData
 from gradio.events import EventListener, Events
@@ -38,6 +38,16 @@ CaptionedGalleryMediaType = tuple[GalleryMediaType, str]
 class GalleryImage(GradioModel):
     image: ImageData
     caption: Optional[str] = None
+    # Only set if the gallery has a `thumbnail_size`: the smaller image shown in the grid
+    thumbnail: Optional[ImageData] = None
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_thumbnail(self, handler):
+        # Galleries without thumbnails are serialized as before
+        data = handler(self)
+        if data.get("thumbnail") is None:
+            data.pop("thumbnail", None)
+        return data
 
 
 class GalleryVideo(GradioModel):
@@ -111,6 +121,7 @@ class Gallery(Component):
         interactive: bool | None = None,
         type: Literal["numpy", "pil", "filepath"] = "filepath",
         show_fullscreen_button: bool = True,
+        thumbnail_size: int | None = None,
     ):
         """
         Parameters:
@@ -142,6 +153,7 @@ class Gallery(Component):
             interactive: If True, the gallery will be interactive, allowing the user to upload images. If False, the gallery will be static. Default is True.
             type: The format the image is converted to before being passed into the prediction function. "numpy" converts the image to a numpy array with shape (height, width, 3) and values from 0 to 255, "pil" converts the image to a PIL image object, "filepath" passes a str path to a temporary file containing the image. If the image is SVG, the `type` is ignored and the filepath of the SVG is returned.
             show_fullscreen_button: If True, will show a fullscreen icon in the corner of the component that allows user to view the gallery in fullscreen mode. If False, icon does not appear. If set to None (default behavior), then the icon appears if this Gradio app is launched on Spaces, but not otherwise.
+            thumbnail_size: If provided, the grid of the gallery shows thumbnails of the images whose longest side is at most this many pixels, and the full resolution images are only loaded in the preview. Images returned as numpy arrays or PIL Images are then only encoded at full resolution when they are first requested. If None, the full resolution images are shown in the grid.
         """
         self.format = format
         self.columns = columns
@@ -159,6 +171,7 @@ class Gallery(Component):
         self.type = type
         self.show_fullscreen_button = show_fullscreen_button
         self.file_types = file_types
+        self.thumbnail_size = thumbnail_size
 
         self.show_share_button = (
             (utils.get_space() is not None)
@@ -237,16 +250,29 @@ class Gallery(Component):
             raise ValueError(
                 "The `value` passed into `gr.Gallery` must be a list of images or videos, or list of (media, caption) tuples."
             )
-        output = []
+        defer = processing_utils.can_defer_image_encoding()
 
         def _save(img):
             url = None
             caption = None
             orig_name = None
             mime_type = None
+            thumbnail_path = None
             if isinstance(img, (tuple, list)):
                 img, caption = img
-            if isinstance(img, np.ndarray):
+            if (
+                self.thumbnail_size is not None
+                and isinstance(img, (np.ndarray, PIL.Image.Image))
+                and not getattr(img, "is_animated", False)
+            ):
+                file_path, thumbnail_path = processing_utils.save_img_with_thumbnail(
+                    img,
+                    cache_dir=self.GRADIO_CACHE,
+                    thumbnail_size=self.thumbnail_size,
+                    format=self.format,
+                    defer=defer,
+                )
+            elif isinstance(img, np.ndarray):
                 file = processing_utils.save_img_array_to_cache(
                     img, cache_dir=self.GRADIO_CACHE, format=self.format
                 )
@@ -277,6 +303,20 @@ class Gallery(Component):
                 mime_type = client_utils.get_mimetype(file_path)
             else:
                 raise ValueError(f"Cannot process type as image: {type(img)}")
+            if (
+                self.thumbnail_size is not None
+                and mime_type is not None
+                and mime_type.startswith("image/")
+                and mime_type != "image/svg+xml"
+                and file_path is not None
+                and not is_http_url_like(file_path)
+            ):
+                thumbnail_path = processing_utils.save_file_thumbnail(
+                    file_path,
+                    cache_dir=self.GRADIO_CACHE,
+                    thumbnail_size=self.thumbnail_size,
+                    format=self.format,
+                )
             if mime_type is not None and "video" in mime_type:
                 return GalleryVideo(
                     video=FileData(
@@ -296,17 +336,21 @@ class Gallery(Component):
                         mime_type=mime_type,
                     ),
                     caption=caption,
+                    thumbnail=(
+                        ImageData(path=thumbnail_path)
+                        if thumbnail_path is not None and thumbnail_path != file_path
+                        else None
+                    ),
                 )
 
-        if wasm_utils.IS_WASM:
-            for img in value:
-                output.append(_save(img))
-        else:
-            with ThreadPoolExecutor() as executor:
-                for o in executor.map(_save, value):
-                    output.append(o)
+        output = processing_utils.map_in_image_encoder_pool(_save, value)
         return GalleryData(root=output)
 
+    def flag(self, payload: Any, flag_dir: str | Path = "") -> str:
+        # The full resolution images may not have been encoded yet
+        processing_utils.encode_deferred_images(payload)
+        return super().flag(payload, flag_dir)
+
     @staticmethod
     def convert_to_type(img: str, type: Literal["filepath", "numpy", "pil"]):
         if type == "filepath":
@@ -22,7 +22,7 @@ from gradio_client import handle_file
 from gradio_client.documentation import document
 from typing_extensions import TypedDict
 
-from gradio import image_utils, utils
+from gradio import image_utils, processing_utils, utils
 from gradio.components.base import Component, server
 from gradio.data_classes import FileData, GradioModel
 from gradio.events import Events
@@ -444,45 +444,23 @@ class ImageEditor(Component):
                 "The value to `gr.ImageEditor` must be a dictionary of images or a single image."
             )
 
-        layers = (
-            [
-                FileData(
-                    path=image_utils.save_image(
-                        cast(Union[np.ndarray, PIL.Image.Image, str], layer),
-                        self.GRADIO_CACHE,
-                        format=self.format,
-                    )
+        def _save(image: np.ndarray | PIL.Image.Image | str | None) -> FileData | None:
+            if image is None:
+                return None
+            return FileData(
+                path=image_utils.save_image(
+                    image, self.GRADIO_CACHE, format=self.format
                 )
-                for layer in value["layers"]
-            ]
-            if value["layers"]
-            else []
-        )
+            )
 
+        # The background, composite and layers are encoded in the shared image encoder pool
+        background, composite, *layers = processing_utils.map_in_image_encoder_pool(
+            _save, [value["background"], value["composite"], *(value["layers"] or [])]
+        )
         return EditorData(
-            background=(
-                FileData(
-                    path=image_utils.save_image(
-                        value["background"], self.GRADIO_CACHE, format=self.format
-                    )
-                )
-                if value["background"] is not None
-                else None
-            ),
-            layers=layers,
-            composite=(
-                FileData(
-                    path=image_utils.save_image(
-                        cast(
-                            Union[np.ndarray, PIL.Image.Image, str], value["composite"]
-                        ),
-                        self.GRADIO_CACHE,
-                        format=self.format,
-                    )
-                )
-                if value["composite"] is not None
-                else None
-            ),
+            background=background,
+            layers=[cast(FileData, layer) for layer in layers],
+            composite=composite,
         )
 
     def example_payload(self) -> Any:
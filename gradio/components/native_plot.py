@@ -3,18 +3,23 @@ from __future__ import annotations
 import json
 import warnings
 from collections.abc import Callable, Sequence, Set
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    cast,
 )
 
+import numpy as np
 from gradio_client.documentation import document
+from pydantic import field_serializer
 
 from gradio.components.base import Component
 from gradio.data_classes import GradioModel
 from gradio.events import Events
 from gradio.i18n import I18nData
+from gradio.utils import ndarray_to_list
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -22,11 +27,24 @@ if TYPE_CHECKING:
     from gradio.components import Timer
 
 
+# The units of the `x_bin` durations of temporal x columns, in seconds
+SUFFIX_DURATION = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+
 class PlotData(GradioModel):
     columns: list[str]
-    data: list[list[Any]]
+    # A list of rows, or a 2D numpy array of rows if every column is numeric or temporal, which
+    # is serialized by orjson without being converted to Python objects first
+    data: Any
     datatypes: dict[str, Literal["quantitative", "nominal", "temporal"]]
     mark: str
+    # Whether the y values were already aggregated per x bin (and color) on the server
+    aggregated: bool = False
+
+    @field_serializer("data", when_used="json")
+    def _rows_as_lists(self, data: Any):
+        # Serializers other than orjson (e.g. `model_dump_json`) cannot write numpy arrays
+        return ndarray_to_list(data) if isinstance(data, np.ndarray) else data
 
 
 class NativePlot(Component):
@@ -74,6 +92,7 @@ class NativePlot(Component):
         elem_classes: list[str] | str | None = None,
         render: bool = True,
         show_fullscreen_button: bool = False,
+        max_points: int | None = None,
         key: int | str | tuple[int | str, ...] | None = None,
         preserved_by_key: list[str] | str | None = "value",
         **kwargs,
@@ -113,6 +132,7 @@ class NativePlot(Component):
             elem_classes: An optional list of strings that are assigned as the classes of this component in the HTML DOM. Can be used for targeting CSS styles.
             render: If False, component will not render be rendered in the Blocks context. Should be used if the intention is to assign event listeners now but render the component later.
             show_fullscreen_button: If True, will show a button to make plot visible in fullscreen mode.
+            max_points: If set, DataFrames with more rows than this are reduced on the server before they are sent to the browser. If `x_bin` is set (or x is a string/category column in a bar or line plot), the y values are aggregated per bin with `y_aggregate`. Otherwise line plots keep the rows with the minimum and maximum y value in each of `max_points / 2` buckets of the x axis, and other plots keep every n-th row. If `x_lim` is also set, only the rows within `x_lim` are sent, so to zoom into the data at full resolution, return the DataFrame along with the new `x_lim`, e.g. `gr.LinePlot(df, x_lim=selection.index)`. Columns other than x, y and color are dropped when the y values are aggregated.
             key: in a gr.render, Components with the same key across re-renders are treated as the same component, not a new component. Properties set in 'preserved_by_key' are not reset across a re-render.
             preserved_by_key: A list of parameters from this component's constructor. Inside a gr.render() function, if a component is re-rendered with the same key, these (and only these) parameters will be preserved in the UI (if they have been changed by the user or an event listener) instead of re-rendered based on the values provided during constructor.
         """
@@ -136,6 +156,7 @@ class NativePlot(Component):
         self.tooltip = tooltip
         self.height = height
         self.show_fullscreen_button = show_fullscreen_button
+        self.max_points = max_points
 
         if label is None and show_label is None:
             show_label = False
@@ -212,16 +233,181 @@ class NativePlot(Component):
             else:
                 raise ValueError(f"Unsupported data type: {dtype}")
 
-        split_json = json.loads(value.to_json(orient="split", date_unit="ms"))
         datatypes = {
             col: get_simplified_type(value[col].dtype) for col in value.columns
         }
+        aggregated = False
+        if self.max_points is not None:
+            value, aggregated = self._reduce(value, datatypes)
+            datatypes = {col: datatypes[col] for col in value.columns}
+        data = self._numeric_rows(value)
+        if data is None:
+            split_json = json.loads(value.to_json(orient="split", date_unit="ms"))
+            columns, data = split_json["columns"], split_json["data"]
+        else:
+            columns = [str(col) for col in value.columns]
         return PlotData(
-            columns=split_json["columns"],
-            data=split_json["data"],
+            columns=columns,
+            data=data,
             datatypes=datatypes,
             mark=self.get_mark(),
+            aggregated=aggregated,
+        )
+
+    def _reduce(
+        self, value: pd.DataFrame, datatypes: dict[str, str]
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Reduces the DataFrame to at most `max_points` rows (see the `max_points` parameter),
+        mirroring how the plot bins, aggregates and downsamples the data in the browser.
+        Returns the reduced DataFrame and whether its y values were aggregated.
+        """
+        if self.x not in value.columns or self.y not in value.columns:
+            return value, False
+        x_type = datatypes[self.x]
+        x_values = None if x_type == "nominal" else self._x_values(value[self.x])
+        if self.x_lim is not None and x_values is not None:
+            scale = 1000 if x_type == "temporal" else 1
+            in_window = (x_values >= self.x_lim[0] * scale) & (
+                x_values <= self.x_lim[1] * scale
+            )
+            value, x_values = value[in_window], x_values[in_window]
+        if len(value) <= cast(int, self.max_points):
+            return value, False
+
+        mark = self.get_mark()
+        if self.x_bin is not None or (mark != "point" and x_type == "nominal"):
+            return self._aggregate(value, x_type, x_values), True
+        if mark == "line" and x_values is not None:
+            return self._min_max_decimate(value, x_values), False
+        step = -(-len(value) // cast(int, self.max_points))
+        return value.iloc[::step], False
+
+    @staticmethod
+    def _x_values(series: pd.Series) -> np.ndarray:
+        """The x values as floats, with datetimes as milliseconds since the epoch."""
+        import pandas as pd
+
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if isinstance(series.dtype, pd.DatetimeTZDtype):
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            values = series.to_numpy().astype("datetime64[ms]")
+            return np.where(
+                np.isnat(values), np.nan, values.astype(np.int64).astype(np.float64)
+            )
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def _aggregate(
+        self, value: pd.DataFrame, x_type: str, x_values: np.ndarray | None
+    ) -> pd.DataFrame:
+        import pandas as pd
+
+        x = value[self.x]
+        if self.x_bin is not None and x_values is not None:
+            step = (
+                float(self.x_bin[:-1]) * SUFFIX_DURATION[self.x_bin[-1]] * 1000
+                if isinstance(self.x_bin, str)
+                else float(self.x_bin)
+            )
+            bins = np.floor(x_values / step) * step
+            x = (
+                pd.Series(pd.to_datetime(bins, unit="ms"), index=value.index)
+                if x_type == "temporal"
+                else pd.Series(bins, index=value.index)
+            )
+        keys = [x.rename(self.x)]
+        if self.color is not None and self.color in value.columns:
+            keys.append(value[self.color])
+        return (
+            value[self.y]
+            .groupby(keys, sort=False, observed=True, dropna=True)
+            .agg(self.y_aggregate or "sum")
+            .reset_index()
+        )
+
+    def _min_max_decimate(
+        self, value: pd.DataFrame, x_values: np.ndarray
+    ) -> pd.DataFrame:
+        import pandas as pd
+
+        y_values = value[self.y].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~(np.isnan(x_values) | np.isnan(y_values))
+        value, x_values, y_values = value[valid], x_values[valid], y_values[valid]
+        if len(value) == 0:
+            return value
+        if self.color is not None and self.color in value.columns:
+            colors = pd.factorize(value[self.color], use_na_sentinel=False)[0]
+        else:
+            colors = np.zeros(len(value), dtype=np.int64)
+        num_colors = int(colors.max()) + 1
+        num_buckets = max(1, cast(int, self.max_points) // (2 * num_colors))
+        x_start, x_end = x_values.min(), x_values.max()
+        if x_end > x_start:
+            buckets = ((x_values - x_start) / (x_end - x_start) * num_buckets).astype(
+                np.int64
+            )
+            np.minimum(buckets, num_buckets - 1, out=buckets)
+        else:
+            buckets = np.zeros(len(value), dtype=np.int64)
+        # The positions of the rows with the minimum and maximum y value of each bucket (per
+        # color), in their original order
+        grouped = pd.Series(y_values).groupby(
+            colors * num_buckets + buckets, sort=False
+        )
+        rows = np.concatenate(
+            [grouped.idxmin().to_numpy(), grouped.idxmax().to_numpy()]
         )
+        return value.iloc[np.unique(rows)]
+
+    @staticmethod
+    def _numeric_rows(value: pd.DataFrame) -> np.ndarray | None:
+        """
+        Returns the rows of the DataFrame as a C-contiguous 2D numpy array if every column is
+        numeric or temporal (with datetimes as milliseconds since the epoch, like `to_json`),
+        so that the rows are serialized straight from the buffer. Returns None otherwise, e.g.
+        if a column holds strings, booleans, nullable integers or missing datetimes, or if
+        integer columns are mixed with float columns (which would turn the integers into
+        floats), in which case the rows have to be serialized as JSON values.
+        """
+        import pandas as pd
+
+        if len(value.columns) == 0 or not value.columns.is_unique:
+            return None
+        columns = []
+        for col in value.columns:
+            series = value[col]
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                if series.isna().any():
+                    return None
+                if isinstance(series.dtype, pd.DatetimeTZDtype):
+                    series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+                columns.append(
+                    series.to_numpy().astype("datetime64[ms]").astype(np.int64)
+                )
+            elif isinstance(series.dtype, np.dtype) and (
+                series.dtype.kind in "if"
+                or (series.dtype.kind == "u" and series.dtype.itemsize < 8)
+            ):
+                columns.append(series.to_numpy())
+            else:
+                return None
+        integer = [np.issubdtype(col.dtype, np.integer) for col in columns]
+        if all(integer):
+            dtype = np.int64
+        elif not any(integer):
+            dtype = np.float64
+        else:
+            return None
+        return np.ascontiguousarray(np.column_stack(columns), dtype=dtype)
+
+    def flag(self, payload: Any, flag_dir: str | Path = "") -> str:
+        # Flagged values are written with `json.dumps`, so rows kept as a numpy array are
+        # converted to lists first
+        if isinstance(payload, PlotData):
+            payload = payload.model_dump()
+        if isinstance(payload, dict) and isinstance(payload.get("data"), np.ndarray):
+            payload = {**payload, "data": ndarray_to_list(payload["data"])}
+        return super().flag(payload, flag_dir)
 
     def example_payload(self) -> Any:
         return None
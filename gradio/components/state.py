@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 from collections.abc import Callable
 from copy import deepcopy
-from typing import Any
+from typing import Any, Literal
 
 from gradio_client.documentation import document
 
@@ -32,6 +32,7 @@ class State(Component):
         *,
         time_to_live: int | float | None = None,
         delete_callback: Callable[[Any], None] | None = None,
+        change_detection: Literal["value", "identity"] | Callable[[Any], Any] = "value",
     ):
         """
         Parameters:
@@ -39,11 +40,13 @@ class State(Component):
             render: should always be True, is included for consistency with other components.
             time_to_live: the number of seconds the state should be stored for after it is created or updated. If None, the state will be stored indefinitely. Gradio automatically deletes state variables after a user closes the browser tab or refreshes the page, so this is useful for clearing state for potentially long running sessions.
             delete_callback: a function that is called when the state is deleted. The function should take the state value as an argument.
+            change_detection: how to detect whether a function changed the state, which triggers the `.change()` event. If "value", the value is hashed before and after the function runs, so changes made in place (e.g. appending to a list) are detected. If "identity", the state only changes when a function returns a different object, so a large value is never hashed. If a function, it is called with the value and should return its version (e.g. a counter that the value increments whenever it is changed), and the state changes when a function returns a different object or the version of the value changes. Only used if the state has a `.change()` listener.
         """
         self.time_to_live = self.time_to_live = (
             math.inf if time_to_live is None else time_to_live
         )
         self.delete_callback = delete_callback or (lambda a: None)  # noqa: ARG005
+        self.change_detection = change_detection
         try:
             value = deepcopy(value)
         except TypeError as err:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 import subprocess
 import tempfile
@@ -11,12 +10,13 @@ from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
+import aiofiles
 from gradio_client import handle_file
 from gradio_client import utils as client_utils
 from gradio_client.documentation import document
 
 import gradio as gr
-from gradio import processing_utils, utils, wasm_utils
+from gradio import processing_utils, transcoding_utils, utils, wasm_utils
 from gradio.components.base import Component, StreamingOutput
 from gradio.components.image_editor import WebcamOptions
 from gradio.data_classes import FileData, GradioModel, MediaStreamChunk
@@ -181,6 +181,7 @@ class Video(StreamingOutput, Component):
         self.max_length = max_length
         self.streaming = streaming
         self.watermark = watermark
+        self._stream_transcoders = transcoding_utils.TranscoderCache()
         super().__init__(
             label=label,
             every=every,
@@ -449,21 +450,42 @@ class Video(StreamingOutput, Component):
             )
 
         result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_format",
-                "-show_streams",
-                filename,
-            ],
+            Video._ffprobe_command(filename),
             capture_output=True,
             check=True,
         )
+        return Video._duration_from_ffprobe_output(result.stdout)
 
-        data = json.loads(result.stdout)
+    @staticmethod
+    async def async_get_video_duration_ffprobe(filename: str) -> float | None:
+        """Async version of get_video_duration_ffprobe() that does not block the event loop
+        while ffprobe runs."""
+        if wasm_utils.IS_WASM:
+            raise wasm_utils.WasmUnsupportedError(
+                "ffprobe is not supported in the Wasm mode."
+            )
+
+        stdout, _ = await processing_utils.async_run_media_subprocess(
+            Video._ffprobe_command(filename)
+        )
+        return Video._duration_from_ffprobe_output(stdout)
+
+    @staticmethod
+    def _ffprobe_command(filename: str) -> list[str]:
+        return [
+            "ffprobe",
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            filename,
+        ]
+
+    @staticmethod
+    def _duration_from_ffprobe_output(output: bytes) -> float | None:
+        data = json.loads(output)
 
         duration = None
         if "format" in data and "duration" in data["format"]:
@@ -483,25 +505,7 @@ class Video(StreamingOutput, Component):
                 "Streaming is not supported in the Wasm mode."
             )
 
-        ff = FFmpeg(  # type: ignore
-            inputs={mp4_file: None},
-            outputs={
-                ts_file: "-c:v libx264 -c:a aac -f mpegts -bsf:v h264_mp4toannexb -bsf:a aac_adtstoasc"
-            },
-            global_options=["-y"],
-        )
-
-        command = ff.cmd.split(" ")
-        process = await asyncio.create_subprocess_exec(
-            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-
-        _, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_message = stderr.decode().strip()
-            raise RuntimeError(f"FFmpeg command failed: {error_message}")
-
+        await transcoding_utils.VideoStreamTranscoder().convert(mp4_file, ts_file)
         return ts_file
 
     async def combine_stream(
@@ -544,15 +548,7 @@ class Video(StreamingOutput, Component):
             "copy",
             output_file.name,
         ]
-        process = await asyncio.create_subprocess_exec(
-            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-
-        _, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_message = stderr.decode().strip()
-            raise RuntimeError(f"FFmpeg command failed: {error_message}")
+        await processing_utils.async_run_media_subprocess(command)
         video = FileData(
             path=output_file.name,
             is_stream=False,
@@ -568,7 +564,7 @@ class Video(StreamingOutput, Component):
         self,
         value: str | None,
         output_id: str,
-        first_chunk: bool,  # noqa: ARG002
+        first_chunk: bool,
     ) -> tuple[MediaStreamChunk | None, dict]:
         output_file = {
             "video": {
@@ -584,19 +580,29 @@ class Video(StreamingOutput, Component):
             return None, output_file
 
         ts_file = value
+        duration = None
         if not value.endswith(".ts"):
             if not value.endswith(".mp4"):
                 raise RuntimeError(
                     "Video must be in .mp4 or .ts format to be streamed as chunks",
                 )
+            if wasm_utils.IS_WASM:
+                raise wasm_utils.WasmUnsupportedError(
+                    "Streaming is not supported in the Wasm mode."
+                )
             ts_file = value.replace(".mp4", ".ts")
-            await self.async_convert_mp4_to_ts(value, ts_file)
+            # The transcoder of the stream remembers whether its chunks can be remuxed
+            transcoder = self._stream_transcoders.get_transcoder(output_id, first_chunk)
+            duration = await transcoder.convert(value, ts_file)
 
-        duration = self.get_video_duration_ffprobe(ts_file)
+        if not duration:
+            duration = await self.async_get_video_duration_ffprobe(ts_file)
         if not duration:
             raise RuntimeError("Cannot determine video chunk duration")
+        async with aiofiles.open(ts_file, "rb") as f:
+            data = await f.read()
         chunk: MediaStreamChunk = {
-            "data": Path(ts_file).read_bytes(),
+            "data": data,
             "duration": duration,
             "extension": ".ts",
         }
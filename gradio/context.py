@@ -31,6 +31,7 @@ class LocalContext:
     in_event_listener: ContextVar[bool] = ContextVar("in_event_listener", default=False)
     event_id: ContextVar[str | None] = ContextVar("event_id", default=None)
     request: ContextVar[Request | None] = ContextVar("request", default=None)
+    session_hash: ContextVar[str | None] = ContextVar("session_hash", default=None)
     progress: ContextVar[Progress | None] = ContextVar("progress", default=None)
     key_to_id_map: ContextVar[dict[int | str | tuple[str | int, ...], int] | None] = (
         ContextVar("key_to_id_map", default=None)
@@ -596,6 +596,9 @@ class EventListener(str):
             stream_every: float = 0.5,
             like_user_message: bool = False,
             key: int | str | tuple[int | str, ...] | None = None,
+            coalesce_window: float | None = None,
+            coalesce_max_bytes: int = 65536,
+            parallel_processing: bool = False,
         ) -> Dependency:
             """
             Parameters:
@@ -619,6 +622,9 @@ class EventListener(str):
                 concurrency_id: If set, this is the id of the concurrency group. Events with the same concurrency_id will be limited by the lowest set concurrency_limit.
                 show_api: whether to show this event in the "view API" page of the Gradio app, or in the ".view_api()" method of the Gradio clients. Unlike setting api_name to False, setting show_api to False will still allow downstream apps as well as the Clients to use this event. If fn is None, show_api will automatically be set to False.
                 key: A unique key for this event listener to be used in @gr.render(). If set, this value identifies an event as identical across re-renders when the key is identical.
+                coalesce_window: If set, intermediate outputs of a generator that are yielded within this many seconds of each other are merged into a single message to the browser, which reduces overhead when a generator yields many small updates (e.g. tokens from an LLM). Each intermediate output is delayed by at most this amount. If None, every yielded output is sent as its own message.
+                coalesce_max_bytes: The approximate maximum size (in bytes) of the updates merged into a single message when `coalesce_window` is set.
+                parallel_processing: If True, the preprocessing and postprocessing of the input and output components (and of each sample, if `batch=True`) run concurrently in worker threads instead of one after another. This speeds up events whose components do CPU-heavy processing, e.g. decoding a batch of images. The outputs are returned in the same order either way.
             """
 
             if fn == "decorator":
@@ -645,6 +651,9 @@ class EventListener(str):
                         concurrency_id=concurrency_id,
                         show_api=show_api,
                         key=key,
+                        coalesce_window=coalesce_window,
+                        coalesce_max_bytes=coalesce_max_bytes,
+                        parallel_processing=parallel_processing,
                     )
 
                     @wraps(func)
@@ -697,6 +706,9 @@ class EventListener(str):
                 connection=_connection,
                 time_limit=time_limit,
                 stream_every=stream_every,
+                coalesce_window=coalesce_window,
+                coalesce_max_bytes=coalesce_max_bytes,
+                parallel_processing=parallel_processing,
                 like_user_message=like_user_message,
                 event_specific_args=[
                     d["name"]
@@ -766,6 +778,9 @@ def on(
     time_limit: int | None = None,
     stream_every: float = 0.5,
     key: int | str | tuple[int | str, ...] | None = None,
+    coalesce_window: float | None = None,
+    coalesce_max_bytes: int = 65536,
+    parallel_processing: bool = False,
 ) -> Dependency:
     """
     Sets up an event listener that triggers a function when the specified event(s) occur. This is especially
@@ -794,6 +809,10 @@ def on(
         show_api: whether to show this event in the "view API" page of the Gradio app, or in the ".view_api()" method of the Gradio clients. Unlike setting api_name to False, setting show_api to False will still allow downstream apps as well as the Clients to use this event. If fn is None, show_api will automatically be set to False.
         time_limit: The time limit for the function to run. Parameter only used for the `.stream()` event.
         stream_every: The latency (in seconds) at which stream chunks are sent to the backend. Defaults to 0.5 seconds. Parameter only used for the `.stream()` event.
+        key: A unique key for this event listener to be used in @gr.render(). If set, this value identifies an event as identical across re-renders when the key is identical.
+        coalesce_window: If set, intermediate outputs of a generator that are yielded within this many seconds of each other are merged into a single message to the browser, which reduces overhead when a generator yields many small updates (e.g. tokens from an LLM). Each intermediate output is delayed by at most this amount. If None, every yielded output is sent as its own message.
+        coalesce_max_bytes: The approximate maximum size (in bytes) of the updates merged into a single message when `coalesce_window` is set.
+        parallel_processing: If True, the preprocessing and postprocessing of the input and output components (and of each sample, if `batch=True`) run concurrently in worker threads instead of one after another. This speeds up events whose components do CPU-heavy processing, e.g. decoding a batch of images. The outputs are returned in the same order either way.
     Example:
         import gradio as gr
         with gr.Blocks() as demo:
@@ -844,6 +863,9 @@ def on(
                 time_limit=time_limit,
                 stream_every=stream_every,
                 key=key,
+                coalesce_window=coalesce_window,
+                coalesce_max_bytes=coalesce_max_bytes,
+                parallel_processing=parallel_processing,
             )
 
             @wraps(func)
@@ -902,6 +924,9 @@ def on(
         ],
         time_limit=time_limit,
         stream_every=stream_every,
+        coalesce_window=coalesce_window,
+        coalesce_max_bytes=coalesce_max_bytes,
+        parallel_processing=parallel_processing,
         key=key,
     )
     set_cancel_events(methods, cancels)
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import contextlib
 import csv
 import datetime
 import json
 import os
 import re
+import sqlite3
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Lock
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from gradio_client import utils as client_utils
 from gradio_client.documentation import document
@@ -218,20 +221,32 @@ class CSVLogger(FlaggingCallback):
         simplify_file_data: bool = True,
         verbose: bool = True,
         dataset_file_name: str | None = None,
+        buffer_size: int = 1,
     ):
         """
         Parameters:
             simplify_file_data: If True, the file data will be simplified before being written to the CSV file. If CSVLogger is being used to cache examples, this is set to False to preserve the original FileData class
             verbose: If True, prints messages to the console about the dataset file creation
             dataset_file_name: The name of the dataset file to be created (should end in ".csv"). If None, the dataset file will be named "dataset1.csv" or the next available number.
+            buffer_size: The number of flagged samples that are kept in memory before they are written to the CSV file together. Samples that are still buffered are written when `flush()` is called or when the Python process exits. Defaults to 1, i.e. every sample is written immediately.
         """
         self.simplify_file_data = simplify_file_data
         self.verbose = verbose
         self.dataset_file_name = dataset_file_name
+        self.buffer_size = buffer_size
+        self.buffer: list[list[Any]] = []
+        self.row_count = 0
+        # The row count in the file next to the dataset file, if it is up to date
+        self.saved_row_count: int | None = None
+        self.flush_registered = False
         self.lock = (
             Lock() if not wasm_utils.IS_WASM else contextlib.nullcontext()
         )  # The multiprocessing module doesn't work on Lite.
 
+    # The number of rows after which the row count is saved again, if it is not saved
+    # before by `flush()` (e.g. when the Python process exits)
+    row_count_save_interval = 100
+
     def setup(
         self,
         components: Sequence[Component],
@@ -240,6 +255,62 @@ class CSVLogger(FlaggingCallback):
         self.components = components
         self.flagging_dir = Path(flagging_dir)
         self.first_time = True
+        if not self.flush_registered:
+            atexit.register(self.flush)
+            self.flush_registered = True
+
+    @property
+    def row_count_filepath(self) -> Path:
+        """The file next to the dataset file that stores its number of rows, so that the rows
+        do not need to be counted again when the app restarts."""
+        return self.dataset_filepath.with_name(f".{self.dataset_filepath.name}.rows")
+
+    def _load_row_count(self) -> int:
+        try:
+            saved = json.loads(self.row_count_filepath.read_text())
+            if saved["size"] == os.path.getsize(self.dataset_filepath):
+                self.saved_row_count = saved["rows"]
+                return saved["rows"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        # The dataset file was modified by something else (or rows were written since the
+        # row count was saved), so count its rows again
+        self.saved_row_count = None
+        with open(self.dataset_filepath, newline="", encoding="utf-8") as csvfile:
+            return max(sum(1 for _ in csv.reader(csvfile)) - 1, 0)
+
+    def _save_row_count(self):
+        self.row_count_filepath.write_text(
+            json.dumps(
+                {
+                    "rows": self.row_count,
+                    "size": os.path.getsize(self.dataset_filepath),
+                }
+            )
+        )
+        self.saved_row_count = self.row_count
+
+    def flush(self):
+        """Writes the flagged samples that are still buffered to the CSV file, and saves
+        its number of rows."""
+        with self.lock:
+            if getattr(self, "first_time", True) or not self.dataset_filepath.exists():
+                return  # Nothing has been flagged yet, or the dataset was removed
+            self._flush()
+            if self.saved_row_count != self.row_count:
+                self._save_row_count()
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        with open(self.dataset_filepath, "a", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerows(self.buffer)
+        self.buffer.clear()
+        # The row count is only saved every so often rather than after every write, as it
+        # is counted again at startup if it is out of date
+        if self.row_count - (self.saved_row_count or 0) >= self.row_count_save_interval:
+            self._save_row_count()
 
     def _create_dataset_file(self, additional_headers: list[str] | None = None):
         os.makedirs(self.flagging_dir, exist_ok=True)
@@ -292,6 +363,7 @@ class CSVLogger(FlaggingCallback):
                 print("Created dataset file at:", self.dataset_filepath)
         elif self.verbose:
             print("Using existing dataset file at:", self.dataset_filepath)
+        self.row_count = self._load_row_count()
 
     def flag(
         self,
@@ -337,15 +409,169 @@ class CSVLogger(FlaggingCallback):
         csv_data.append(str(datetime.datetime.now()))
 
         with self.lock:
-            with open(
-                self.dataset_filepath, "a", newline="", encoding="utf-8"
-            ) as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(utils.sanitize_list_for_csv(csv_data))
-            with open(self.dataset_filepath, encoding="utf-8") as csvfile:
-                line_count = len(list(csv.reader(csvfile))) - 1
+            self.buffer.append(utils.sanitize_list_for_csv(csv_data))
+            self.row_count += 1
+            if len(self.buffer) >= self.buffer_size:
+                self._flush()
+            return self.row_count
 
-        return line_count
+
+@document()
+class SQLiteLogger(FlaggingCallback):
+    """
+    An implementation of the FlaggingCallback abstract class that logs each flagged sample to a table
+    in a SQLite database on the machine running the gradio app, with one column per component. Unlike the
+    CSV loggers, flagging does not get slower as the dataset grows, and the files of the flagged components
+    are saved concurrently. Like CSVLogger, a new table is created every time the columns (derived from the
+    labels of the components) change.
+
+    Example:
+        import gradio as gr
+        def image_classifier(inp):
+            return {'cat': 0.3, 'dog': 0.7}
+        demo = gr.Interface(fn=image_classifier, inputs="image", outputs="label",
+                            flagging_callback=gr.SQLiteLogger())
+    Guides: using-flagging
+    """
+
+    def __init__(
+        self,
+        simplify_file_data: bool = True,
+        verbose: bool = True,
+        database_file_name: str = "dataset.db",
+        table_name: str = "dataset",
+        max_workers: int | None = None,
+    ):
+        """
+        Parameters:
+            simplify_file_data: If True, the file data will be simplified before being written to the database.
+            verbose: If True, prints messages to the console about the table creation
+            database_file_name: The name of the SQLite database file to be created in the flagging directory.
+            table_name: The name of the table the samples are written to. If a table with this name but different columns exists, a number is appended to the name.
+            max_workers: The maximum number of threads used to save the files of the flagged components. If None, uses the default of `concurrent.futures.ThreadPoolExecutor`.
+        """
+        self.simplify_file_data = simplify_file_data
+        self.verbose = verbose
+        self.database_file_name = database_file_name
+        self.table_name = table_name
+        self.max_workers = max_workers
+        self.executor: ThreadPoolExecutor | None = None
+        self.lock = (
+            Lock() if not wasm_utils.IS_WASM else contextlib.nullcontext()
+        )  # The multiprocessing module doesn't work on Lite.
+
+    def setup(
+        self,
+        components: Sequence[Component],
+        flagging_dir: str | Path,
+    ):
+        self.components = components
+        self.flagging_dir = Path(flagging_dir)
+        self.first_time = True
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"' + identifier.replace('"', '""') + '"'
+
+    def _create_table(self, additional_headers: list[str]):
+        os.makedirs(self.flagging_dir, exist_ok=True)
+        headers = (
+            [
+                getattr(component, "label", None) or f"component {idx}"
+                for idx, component in enumerate(self.components)
+            ]
+            + additional_headers
+            + ["timestamp"]
+        )
+        self.database_filepath = self.flagging_dir / self.database_file_name
+        self.connection = sqlite3.connect(
+            self.database_filepath, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+
+        n = 1
+        while True:
+            self.dataset_table = self.table_name if n == 1 else f"{self.table_name}{n}"
+            existing_headers = [
+                row[1]
+                for row in self.connection.execute(
+                    f"PRAGMA table_info({self._quote(self.dataset_table)})"
+                )
+            ][1:]
+            if not existing_headers or existing_headers == headers:
+                break
+            n += 1
+
+        if not existing_headers:
+            columns = ", ".join(f"{self._quote(h)} TEXT" for h in headers)
+            self.connection.execute(
+                f"CREATE TABLE {self._quote(self.dataset_table)} "
+                f"(id INTEGER PRIMARY KEY AUTOINCREMENT, {columns})"
+            )
+            if self.verbose:
+                print(f"Created table {self.dataset_table} in:", self.database_filepath)
+        elif self.verbose:
+            print(
+                f"Using existing table {self.dataset_table} in:",
+                self.database_filepath,
+            )
+        self.insert_statement = (
+            f"INSERT INTO {self._quote(self.dataset_table)} "
+            f"({', '.join(self._quote(h) for h in headers)}) "
+            f"VALUES ({', '.join('?' * len(headers))})"
+        )
+
+    def _flag_component(self, idx: int, component: Component, sample: Any) -> str:
+        if utils.is_prop_update(sample):
+            return str(sample)
+        save_dir = self.flagging_dir / client_utils.strip_invalid_filename_characters(
+            str(getattr(component, "label", None) or f"component {idx}")
+        )
+        data = component.flag(sample, flag_dir=save_dir) if sample is not None else ""
+        if self.simplify_file_data:
+            data = utils.simplify_file_data_in_str(data)
+        return data
+
+    def flag(
+        self,
+        flag_data: list[Any],
+        flag_option: str | None = None,
+        username: str | None = None,
+    ) -> int:
+        with self.lock:
+            if self.first_time:
+                additional_headers = []
+                if flag_option is not None:
+                    additional_headers.append("flag")
+                if username is not None:
+                    additional_headers.append("username")
+                self._create_table(additional_headers)
+                self.first_time = False
+            if self.executor is None and not wasm_utils.IS_WASM:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="gradio-flagging"
+                )
+
+        n = min(len(self.components), len(flag_data))
+        if self.executor is None:  # Threads are not available on Lite
+            row = list(map(self._flag_component, range(n), self.components, flag_data))
+        else:
+            row = list(
+                self.executor.map(
+                    self._flag_component, range(n), self.components, flag_data
+                )
+            )
+
+        if flag_option is not None:
+            row.append(flag_option)
+        if username is not None:
+            row.append(username)
+        row.append(str(datetime.datetime.now()))
+
+        with self.lock:
+            cursor = self.connection.execute(self.insert_statement, row)
+        # Rows are never deleted, so the id of the last row is the number of rows
+        return cast(int, cursor.lastrowid)
 
 
 class ChatCSVLogger:
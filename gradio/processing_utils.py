@@ -11,8 +11,12 @@ import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import warnings
-from collections.abc import Awaitable, Callable, Coroutine
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache, wraps
 from io import BytesIO
 from pathlib import Path
@@ -20,13 +24,15 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlparse
 
 import aiofiles
+import anyio
 import httpx
 import numpy as np
 import safehttpx as sh
+from anyio.lowlevel import RunVar
 from gradio_client import utils as client_utils
 from PIL import Image, ImageOps, ImageSequence, PngImagePlugin
 
-from gradio import utils, wasm_utils
+from gradio import audio_utils, utils, wasm_utils
 from gradio.context import LocalContext
 from gradio.data_classes import FileData, GradioModel, GradioRootModel, JsonData
 from gradio.exceptions import Error, InvalidPathError
@@ -209,6 +215,18 @@ def hash_file(file_path: str | Path, chunk_num_blocks: int = 128) -> str:
     return sha.hexdigest()
 
 
+def copy_and_hash_file(src, dst, chunk_size: int = 1024 * 1024) -> str:
+    """Copies the open file object `src` to `dst` and returns the hash of its contents
+    (the same as `hash_file`), so that the file is only read once."""
+    sha = hashlib.sha256()
+    sha.update(hash_seed)
+    buffer = memoryview(bytearray(chunk_size))
+    while n := src.readinto(buffer):
+        sha.update(buffer[:n])
+        dst.write(buffer[:n])
+    return sha.hexdigest()
+
+
 def hash_url(url: str) -> str:
     sha = hashlib.sha256()
     sha.update(hash_seed)
@@ -216,7 +234,7 @@ def hash_url(url: str) -> str:
     return sha.hexdigest()
 
 
-def hash_bytes(bytes: bytes):
+def hash_bytes(bytes: bytes | memoryview):
     sha = hashlib.sha256()
     sha.update(hash_seed)
     sha.update(bytes)
@@ -232,6 +250,35 @@ def hash_base64(base64_encoding: str, chunk_num_blocks: int = 128) -> str:
     return sha.hexdigest()
 
 
+def _get_cache_file_mode() -> int:
+    # The umask can only be read by setting it, so it is read once at import time rather
+    # than while other threads may be creating files
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# The mode of the files written to the cache, i.e. the mode `open()` would give them. The
+# temporary files they are written to are created by `tempfile.mkstemp()` with mode 0600.
+CACHE_FILE_MODE = _get_cache_file_mode()
+
+
+def write_bytes_to_cache_path(path: Path, data: bytes):
+    """Writes `data` to `path` unless the file already exists. The data is written to a
+    temporary file that is then renamed, so a partially written file is never visible."""
+    if path.exists():
+        return
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(temp_path, CACHE_FILE_MODE)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
 def save_pil_to_cache(
     img: Image.Image,
     cache_dir: str,
@@ -241,9 +288,9 @@ def save_pil_to_cache(
     bytes_data = encode_pil_to_bytes(img, format)
     temp_dir = Path(cache_dir) / hash_bytes(bytes_data)
     temp_dir.mkdir(exist_ok=True, parents=True)
-    filename = str((temp_dir / f"{name}.{format}").resolve())
-    (temp_dir / f"{name}.{format}").resolve().write_bytes(bytes_data)
-    return filename
+    path = (temp_dir / f"{name}.{format}").resolve()
+    write_bytes_to_cache_path(path, bytes_data)
+    return str(path)
 
 
 def save_img_array_to_cache(
@@ -253,10 +300,316 @@ def save_img_array_to_cache(
     return save_pil_to_cache(pil_image, cache_dir, format=format)
 
 
+_image_encoder_pool_lock = threading.Lock()
+IMAGE_ENCODER_THREAD_NAME_PREFIX = "gradio-image-encoder"
+
+
+def get_image_encoder_pool() -> ThreadPoolExecutor:
+    """Returns the pool of threads that encode the images returned by functions (e.g. numpy
+    arrays and PIL images) before they are saved to the cache. It is shared by all the
+    components of the process, so that the number of images encoded at the same time stays
+    bounded however many outputs are postprocessed at once. The number of threads can be set
+    with the GRADIO_IMAGE_ENCODER_THREADS environment variable (defaults to the number of CPUs,
+    up to 8).
+    """
+    with _image_encoder_pool_lock:
+        return _create_image_encoder_pool()
+
+
+@lru_cache(maxsize=1)
+def _create_image_encoder_pool() -> ThreadPoolExecutor:
+    max_workers = int(os.getenv("GRADIO_IMAGE_ENCODER_THREADS", "0")) or min(
+        8, os.cpu_count() or 1
+    )
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix=IMAGE_ENCODER_THREAD_NAME_PREFIX,
+    )
+
+
+def map_in_image_encoder_pool(fn: Callable[[Any], T], items: Iterable[Any]) -> list[T]:
+    """Calls `fn` on each of `items` in the image encoder pool and returns the results in
+    order. The items are processed in the current thread if there is only one of them, in Wasm,
+    or if the current thread belongs to the pool, so that a task never waits for tasks that are
+    queued behind it.
+    """
+    items = list(items)
+    if (
+        len(items) <= 1
+        or wasm_utils.IS_WASM
+        or threading.current_thread().name.startswith(IMAGE_ENCODER_THREAD_NAME_PREFIX)
+    ):
+        return [fn(item) for item in items]
+    return list(get_image_encoder_pool().map(fn, items))
+
+
+class DeferredImages(OrderedDict[str, tuple[Image.Image, str, float]]):
+    """
+    The images whose full resolution files are only encoded when they are first requested,
+    with their format and the time at which they were deferred, by the path of their file in
+    the cache, in least recently deferred order. `size` is the memory taken by their pixels,
+    and `by_directory` has their paths by the directory of their file.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.size = 0
+        self.by_directory: dict[Path, set[str]] = {}
+
+    def add(self, path: str, img: Image.Image, format: str):
+        self[path] = (img, format, time.monotonic())
+        self.size += _image_size_in_memory(img)
+        self.by_directory.setdefault(Path(path).parent, set()).add(path)
+
+    def remove(self, path: str) -> tuple[Image.Image, str]:
+        img, format, _ = self.pop(path)
+        self.size -= _image_size_in_memory(img)
+        directory = Path(path).parent
+        paths = self.by_directory[directory]
+        paths.discard(path)
+        if not paths:
+            del self.by_directory[directory]
+        return img, format
+
+
+_deferred_images = DeferredImages()
+# The images that are being encoded, so that concurrent requests wait for the same file
+_encoding_images: dict[str, Future[None]] = {}
+_deferred_images_lock = threading.Lock()
+DEFERRED_IMAGES_MAX_BYTES = int(
+    os.getenv("GRADIO_DEFERRED_IMAGES_MAX_BYTES", str(512 * 1024 * 1024))
+)
+# The number of seconds after which deferred images that were not requested are dropped
+DEFERRED_IMAGES_TTL = int(os.getenv("GRADIO_DEFERRED_IMAGES_TTL", "3600"))
+
+
+def _image_size_in_memory(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+def can_defer_image_encoding() -> bool:
+    """Whether the images returned by the current event can be encoded when they are first
+    requested, i.e. whether the event is run by a launched app whose /file= route encodes them.
+    """
+    blocks = LocalContext.blocks.get()
+    return not wasm_utils.IS_WASM and blocks is not None and blocks.is_running
+
+
+def defer_image_encoding(path: str, img: Image.Image, format: str):
+    """Records that `img` should be encoded to `format` and written to `path` when the file is
+    first requested (see encode_deferred_image). If the deferred images take more than
+    GRADIO_DEFERRED_IMAGES_MAX_BYTES of memory, the least recently deferred ones are encoded
+    right away instead. Images that are not requested within GRADIO_DEFERRED_IMAGES_TTL
+    seconds are dropped (see expire_deferred_images).
+    """
+    overflow = []
+    with _deferred_images_lock:
+        _expire_deferred_images()
+        if path in _deferred_images or path in _encoding_images:
+            return
+        _deferred_images.add(path, img, format)
+        while (
+            _deferred_images.size > DEFERRED_IMAGES_MAX_BYTES
+            and len(_deferred_images) > 1
+        ):
+            oldest = next(iter(_deferred_images))
+            overflow.append((oldest, *_pop_deferred_image(oldest)))
+    for oldest, oldest_img, oldest_format, future in overflow:
+        _encode_deferred_image(oldest, oldest_img, oldest_format, future)
+
+
+def _pop_deferred_image(path: str) -> tuple[Image.Image, str, Future[None]]:
+    # Must be called with _deferred_images_lock held
+    img, format = _drop_deferred_image(path)
+    future: Future[None] = Future()
+    _encoding_images[path] = future
+    return img, format, future
+
+
+def _drop_deferred_image(path: str) -> tuple[Image.Image, str]:
+    # Must be called with _deferred_images_lock held
+    return _deferred_images.remove(path)
+
+
+def _expire_deferred_images():
+    # Must be called with _deferred_images_lock held
+    expired_before = time.monotonic() - DEFERRED_IMAGES_TTL
+    while _deferred_images:
+        oldest, (_, _, deferred_at) = next(iter(_deferred_images.items()))
+        if deferred_at > expired_before:
+            break
+        _drop_deferred_image(oldest)
+
+
+def expire_deferred_images():
+    """Drops the deferred images that were not requested within GRADIO_DEFERRED_IMAGES_TTL
+    seconds, so that the memory of their pixels is released."""
+    with _deferred_images_lock:
+        _expire_deferred_images()
+
+
+def discard_deferred_images(directory: str | Path):
+    """Drops the deferred images whose files would be written to `directory`, e.g. because
+    the other files in it were deleted from the cache."""
+    with _deferred_images_lock:
+        for path in list(_deferred_images.by_directory.get(Path(directory), ())):
+            _drop_deferred_image(path)
+
+
+def _encode_deferred_image(
+    path: str, img: Image.Image, format: str, future: Future[None]
+):
+    try:
+        write_bytes_to_cache_path(Path(path), encode_pil_to_bytes(img, format))
+        future.set_result(None)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _deferred_images_lock:
+            _encoding_images.pop(path, None)
+
+
+def encode_deferred_image(path: str | Path) -> bool:
+    """If the encoding of the image at `path` was deferred, encodes it (or waits until it is
+    encoded by another thread) and returns True once its file is written. Returns False
+    otherwise.
+    """
+    path = str(path)
+    with _deferred_images_lock:
+        _expire_deferred_images()
+        if path in _deferred_images and not Path(path).parent.is_dir():
+            # The directory of the image was deleted from the cache in the meantime
+            _drop_deferred_image(path)
+            return False
+        if path in _deferred_images:
+            img, format, future = _pop_deferred_image(path)
+        elif path in _encoding_images:
+            img = None
+            future = _encoding_images[path]
+        else:
+            return False
+    if img is None:
+        future.result()
+    else:
+        _encode_deferred_image(path, img, format, future)
+    return True
+
+
+async def async_encode_deferred_image(path: str | Path) -> bool:
+    """Async version of encode_deferred_image() that encodes the image in the image encoder
+    pool, so that encoding large images does not block the event loop.
+    """
+    path = str(path)
+    if path not in _deferred_images and path not in _encoding_images:
+        return False
+    if wasm_utils.IS_WASM:
+        return encode_deferred_image(path)
+    return await asyncio.wrap_future(
+        get_image_encoder_pool().submit(encode_deferred_image, path)
+    )
+
+
+def encode_deferred_images(data: Any):
+    """Encodes the deferred images of all the files in `data`, e.g. before the files are read
+    or copied elsewhere."""
+    if isinstance(data, (GradioModel, GradioRootModel)):
+        data = data.model_dump()
+
+    def _encode(d: dict):
+        if d.get("path"):
+            encode_deferred_image(str(abspath(d["path"])))
+        return d
+
+    client_utils.traverse(data, _encode, client_utils.is_file_obj)
+
+
+def save_img_with_thumbnail(
+    img: np.ndarray | Image.Image,
+    cache_dir: str,
+    thumbnail_size: int,
+    format: str = "webp",
+    defer: bool = False,
+) -> tuple[str, str]:
+    """Saves a thumbnail of the image, whose longest side is at most `thumbnail_size` pixels,
+    to the cache and returns the paths of the full resolution image and of the thumbnail. The
+    paths are derived from the pixels of the image, so an image that is returned again (e.g. by
+    another event) reuses the files already in the cache. If `defer` is True, the full
+    resolution image is only encoded when its file is first requested.
+    """
+    sha = hashlib.sha256()
+    sha.update(hash_seed)
+    if isinstance(img, np.ndarray):
+        arr = np.ascontiguousarray(img)
+        sha.update(f"{arr.dtype}{arr.shape}".encode())
+        sha.update(arr)
+        img = Image.fromarray(_convert(arr, np.uint8, force_copy=False))
+    else:
+        sha.update(f"{img.mode}{img.size}".encode())
+        sha.update(img.tobytes())
+    # The metadata (e.g. the color profile) is saved in the files too
+    sha.update(repr(sorted(img.info.items(), key=lambda item: str(item[0]))).encode())
+    temp_dir = Path(cache_dir) / sha.hexdigest()
+    temp_dir.mkdir(exist_ok=True, parents=True)
+    path = str(abspath(temp_dir / f"image.{format}"))
+    if img.width <= thumbnail_size and img.height <= thumbnail_size:
+        # The image is small enough to be its own thumbnail
+        if not Path(path).exists():
+            write_bytes_to_cache_path(Path(path), encode_pil_to_bytes(img, format))
+        return path, path
+    thumbnail_path = str(abspath(temp_dir / f"thumbnail_{thumbnail_size}.{format}"))
+    if not Path(thumbnail_path).exists():
+        thumbnail = img.copy()
+        thumbnail.thumbnail((thumbnail_size, thumbnail_size))
+        write_bytes_to_cache_path(
+            Path(thumbnail_path), encode_pil_to_bytes(thumbnail, format)
+        )
+    if not Path(path).exists():
+        if defer:
+            defer_image_encoding(path, img, format)
+        else:
+            write_bytes_to_cache_path(Path(path), encode_pil_to_bytes(img, format))
+    return path, thumbnail_path
+
+
+def save_file_thumbnail(
+    file_path: str | Path, cache_dir: str, thumbnail_size: int, format: str = "webp"
+) -> str | None:
+    """Saves a thumbnail of the image file, whose longest side is at most `thumbnail_size`
+    pixels, to the cache and returns its path. The thumbnail is reused as long as the file is
+    not modified. Returns None if the file is not a still image larger than the thumbnail.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    temp_dir = Path(cache_dir) / hash_bytes(
+        f"{abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+    )
+    thumbnail_path = str(abspath(temp_dir / f"thumbnail_{thumbnail_size}.{format}"))
+    if Path(thumbnail_path).exists():
+        return thumbnail_path
+    try:
+        with Image.open(file_path) as img:
+            if getattr(img, "is_animated", False) or (
+                img.width <= thumbnail_size and img.height <= thumbnail_size
+            ):
+                return None
+            # Lets JPEG images be decoded at a lower resolution
+            img.draft("RGB", (thumbnail_size, thumbnail_size))
+            img.thumbnail((thumbnail_size, thumbnail_size))
+            thumbnail_bytes = encode_pil_to_bytes(img, format)
+    except OSError:
+        return None
+    temp_dir.mkdir(exist_ok=True, parents=True)
+    write_bytes_to_cache_path(Path(thumbnail_path), thumbnail_bytes)
+    return thumbnail_path
+
+
 def save_audio_to_cache(
     data: np.ndarray, sample_rate: int, format: str, cache_dir: str
 ) -> str:
-    temp_dir = Path(cache_dir) / hash_bytes(data.tobytes())
+    temp_dir = Path(cache_dir) / hash_bytes(np.ascontiguousarray(data).data)
     temp_dir.mkdir(exist_ok=True, parents=True)
     filename = str((temp_dir / f"audio.{format}").resolve())
     audio_to_file(sample_rate, data, filename, format=format)
@@ -291,26 +644,198 @@ def save_bytes_to_cache(data: bytes, file_name: str, cache_dir: str) -> str:
         detected_extension = detect_audio_format(data)
         file_name = file_name + detected_extension
     path = path / Path(file_name).name
-    path.write_bytes(data)
+    write_bytes_to_cache_path(path, data)
     return str(path.resolve())
 
 
+# Maps the (device, inode, size, mtime) of files that were saved to the cache to their hash,
+# so that files that have not changed since are not read again. Only used if the
+# GRADIO_CACHE_STAT_FAST_PATH environment variable is set to "True", as a file that is
+# rewritten in place with the same size and mtime (e.g. by `cp -p` or rsync) would otherwise
+# be served from the cache with its old content.
+_file_hashes: OrderedDict[tuple[int, int, int, int], str] = OrderedDict()
+_file_hashes_lock = threading.Lock()
+FILE_HASHES_CAPACITY = 10000
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int, int]:
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _stat_fast_path_enabled() -> bool:
+    return os.getenv("GRADIO_CACHE_STAT_FAST_PATH", "False").lower() == "true"
+
+
+def _get_cached_file_hash(key: tuple[int, int, int, int]) -> str | None:
+    if not _stat_fast_path_enabled():
+        return None
+    with _file_hashes_lock:
+        file_hash = _file_hashes.get(key)
+        if file_hash is not None:
+            _file_hashes.move_to_end(key)
+        return file_hash
+
+
+def _set_cached_file_hash(key: tuple[int, int, int, int], file_hash: str):
+    if not _stat_fast_path_enabled():
+        return
+    with _file_hashes_lock:
+        _file_hashes[key] = file_hash
+        if len(_file_hashes) > FILE_HASHES_CAPACITY:
+            _file_hashes.popitem(last=False)
+
+
+def _reflink(src, dst) -> bool:
+    """Makes `dst` a copy-on-write clone of `src` (both open file objects) without copying
+    any data, if the filesystem supports it (e.g. btrfs, XFS). Returns whether it succeeded."""
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst.fileno(), 0x40049409, src.fileno())  # FICLONE
+    except (ImportError, OSError):
+        return False
+    return True
+
+
 def save_file_to_cache(file_path: str | Path, cache_dir: str) -> str:
     """Returns a temporary file path for a copy of the given file path if it does
-    not already exist. Otherwise returns the path to the existing temp file."""
-    temp_dir = hash_file(file_path)
-    temp_dir = Path(cache_dir) / temp_dir
-    temp_dir.mkdir(exist_ok=True, parents=True)
+    not already exist. Otherwise returns the path to the existing temp file.
 
+    The file is hashed while it is being copied, so it is only read once. If the cache is on
+    the same filesystem as the file, the copy is a reflink where supported, or a hardlink if
+    the GRADIO_CACHE_HARDLINKS environment variable is set to "True".
+    """
     name = client_utils.strip_invalid_filename_characters(Path(file_path).name)
-    full_temp_file_path = str(abspath(temp_dir / name))
+    stat = os.stat(file_path)
+    key = _stat_key(stat)
+    if (file_hash := _get_cached_file_hash(key)) is not None:
+        full_temp_file_path = str(abspath(Path(cache_dir) / file_hash / name))
+        if Path(full_temp_file_path).exists():
+            return full_temp_file_path
+
+    Path(cache_dir).mkdir(exist_ok=True, parents=True)
+    same_filesystem = os.stat(cache_dir).st_dev == stat.st_dev
+    if (
+        same_filesystem
+        and os.getenv("GRADIO_CACHE_HARDLINKS", "False").lower() == "true"
+    ):
+        file_hash = hash_file(file_path)
+        temp_dir = Path(cache_dir) / file_hash
+        temp_dir.mkdir(exist_ok=True, parents=True)
+        full_temp_file_path = str(abspath(temp_dir / name))
+        try:
+            os.link(file_path, full_temp_file_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            file_hash = None  # e.g. the filesystem does not support hardlinks
+        if file_hash is not None:
+            _set_cached_file_hash(key, file_hash)
+            return full_temp_file_path
 
-    if not Path(full_temp_file_path).exists():
-        shutil.copy2(file_path, full_temp_file_path)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as dst, open(file_path, "rb") as src:
+            if same_filesystem and _reflink(src, dst):
+                file_hash = hash_file(file_path)
+            else:
+                file_hash = copy_and_hash_file(src, dst)
+        shutil.copystat(file_path, temp_path)
+        os.chmod(temp_path, CACHE_FILE_MODE)
+
+        temp_dir = Path(cache_dir) / file_hash
+        temp_dir.mkdir(exist_ok=True, parents=True)
+        full_temp_file_path = str(abspath(temp_dir / name))
+        if Path(full_temp_file_path).exists():
+            os.unlink(temp_path)
+        else:
+            os.replace(temp_path, full_temp_file_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
 
+    _set_cached_file_hash(key, file_hash)
     return full_temp_file_path
 
 
+_cache_io_limiter: RunVar[anyio.CapacityLimiter] = RunVar("_cache_io_limiter")
+
+
+def get_cache_io_limiter() -> anyio.CapacityLimiter:
+    """Returns the limiter of the threads that copy and hash files into the cache. It is
+    separate from the limiter of the threads that run the user's functions, so that slow
+    file I/O cannot use up the threads of the functions and vice versa. The number of
+    threads can be set with the GRADIO_CACHE_IO_THREADS environment variable.
+    """
+    try:
+        return _cache_io_limiter.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(int(os.getenv("GRADIO_CACHE_IO_THREADS", "8")))
+        _cache_io_limiter.set(limiter)
+        return limiter
+
+
+async def async_save_file_to_cache(file_path: str | Path, cache_dir: str) -> str:
+    """Async version of save_file_to_cache() that hashes and copies the file in a worker
+    thread, so that large files do not block the event loop.
+    """
+    if wasm_utils.IS_WASM:
+        return save_file_to_cache(file_path, cache_dir)
+    return await anyio.to_thread.run_sync(
+        save_file_to_cache, file_path, cache_dir, limiter=get_cache_io_limiter()
+    )
+
+
+_media_subprocess_limiter: RunVar[anyio.CapacityLimiter] = RunVar(
+    "_media_subprocess_limiter"
+)
+
+
+def get_media_subprocess_limiter() -> anyio.CapacityLimiter:
+    """Returns the limiter of the ffmpeg and ffprobe processes that are run to stream audio
+    and video outputs, so that many concurrent streams cannot start an unbounded number of
+    processes. The number of processes can be set with the GRADIO_MEDIA_SUBPROCESSES
+    environment variable (defaults to the number of CPUs).
+    """
+    try:
+        return _media_subprocess_limiter.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(
+            int(os.getenv("GRADIO_MEDIA_SUBPROCESSES", "0")) or os.cpu_count() or 1
+        )
+        _media_subprocess_limiter.set(limiter)
+        return limiter
+
+
+async def async_run_media_subprocess(command: list[str]) -> tuple[bytes, bytes]:
+    """Runs an ffmpeg or ffprobe command without blocking the event loop and returns its
+    stdout and stderr. Raises a RuntimeError if the command fails.
+    """
+    async with get_media_subprocess_limiter():
+        process = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"FFmpeg command failed: {stderr.decode().strip()}")
+    return stdout, stderr
+
+
+_async_client: RunVar[httpx.AsyncClient] = RunVar("_async_client")
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Returns the httpx client that is shared by the requests made in the current event
+    loop, so that their connections are pooled instead of being opened for each request.
+    """
+    try:
+        return _async_client.get()
+    except LookupError:
+        client = httpx.AsyncClient(transport=async_transport)
+        _async_client.set(client)
+        return client
+
+
 # Always return these URLs as is, without checking to see if they resolve
 # to an internal IP address. This is because Hugging Face uses DNS splitting,
 # which means that requests from HF Spaces to HF Datasets or HF Models
@@ -525,6 +1050,9 @@ def move_files_to_cache(
             # If the file is on a remote server, do not move it to cache.
             if not client_utils.is_http_url_like(payload.path):
                 _check_allowed(payload.path, check_in_upload_folder)
+                if not postprocess:
+                    # The file may be an image that is only encoded once it is needed
+                    encode_deferred_image(abspath(payload.path))
             if not payload.is_stream:
                 temp_file_path = block.move_resource_to_block_cache(payload.path)
                 if temp_file_path is None:
@@ -609,6 +1137,7 @@ async def async_move_files_to_cache(
     postprocess: bool = False,
     check_in_upload_folder=False,
     keep_in_cache=False,
+    max_concurrency: int | None = None,
 ) -> dict:
     """Move any files in `data` to cache and (optionally), adds URL prefixes (/file=...) needed to access the cached file.
     Also handles the case where the file is on an external Gradio app (/proxy=...).
@@ -621,7 +1150,10 @@ async def async_move_files_to_cache(
         postprocess: Whether its running from postprocessing
         check_in_upload_folder: If True, instead of moving the file to cache, checks if the file is in already in cache (exception if not).
         keep_in_cache: If True, the file will not be deleted from cache when the server is shut down.
+        max_concurrency: The maximum number of files in `data` that are moved or downloaded at the same time. If None, uses the GRADIO_CACHE_MOVE_CONCURRENCY environment variable (default 16).
     """
+    # Files that appear several times in `data` are only moved once
+    moves: dict[str, asyncio.Future[str | None]] = {}
 
     def _mark_svg_as_safe(payload: FileData):
         # If the app has not launched, this path can be considered an "allowed path"
@@ -645,10 +1177,15 @@ async def async_move_files_to_cache(
             # If the file is on a remote server, do not move it to cache.
             if not client_utils.is_http_url_like(payload.path):
                 _check_allowed(payload.path, check_in_upload_folder)
+                if not postprocess:
+                    # The file may be an image that is only encoded once it is needed
+                    await async_encode_deferred_image(abspath(payload.path))
             if not payload.is_stream:
-                temp_file_path = await block.async_move_resource_to_block_cache(
-                    payload.path
-                )
+                if payload.path not in moves:
+                    moves[payload.path] = asyncio.ensure_future(
+                        block.async_move_resource_to_block_cache(payload.path)
+                    )
+                temp_file_path = await moves[payload.path]
                 if temp_file_path is None:
                     raise ValueError("Did not determine a file path for the resource.")
                 payload.path = temp_file_path
@@ -673,19 +1210,57 @@ async def async_move_files_to_cache(
 
     if isinstance(data, (GradioRootModel, GradioModel)):
         data = data.model_dump()
-    return await client_utils.async_traverse(
-        data, _move_to_cache, client_utils.is_file_obj_with_meta
+
+    # Replace the files with placeholders first, so that they can be moved concurrently
+    files: list[dict] = []
+
+    def _add_placeholder(d: dict) -> _PendingFile:
+        files.append(d)
+        return _PendingFile(len(files) - 1)
+
+    data = client_utils.traverse(
+        data, _add_placeholder, client_utils.is_file_obj_with_meta
     )
+    if not files:
+        return data
+    if len(files) == 1:
+        moved_files = [await _move_to_cache(files[0])]
+    else:
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("GRADIO_CACHE_MOVE_CONCURRENCY", "16"))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _limited_move_to_cache(d: dict):
+            async with semaphore:
+                return await _move_to_cache(d)
+
+        moved_files = await asyncio.gather(*map(_limited_move_to_cache, files))
+    return client_utils.traverse(
+        data,
+        lambda placeholder: moved_files[placeholder.index],
+        lambda obj: isinstance(obj, _PendingFile),
+    )
+
+
+class _PendingFile:
+    """A placeholder for a file in the data passed to async_move_files_to_cache()."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
 
 
 def add_root_url(data: dict | list, root_url: str, previous_root_url: str | None):
+    # The file dicts are copied rather than updated in place, because the output data of
+    # an event is also stored in the session's config, which must not have the root url
     def _add_root_url(file_dict: dict):
-        if previous_root_url and file_dict["url"].startswith(previous_root_url):
-            file_dict["url"] = file_dict["url"][len(previous_root_url) :]
-        elif client_utils.is_http_url_like(file_dict["url"]):
+        url = file_dict["url"]
+        if previous_root_url and url.startswith(previous_root_url):
+            url = url[len(previous_root_url) :]
+        elif client_utils.is_http_url_like(url):
             return file_dict
-        file_dict["url"] = f"{root_url}{file_dict['url']}"
-        return file_dict
+        return {**file_dict, "url": f"{root_url}{url}"}
 
     return client_utils.traverse(data, _add_root_url, client_utils.is_file_obj_with_url)
 
@@ -725,6 +1300,16 @@ def resize_and_crop(img, size, crop_type="center"):
 def audio_from_file(
     filename: str, crop_min: float = 0, crop_max: float = 100
 ) -> tuple[int, np.ndarray]:
+    try:
+        wav = audio_utils.read_wav(filename)
+    except OSError:
+        wav = None  # raise the same errors as for other files below
+    if wav is not None:
+        sample_rate, data = wav
+        if crop_min != 0 or crop_max != 100:
+            data = _crop_samples(sample_rate, data, crop_min, crop_max)
+        return sample_rate, data
+
     try:
         audio = AudioSegment.from_file(filename)
     except FileNotFoundError as e:
@@ -747,16 +1332,51 @@ def audio_from_file(
         audio_start = len(audio) * crop_min / 100
         audio_end = len(audio) * crop_max / 100
         audio = audio[audio_start:audio_end]
-    data = np.array(audio.get_array_of_samples())
+    # Read straight from the raw data, rather than through an intermediate Python array. The
+    # samples are still copied once, as the raw data is immutable.
+    data = np.frombuffer(audio.raw_data, dtype=f"<i{audio.sample_width}").astype(
+        f"=i{audio.sample_width}"
+    )
     if audio.channels > 1:
         data = data.reshape(-1, audio.channels)
     return audio.frame_rate, data
 
 
+def _crop_samples(
+    sample_rate: int, data: np.ndarray, crop_min: float, crop_max: float
+) -> np.ndarray:
+    # Crops the samples in the same way as slicing an AudioSegment, i.e. at the millisecond
+    duration_ms = round(1000 * len(data) / sample_rate)
+    start = int(min(duration_ms * crop_min / 100, duration_ms) * sample_rate / 1000)
+    end = int(min(duration_ms * crop_max / 100, duration_ms) * sample_rate / 1000)
+    cropped = data[start:end]
+    if missing := end - start - len(cropped):  # the duration was rounded up
+        padding = np.zeros((missing, *data.shape[1:]), dtype=data.dtype)
+        cropped = np.concatenate([cropped, padding])
+    return cropped
+
+
+def get_audio_duration(filename: str | Path) -> float | None:
+    """Returns the duration of an audio file in seconds without decoding it. It is read from
+    the headers of WAV, MP3, FLAC and Ogg files, and otherwise from the cached metadata of the
+    file if ffprobe is installed. Returns None if the duration cannot be determined this way."""
+    duration = audio_utils.duration_from_header(filename)
+    if duration is None and ffmpeg_installed():
+        from ffmpy import FFExecutableNotFoundError, FFRuntimeError
+
+        try:
+            duration = get_media_metadata(filename)["duration"]
+        except (FFExecutableNotFoundError, FFRuntimeError, ValueError):
+            pass
+    return duration
+
+
 def audio_to_file(sample_rate, data, filename, format="wav"):
     if format == "wav":
         data = convert_to_16_bit_wav(data)
-    elif wasm_utils.IS_WASM:
+        audio_utils.write_wav(filename, sample_rate, data)
+        return
+    if wasm_utils.IS_WASM:
         raise wasm_utils.WasmUnsupportedError(
             "Audio formats other than .wav are not supported in the Wasm mode."
         )
@@ -770,38 +1390,85 @@ def audio_to_file(sample_rate, data, filename, format="wav"):
     file.close()  # type: ignore
 
 
-def convert_to_16_bit_wav(data):
+# The number of samples that are converted at a time when converting float or 32-bit audio to
+# 16-bit, which bounds the size of the temporary array used by the conversion
+AUDIO_CONVERSION_CHUNK_SIZE = 1 << 16
+
+
+def convert_to_16_bit_wav(data, out=None):
+    """
+    Converts audio samples to 16-bit integers. Float samples are normalized to their peak.
+
+    Parameters:
+        data: the samples to convert.
+        out: a C-contiguous int16 array with the same shape as `data` to write the converted
+            samples to. If None, a new array is allocated, unless the samples are already
+            16-bit, in which case `data` is returned as is.
+    """
     # Based on: https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.wavfile.write.html
     warning = "Trying to convert audio automatically from {} to 16-bit int format."
-    if data.dtype in [np.float64, np.float32, np.float16]:
-        warnings.warn(warning.format(data.dtype))
-        data = data / np.abs(data).max()
-        data = data * 32767
-        data = data.astype(np.int16)
-    elif data.dtype == np.int32:
+    if data.dtype not in [
+        np.float64,
+        np.float32,
+        np.float16,
+        np.int32,
+        np.int16,
+        np.uint16,
+        np.uint8,
+        np.int8,
+    ]:
+        raise ValueError(
+            "Audio data cannot be converted automatically from "
+            f"{data.dtype} to 16-bit int format."
+        )
+    if out is None:
+        if data.dtype == np.int16:
+            return data
+        out = np.empty(data.shape, dtype=np.int16)
+    elif (
+        out.dtype != np.int16
+        or out.shape != data.shape
+        or not out.flags.c_contiguous
+        or not out.flags.writeable
+    ):
+        raise ValueError(
+            "`out` must be a writeable, C-contiguous int16 array with the same shape as "
+            "the audio data."
+        )
+    if data.dtype != np.int16:
         warnings.warn(warning.format(data.dtype))
-        data = data / 65536
-        data = data.astype(np.int16)
-    elif data.dtype == np.int16:
-        pass
+
+    samples = data.reshape(-1)
+    converted = out.reshape(-1)
+    # The unsigned view of the converted samples, to offset them with an xor of the sign bit
+    # without going through a wider type
+    unsigned = converted.view(np.uint16)
+    if data.dtype == np.int16:
+        np.copyto(converted, samples)
     elif data.dtype == np.uint16:
-        warnings.warn(warning.format(data.dtype))
-        data = data - 32768
-        data = data.astype(np.int16)
+        np.bitwise_xor(samples, 0x8000, out=unsigned)
     elif data.dtype == np.uint8:
-        warnings.warn(warning.format(data.dtype))
-        data = data * 257 - 32768
-        data = data.astype(np.int16)
+        np.multiply(samples, 257, out=unsigned, dtype=np.uint16)
+        np.bitwise_xor(unsigned, 0x8000, out=unsigned)
     elif data.dtype == np.int8:
-        warnings.warn(warning.format(data.dtype))
-        data = data * 256
-        data = data.astype(np.int16)
+        np.multiply(samples, 256, out=converted, dtype=np.int16)
     else:
-        raise ValueError(
-            "Audio data cannot be converted automatically from "
-            f"{data.dtype} to 16-bit int format."
-        )
-    return data
+        if data.dtype == np.int32:
+            scale = 65536
+            buffer_dtype = np.float64
+        else:
+            scale = np.maximum(samples.max(), -samples.min())
+            buffer_dtype = data.dtype
+        buffer = np.empty(min(samples.size, AUDIO_CONVERSION_CHUNK_SIZE), buffer_dtype)
+        for start in range(0, samples.size, AUDIO_CONVERSION_CHUNK_SIZE):
+            chunk = samples[start : start + AUDIO_CONVERSION_CHUNK_SIZE]
+            chunk_buffer = buffer[: chunk.size]
+            np.divide(chunk, scale, out=chunk_buffer)
+            if data.dtype != np.int32:
+                np.multiply(chunk_buffer, 32767, out=chunk_buffer)
+            # Truncates towards zero, like astype()
+            converted[start : start + chunk.size] = chunk_buffer
+    return out
 
 
 ##################
@@ -1113,6 +1780,109 @@ def ffmpeg_installed() -> bool:
     return shutil.which("ffmpeg") is not None
 
 
+##################
+# Media metadata
+##################
+
+# Maps the (device, inode, size, mtime) of media files to their metadata, so that files that
+# have not changed since are not probed again.
+_media_metadata: OrderedDict[tuple[int, int, int, int], dict[str, Any]] = OrderedDict()
+_media_metadata_lock = threading.Lock()
+MEDIA_METADATA_CAPACITY = 10000
+
+
+def _media_metadata_path(file_path: Path) -> Path | None:
+    # The metadata of the files in the cache, which are in a directory named after the hash
+    # of their content, is persisted next to them so that it survives restarts.
+    hash_dir = file_path.parent.name
+    if len(hash_dir) != 64 or not all(c in "0123456789abcdef" for c in hash_dir):
+        return None
+    return file_path.parent / f".{file_path.name}.metadata.json"
+
+
+def probe_media_metadata(file_path: str | Path) -> dict[str, Any]:
+    """Probes a media file with ffprobe and returns its format and duration (in seconds, or
+    None if unknown), and the codecs, dimensions, sample rate and channels of its first video
+    and audio streams (None if the file does not have such a stream)."""
+    from ffmpy import FFprobe
+
+    probe = FFprobe(
+        global_options="-show_format -show_streams -print_format json",
+        inputs={str(file_path): None},
+    )
+    output = probe.run(stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    data = json.loads(output[0])  # type: ignore
+    streams = data.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), {})
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), {})
+
+    duration = data.get("format", {}).get("duration")
+    if duration is None:
+        duration = next((s["duration"] for s in streams if "duration" in s), None)
+    return {
+        "format_name": data.get("format", {}).get("format_name"),
+        "duration": float(duration) if duration not in (None, "N/A") else None,
+        "video_codec": video.get("codec_name"),
+        "width": video.get("width"),
+        "height": video.get("height"),
+        "audio_codec": audio.get("codec_name"),
+        "sample_rate": int(audio["sample_rate"]) if "sample_rate" in audio else None,
+        "channels": audio.get("channels"),
+    }
+
+
+def get_media_metadata(file_path: str | Path) -> dict[str, Any]:
+    """Returns the metadata of a media file (see probe_media_metadata()), which is only probed
+    the first time it is requested for the file, or after the file has changed. The metadata
+    of files in the cache is also persisted next to them, so it is reused after a restart.
+    Raises the errors of ffprobe if the file cannot be probed.
+    """
+    file_path = Path(file_path)
+    stat = os.stat(file_path)
+    key = _stat_key(stat)
+    with _media_metadata_lock:
+        metadata = _media_metadata.get(key)
+        if metadata is not None:
+            _media_metadata.move_to_end(key)
+            return metadata
+
+    metadata_path = _media_metadata_path(file_path)
+    if metadata_path is not None:
+        try:
+            saved = json.loads(metadata_path.read_text())
+            if [saved["size"], saved["mtime_ns"]] == [stat.st_size, stat.st_mtime_ns]:
+                metadata = saved["metadata"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    if metadata is None:
+        metadata = probe_media_metadata(file_path)
+        if metadata_path is not None:
+            saved = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "metadata": metadata,
+            }
+            temp_path = metadata_path.with_name(f"{metadata_path.name}.{os.getpid()}")
+            try:
+                temp_path.write_text(json.dumps(saved))
+                os.replace(temp_path, metadata_path)
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+
+    with _media_metadata_lock:
+        _media_metadata[key] = metadata
+        if len(_media_metadata) > MEDIA_METADATA_CAPACITY:
+            _media_metadata.popitem(last=False)
+    return metadata
+
+
+def delete_media_metadata(file_path: str | Path):
+    """Deletes the persisted metadata of a file in the cache, e.g. when the file is deleted."""
+    metadata_path = _media_metadata_path(Path(file_path))
+    if metadata_path is not None:
+        metadata_path.unlink(missing_ok=True)
+
+
 def video_is_playable(video_filepath: str) -> bool:
     """Determines if a video is playable in the browser.
 
@@ -1121,17 +1891,13 @@ def video_is_playable(video_filepath: str) -> bool:
         .webm -> vp9
         .ogg -> theora
     """
-    from ffmpy import FFprobe, FFRuntimeError
+    from ffmpy import FFRuntimeError
 
     try:
         container = Path(video_filepath).suffix.lower()
-        probe = FFprobe(
-            global_options="-show_format -show_streams -select_streams v -print_format json",
-            inputs={video_filepath: None},
-        )
-        output = probe.run(stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        output = json.loads(output[0])  # type: ignore
-        video_codec = output["streams"][0]["codec_name"]
+        video_codec = get_media_metadata(video_filepath)["video_codec"]
+        if video_codec is None:
+            return True
         return (container, video_codec) in [
             (".mp4", "h264"),
             (".mp4", "av1"),
@@ -1174,20 +1940,7 @@ def get_video_length(video_path: str | Path):
         raise wasm_utils.WasmUnsupportedError(
             "Video duration is not supported in the Wasm mode."
         )
-    duration = subprocess.check_output(
-        [
-            "ffprobe",
-            "-i",
-            str(video_path),
-            "-show_entries",
-            "format=duration",
-            "-v",
-            "quiet",
-            "-of",
-            "csv={}".format("p=0"),
-        ]
-    )
-    duration_str = duration.decode("utf-8").strip()
-    duration_float = float(duration_str)
-
-    return duration_float
+    duration = get_media_metadata(video_path)["duration"]
+    if duration is None:
+        raise ValueError(f"Cannot determine the duration of the video: {video_path}")
+    return duration
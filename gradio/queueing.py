@@ -3,15 +3,17 @@ from __future__ import annotations
 import asyncio
 import copy
 import os
-import random
+import threading
 import time
 import traceback
 import uuid
-from collections import defaultdict
-from queue import Queue as ThreadQueue
+from collections import Counter, OrderedDict, defaultdict, deque
+from collections.abc import Iterator
+from queue import Empty as EmptyQueue
 from typing import TYPE_CHECKING, Literal, cast
 
 import fastapi
+import orjson
 
 from gradio import route_utils, routes, wasm_utils
 from gradio.data_classes import (
@@ -36,6 +38,7 @@ from gradio.utils import (
     run_coro_in_background,
     safe_aclose_iterator,
     safe_get_lock,
+    set_event_threadsafe,
     set_task_name,
 )
 
@@ -64,6 +67,8 @@ class Event:
         self.n_calls = 0
         self.run_time: float = 0
         self.signal = asyncio.Event()
+        self.in_queue = False
+        self.generating_started = False
 
     @property
     def streaming(self):
@@ -78,9 +83,183 @@ class Event:
         return self.run_time >= self.fn.time_limit
 
 
+def merge_generating_messages(
+    first: ProcessGeneratingMessage, second: ProcessGeneratingMessage
+) -> ProcessGeneratingMessage:
+    """
+    Merges two consecutive ProcessGeneratingMessages for the same event whose outputs are lists of
+    diffs (see `utils.diff`) into a single message, by concatenating the diffs of each output.
+    """
+    output = dict(second.output)
+    output["data"] = [
+        first_diffs + second_diffs
+        for first_diffs, second_diffs in zip(
+            first.output["data"], second.output["data"], strict=False
+        )
+    ]
+    output["changed_state_ids"] = list(
+        dict.fromkeys(
+            first.output.get("changed_state_ids", [])
+            + second.output.get("changed_state_ids", [])
+        )
+    )
+    return second.model_copy(update={"output": output})
+
+
+class CoalescingFrame:
+    """
+    A ProcessGeneratingMessage at the back of a MessageQueue that later messages for the same event
+    are merged into, until it is sent or `max_bytes` is reached.
+    """
+
+    def __init__(
+        self, message: ProcessGeneratingMessage, window: float, max_bytes: int
+    ):
+        self.message = message
+        self.deadline = time.monotonic() + window
+        self.max_bytes = max_bytes
+        self.size = len(
+            orjson.dumps(
+                message.output["data"],
+                option=orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
+            )
+        )
+
+    def add(self, message: ProcessGeneratingMessage):
+        self.message = merge_generating_messages(self.message, message)
+        self.size += len(
+            orjson.dumps(
+                message.output["data"],
+                option=orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
+            )
+        )
+
+    @property
+    def is_full(self) -> bool:
+        return self.size >= self.max_bytes
+
+
+class MessageQueue:
+    """
+    The messages waiting to be sent to a session over SSE. Messages can be put from any thread
+    (e.g. `gr.Info()` called from a function running in a worker thread) and the SSE stream of
+    the session is woken up as soon as a message arrives, rather than polling for new messages.
+
+    Intermediate outputs of events whose listener sets `coalesce_window` are put with `coalesce`,
+    in which case consecutive messages for the same event are merged into a single frame that is
+    sent at most `coalesce_window` seconds after its first message was put.
+    """
+
+    def __init__(self, coalescing_counts: Counter[str] | None = None):
+        self.messages: deque[EventMessage] = deque()
+        self.loop = asyncio.get_event_loop()
+        self.has_messages = asyncio.Event()
+        self.lock = threading.Lock()
+        self.open_frame: CoalescingFrame | None = None
+        self.coalescing_counts: Counter[str] = (
+            Counter() if coalescing_counts is None else coalescing_counts
+        )
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def put_nowait(
+        self, message: EventMessage, coalesce: tuple[float, int] | None = None
+    ):
+        """
+        Parameters:
+            message: the message to send.
+            coalesce: if provided, a (window, max_bytes) tuple. The message must be a ProcessGeneratingMessage whose output data are diffs, and may be merged with the messages for the same event that are put right before or after it.
+        """
+        with self.lock:
+            frame = self.open_frame
+            if coalesce is None:
+                self.messages.append(message)
+                self.open_frame = None
+            elif (
+                frame is not None
+                and frame.message.event_id == message.event_id
+                and not frame.is_full
+            ):
+                self.coalescing_counts["messages_in"] += 1
+                frame.add(cast(ProcessGeneratingMessage, message))
+                self.messages[-1] = frame.message
+                if not frame.is_full:
+                    # The stream is already awake, or will be once the frame's deadline is reached
+                    return
+            else:
+                self.coalescing_counts["messages_in"] += 1
+                self.coalescing_counts["frames_out"] += 1
+                self.messages.append(message)
+                self.open_frame = CoalescingFrame(
+                    cast(ProcessGeneratingMessage, message), *coalesce
+                )
+        self.wake()
+
+    def _popleft(self) -> EventMessage:
+        with self.lock:
+            message = self.messages.popleft()
+            if self.open_frame is not None and self.open_frame.message is message:
+                self.open_frame = None
+            return message
+
+    def get_nowait(self) -> EventMessage:
+        try:
+            return self._popleft()
+        except IndexError:
+            raise EmptyQueue from None
+
+    def wake(self):
+        """Wakes up the stream waiting in `get()`, even if there are no new messages."""
+        set_event_threadsafe(self.has_messages, self.loop)
+
+    async def get(self, timeout: float) -> EventMessage | None:
+        """
+        Returns the next message, waiting up to `timeout` seconds for one to arrive. Returns
+        None if the timeout expires or if `wake()` is called while there are no messages.
+        """
+        if not self.messages:
+            await self._wait(timeout)
+        # Hold an open frame back until its deadline, unless it is full or another message is
+        # put after it, so that more intermediate outputs can be merged into it.
+        frame = self.open_frame
+        while (
+            frame is not None
+            and self.open_frame is frame
+            and self.messages
+            and self.messages[0] is frame.message
+            and not frame.is_full
+            and (remaining := frame.deadline - time.monotonic()) > 0
+        ):
+            await self._wait(remaining)
+        try:
+            return self._popleft()
+        except IndexError:
+            return None
+
+    async def _wait(self, timeout: float):
+        self.has_messages.clear()
+        try:
+            await asyncio.wait_for(self.has_messages.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
 class EventQueue:
+    """
+    The events waiting to be processed for a single concurrency_id. Events are kept in arrival order
+    in `queue` and in a sub-queue per BlockFunction in `queue_per_fn`, so that a batch can be taken
+    in O(batch size). Events that are taken from the middle of `queue` (e.g. as part of a batch) are
+    only flagged as no longer `in_queue` and are dropped once they reach the front, so use
+    `len(event_queue)` and iterate over the EventQueue itself rather than over `queue`.
+    """
+
     def __init__(self, concurrency_id: str, concurrency_limit: int | None):
-        self.queue: list[Event] = []
+        self.queue: deque[Event] = deque()
+        self.queue_per_fn: dict[BlockFunction, deque[Event]] = {}
+        self.size = 0
         self.concurrency_id = concurrency_id
         self.concurrency_limit = concurrency_limit
         self.current_concurrency = 0
@@ -88,6 +267,66 @@ class EventQueue:
             set
         )
 
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Event]:
+        return (event for event in self.queue if event.in_queue)
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether there is at least one pending event and a free slot to process it."""
+        return self.size > 0 and (
+            self.concurrency_limit is None
+            or self.current_concurrency < self.concurrency_limit
+        )
+
+    def append(self, event: Event):
+        event.in_queue = True
+        self.queue.append(event)
+        if event.fn not in self.queue_per_fn:
+            self.queue_per_fn[event.fn] = deque()
+        self.queue_per_fn[event.fn].append(event)
+        self.size += 1
+
+    def pop_events(self) -> list[Event]:
+        """
+        Removes and returns the event at the front of the queue. If its function is batched, the
+        following events for the same function are returned along with it, up to `max_batch_size`.
+        """
+        while not self.queue[0].in_queue:
+            self.queue.popleft()
+        fn = self.queue.popleft().fn
+        fn_queue = self.queue_per_fn[fn]
+        max_events = fn.max_batch_size if fn.batch else 1
+        events: list[Event] = []
+        while fn_queue and len(events) < max_events:
+            event = fn_queue.popleft()
+            if event.in_queue:
+                event.in_queue = False
+                events.append(event)
+        if not fn_queue:
+            del self.queue_per_fn[fn]
+        self.size -= len(events)
+        return events
+
+    def remove(self, events: list[Event]):
+        fns = set()
+        for event in events:
+            if event.in_queue:
+                event.in_queue = False
+                self.size -= 1
+                fns.add(event.fn)
+        if not fns:
+            return
+        self.queue = deque(event for event in self.queue if event.in_queue)
+        for fn in fns:
+            fn_queue = deque(event for event in self.queue_per_fn[fn] if event.in_queue)
+            if fn_queue:
+                self.queue_per_fn[fn] = fn_queue
+            else:
+                del self.queue_per_fn[fn]
+
 
 class ProcessTime:
     def __init__(self):
@@ -111,13 +350,18 @@ class Queue:
         blocks: Blocks,
         default_concurrency_limit: int | None | Literal["not_set"] = "not_set",
     ):
-        self.pending_messages_per_session: LRUCache[str, ThreadQueue[EventMessage]] = (
-            LRUCache(2000)
-        )
+        self.pending_messages_per_session: LRUCache[str, MessageQueue] = LRUCache(2000)
+        # The number of intermediate outputs that were put in coalescing mode ("messages_in")
+        # and the number of frames they were merged into ("frames_out"), across all sessions.
+        self.coalescing_counts: Counter[str] = Counter()
         self.pending_event_ids_session: dict[str, set[str]] = {}
         self.event_ids_to_events: dict[str, Event] = {}
         self.pending_message_lock = safe_get_lock()
         self.event_queue_per_concurrency_id: dict[str, EventQueue] = {}
+        # The concurrency_ids that have pending events and a free slot, in the order they should
+        # be served. Used as an ordered set so that they are served round-robin.
+        self.ready_concurrency_ids: OrderedDict[str, None] = OrderedDict()
+        self.queue_size = 0
         self.stopped = False
         self.max_thread_count = concurrency_count
         self.update_intervals = update_intervals
@@ -128,8 +372,9 @@ class Queue:
             ProcessTime
         )
         self.live_updates = live_updates
-        self.sleep_when_free = 0.05
         self.progress_update_sleep_when_free = 0.1
+        self.processing_signal = asyncio.Event()
+        self.processing_loop: asyncio.AbstractEventLoop | None = None
         self.max_size = max_size
         self.blocks = blocks
         self._asyncio_tasks: list[asyncio.Task] = []
@@ -140,6 +385,10 @@ class Queue:
 
     def start(self):
         self.active_jobs = [None] * self.max_thread_count
+        # The signal is (re)created here so that it is bound to the event loop
+        # that runs the queue, which may change between launches.
+        self.processing_signal = asyncio.Event()
+        self.processing_loop = asyncio.get_event_loop()
 
         run_coro_in_background(self.start_processing)
         run_coro_in_background(self.start_progress_updates)
@@ -166,9 +415,23 @@ class Queue:
                 or concurrency_limit < existing_event_queue.concurrency_limit
             ):
                 existing_event_queue.concurrency_limit = concurrency_limit
+                self.update_ready_concurrency_ids(existing_event_queue)
+                self.notify_processor()
 
     def close(self):
         self.stopped = True
+        self.notify_processor()
+        # Wake up the SSE streams so that they can tell their clients the server stopped
+        for messages in list(self.pending_messages_per_session.values()):
+            messages.wake()
+
+    def notify_processor(self):
+        """
+        Wakes up `start_processing` so that it checks for events that can be started. Should be called
+        whenever an event is added to the queue, a worker is freed up, or a concurrency limit changes.
+        Safe to call from threads other than the one running the queue's event loop.
+        """
+        set_event_threadsafe(self.processing_signal, self.processing_loop)
 
     def send_message(
         self,
@@ -179,7 +442,20 @@ class Queue:
             return
         event_message.event_id = event._id
         messages = self.pending_messages_per_session[event.session_hash]
-        messages.put_nowait(event_message)
+        coalesce = None
+        if isinstance(event_message, ProcessGeneratingMessage):
+            # Only diffs can be merged, so the first intermediate output (which contains
+            # the full values) and outputs sent in the simple format are never coalesced.
+            if (
+                event.fn.coalesce_window is not None
+                and event.generating_started
+                and event_message.success
+                and event_message.output.get("render_config") is None
+                and not (event.data and event.data.simple_format)
+            ):
+                coalesce = (event.fn.coalesce_window, event.fn.coalesce_max_bytes)
+            event.generating_started = True
+        messages.put_nowait(event_message, coalesce=coalesce)
 
     def _resolve_concurrency_limit(
         self, default_concurrency_limit: int | None | Literal["not_set"]
@@ -204,10 +480,19 @@ class Queue:
             return 1
 
     def __len__(self):
-        total_len = 0
-        for event_queue in self.event_queue_per_concurrency_id.values():
-            total_len += len(event_queue.queue)
-        return total_len
+        return self.queue_size
+
+    def update_ready_concurrency_ids(self, event_queue: EventQueue):
+        """
+        Adds or removes the concurrency_id of `event_queue` from `ready_concurrency_ids`. Should be
+        called whenever the number of pending events, the current concurrency, or the concurrency
+        limit of an EventQueue changes.
+        """
+        if event_queue.is_ready:
+            if event_queue.concurrency_id not in self.ready_concurrency_ids:
+                self.ready_concurrency_ids[event_queue.concurrency_id] = None
+        else:
+            self.ready_concurrency_ids.pop(event_queue.concurrency_id, None)
 
     async def push(
         self, body: PredictBodyInternal, request: fastapi.Request, username: str | None
@@ -239,7 +524,9 @@ class Queue:
             body.session_hash = event.session_hash
         async with self.pending_message_lock:
             if body.session_hash not in self.pending_messages_per_session:
-                self.pending_messages_per_session[body.session_hash] = ThreadQueue()
+                self.pending_messages_per_session[body.session_hash] = MessageQueue(
+                    self.coalescing_counts
+                )
             if body.session_hash not in self.pending_event_ids_session:
                 self.pending_event_ids_session[body.session_hash] = set()
         self.pending_event_ids_session[body.session_hash].add(event._id)
@@ -250,7 +537,9 @@ class Queue:
             raise KeyError(
                 "Event not found in queue. If you are deploying this Gradio app with multiple replicas, please enable stickiness to ensure that all requests from the same user are routed to the same instance."
             ) from e
-        event_queue.queue.append(event)
+        event_queue.append(event)
+        self.queue_size += 1
+        self.update_ready_concurrency_ids(event_queue)
         self.event_analytics[event._id] = {
             "time": time.time(),
             "status": "queued",
@@ -259,7 +548,8 @@ class Queue:
             "session_hash": body.session_hash,
         }
 
-        self.broadcast_estimations(event.concurrency_id, len(event_queue.queue) - 1)
+        self.notify_processor()
+        self.broadcast_estimations(event.concurrency_id, len(event_queue) - 1)
         return True, event._id
 
     def _cancel_asyncio_tasks(self):
@@ -278,39 +568,32 @@ class Queue:
         return count
 
     def get_events(self) -> tuple[list[Event], bool, str] | None:
-        concurrency_ids = list(self.event_queue_per_concurrency_id.keys())
-        random.shuffle(concurrency_ids)
-        for concurrency_id in concurrency_ids:
-            event_queue = self.event_queue_per_concurrency_id[concurrency_id]
-            if len(event_queue.queue) and (
-                event_queue.concurrency_limit is None
-                or event_queue.current_concurrency < event_queue.concurrency_limit
-            ):
-                first_event = event_queue.queue[0]
-                block_fn = first_event.fn
-                events = [first_event]
-                batch = block_fn.batch
-                if batch:
-                    events += [
-                        event
-                        for event in event_queue.queue[1:]
-                        if event.fn == first_event.fn
-                    ][: block_fn.max_batch_size - 1]
-
-                for event in events:
-                    event_queue.queue.remove(event)
-
-                return events, batch, concurrency_id
+        """
+        Takes the next events to process from the least recently served concurrency_id that has both
+        pending events and a free slot. The concurrency_id is re-added to the back of
+        `ready_concurrency_ids` by `update_ready_concurrency_ids()` once its concurrency is updated.
+        """
+        if not self.ready_concurrency_ids:
+            return None
+        concurrency_id, _ = self.ready_concurrency_ids.popitem(last=False)
+        event_queue = self.event_queue_per_concurrency_id[concurrency_id]
+        events = event_queue.pop_events()
+        self.queue_size -= len(events)
+        return events, events[0].fn.batch, concurrency_id
 
     async def start_processing(self) -> None:
+        """
+        Starts events as soon as they can be processed. Rather than polling, this waits on
+        `processing_signal`, which is set by `notify_processor()` when new events are pushed,
+        when a job finishes, or when a concurrency limit changes.
+        """
         try:
             while not self.stopped:
-                if len(self) == 0:
-                    await asyncio.sleep(self.sleep_when_free)
-                    continue
-
-                if None not in self.active_jobs:
-                    await asyncio.sleep(self.sleep_when_free)
+                # Clear the signal before inspecting the queue so that any notification
+                # that arrives after the checks below is not lost.
+                self.processing_signal.clear()
+                if not self.ready_concurrency_ids or None not in self.active_jobs:
+                    await self.processing_signal.wait()
                     continue
 
                 # Using mutex to avoid editing a list in use
@@ -322,6 +605,7 @@ class Queue:
                     self.active_jobs[self.active_jobs.index(None)] = events
                     event_queue = self.event_queue_per_concurrency_id[concurrency_id]
                     event_queue.current_concurrency += 1
+                    self.update_ready_concurrency_ids(event_queue)
                     start_time = time.time()
                     event_queue.start_times_per_fn[events[0].fn].add(start_time)
                     for event in events:
@@ -341,7 +625,7 @@ class Queue:
                     if self.live_updates:
                         self.broadcast_estimations(concurrency_id)
                 else:
-                    await asyncio.sleep(self.sleep_when_free)
+                    await self.processing_signal.wait()
         finally:
             self.stopped = True
             self._cancel_asyncio_tasks()
@@ -422,16 +706,16 @@ class Queue:
                         job.alive = False
 
         async with self.delete_lock:
-            events_to_remove: list[Event] = []
             for event_queue in self.event_queue_per_concurrency_id.values():
-                for event in event_queue.queue:
-                    if event.session_hash == session_hash or event._id == event_id:
-                        events_to_remove.append(event)
-
-            for event in events_to_remove:
-                self.event_queue_per_concurrency_id[event.concurrency_id].queue.remove(
+                events_to_remove = [
                     event
-                )
+                    for event in event_queue
+                    if event.session_hash == session_hash or event._id == event_id
+                ]
+                if events_to_remove:
+                    event_queue.remove(events_to_remove)
+                    self.queue_size -= len(events_to_remove)
+                    self.update_ready_concurrency_ids(event_queue)
 
     async def notify_clients(self) -> None:
         """
@@ -469,7 +753,7 @@ class Queue:
                     time_of_first_completion - time.time(), 0
                 )
 
-        for rank, event in enumerate(event_queue.queue):
+        for rank, event in enumerate(event_queue):
             process_time_for_fn = (
                 self.process_time_per_fn[event.fn].avg_time
                 if event.fn in self.process_time_per_fn
@@ -494,7 +778,7 @@ class Queue:
                 self.send_message(
                     event,
                     EstimationMessage(
-                        rank=rank, rank_eta=rank_eta, queue_size=len(event_queue.queue)
+                        rank=rank, rank_eta=rank_eta, queue_size=len(event_queue)
                     ),
                 )
             if event_queue.concurrency_limit is None:
@@ -775,6 +1059,7 @@ class Queue:
         finally:
             event_queue = self.event_queue_per_concurrency_id[events[0].concurrency_id]
             event_queue.current_concurrency -= 1
+            self.update_ready_concurrency_ids(event_queue)
             start_times = event_queue.start_times_per_fn[fn]
             if begin_time in start_times:
                 start_times.remove(begin_time)
@@ -786,6 +1071,7 @@ class Queue:
                 # without putting the `events` into `self.active_jobs`.
                 # https://github.com/gradio-app/gradio/blob/f09aea34d6bd18c1e2fef80c86ab2476a6d1dd83/gradio/routes.py#L594-L596
                 pass
+            self.notify_processor()
             for event in events:
                 # Always reset the state of the iterator
                 # If the job finished successfully, this has no effect
@@ -3,21 +3,24 @@ from __future__ import annotations
 import asyncio
 import functools
 import hashlib
+import heapq
 import hmac
 import json
+import math
+import mmap
 import os
 import pickle
 import re
 import shutil
 import threading
+import time
 import uuid
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from collections.abc import AsyncGenerator, Callable
 from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass as python_dataclass
-from datetime import datetime
 from pathlib import Path
-from tempfile import NamedTemporaryFile, _TemporaryFileWrapper
+from tempfile import NamedTemporaryFile, _TemporaryFileWrapper, mkstemp
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -38,7 +41,7 @@ from starlette.formparsers import MultiPartException, MultipartPart
 from starlette.responses import PlainTextResponse, Response
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from gradio import processing_utils, utils
+from gradio import processing_utils, utils, wasm_utils
 from gradio.data_classes import (
     BlocksConfigDict,
     MediaStreamChunk,
@@ -376,6 +379,8 @@ async def call_process_api(
                 stream.end_stream()
         raise
 
+    if session_hash is not None:
+        app.state_holder.save(session_hash)
     if batch_in_single_out:
         output["data"] = output["data"][0]
     return output
@@ -930,48 +935,209 @@ class CustomCORSMiddleware:
         headers.add_vary_header("Origin")
 
 
-def delete_files_created_by_app(blocks: Blocks, age: int | None) -> None:
-    """Delete files that are older than age. If age is None, delete all files."""
+class TempFileSet(set):
+    """
+    The set of paths of the files that a block has saved to the cache. The paths are also
+    recorded in the order in which they were added, so that a CacheIndex can pick up new
+    files without scanning every set.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.added: deque[str] = deque(self)
+
+    def add(self, element: str):
+        if element not in self:
+            self.added.append(element)
+        super().add(element)
+
+
+@python_dataclass
+class CacheEntry:
+    size: int
+    last_access: float
+    # The last access time with which this file was pushed to the expiry heap, if it is in it
+    heap_time: float | None
+    # The temp file sets that contain this file
+    temp_sets: list[set[str]]
+
+
+class CacheIndex:
+    """
+    Tracks the size, last access time and owners of every file in the temp file sets of a
+    Blocks, so that expired files can be deleted from a heap ordered by expiry time and the
+    least recently used files can be deleted to keep the cache under a maximum size, without
+    scanning every file on every tick. The cache directory is shared by every Blocks and
+    process, so the index only holds the files that this Blocks saved to the cache, and only
+    deletes these.
+    """
+
+    def __init__(self):
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()  # in LRU order
+        self.expiry_heap: list[tuple[float, str]] = []
+        self.total_size = 0
+        self.lock = threading.Lock()
+
+    def sync(self, temp_file_sets: list[set[str]]):
+        """Adds the files that were added to the temp file sets since the last sync."""
+        with self.lock:
+            for temp_set in temp_file_sets:
+                added = getattr(temp_set, "added", None)
+                if added is None:
+                    new_files = [f for f in temp_set if f not in self.entries]
+                else:
+                    new_files = [added.popleft() for _ in range(len(added))]
+                for file in new_files:
+                    if file in temp_set:
+                        self._add(file, temp_set)
+
+    def add_file(self, file: str | Path, temp_file_sets: list[set[str]]):
+        """Adds a file that was only written after it was added to the temp file sets (e.g. an
+        image whose encoding was deferred until it was requested), so was skipped by sync()."""
+        with self.lock:
+            for temp_set in temp_file_sets:
+                if str(file) in temp_set:
+                    self._add(str(file), temp_set)
+
+    def _add(self, file: str, temp_set: set[str]):
+        entry = self.entries.get(file)
+        if entry is None:
+            try:
+                stat = os.lstat(file)
+            except FileNotFoundError:
+                return
+            entry = CacheEntry(
+                size=stat.st_size,
+                last_access=stat.st_ctime,
+                heap_time=None,
+                temp_sets=[],
+            )
+            self.entries[file] = entry
+            self.total_size += entry.size
+        if entry.heap_time is None:
+            self._push(entry.last_access, file, entry)
+        if not any(s is temp_set for s in entry.temp_sets):
+            entry.temp_sets.append(temp_set)
+
+    def _push(self, heap_time: float, file: str, entry: CacheEntry):
+        entry.heap_time = heap_time
+        heapq.heappush(self.expiry_heap, (heap_time, file))
+
+    def touch(self, file: str | Path):
+        """Marks a file as recently used, e.g. because it was requested through /file=."""
+        with self.lock:
+            entry = self.entries.get(str(file))
+            if entry is not None:
+                entry.last_access = time.time()
+                self.entries.move_to_end(str(file))
+
+    def _delete(self, file: str):
+        entry = self.entries.pop(file)
+        self.total_size -= entry.size
+        for temp_set in entry.temp_sets:
+            temp_set.discard(file)
+        try:
+            os.remove(file)
+        except FileNotFoundError:
+            pass
+        processing_utils.delete_media_metadata(file)
+        # The full resolution images of gallery thumbnails are written next to them
+        processing_utils.discard_deferred_images(Path(file).parent)
+
+    def delete_expired(self, age: float, dont_delete: set[str]):
+        """Deletes the files that were not accessed in the last `age` seconds."""
+        now = time.time()
+        with self.lock:
+            while self.expiry_heap and self.expiry_heap[0][0] + age < now:
+                heap_time, file = heapq.heappop(self.expiry_heap)
+                entry = self.entries.get(file)
+                if entry is None or entry.heap_time != heap_time:
+                    continue  # the file was deleted (and possibly re-added) since
+                if entry.last_access > heap_time:
+                    # accessed since it was pushed, so check again once it expires
+                    self._push(entry.last_access, file, entry)
+                elif file in dont_delete:
+                    self._push(now, file, entry)
+                else:
+                    self._delete(file)
+
+    def delete_least_recently_used(self, max_bytes: int, dont_delete: set[str]):
+        """Deletes the least recently used files until the cache is under `max_bytes`."""
+        with self.lock:
+            excess = self.total_size - max_bytes
+            to_delete = []
+            for file, entry in self.entries.items():
+                if excess <= 0:
+                    break
+                if file not in dont_delete:
+                    to_delete.append(file)
+                    excess -= entry.size
+            for file in to_delete:
+                self._delete(file)
+
+    def delete_all(self, dont_delete: set[str]):
+        """Deletes every file in the temp file sets (e.g. when the server shuts down)."""
+        with self.lock:
+            for file in [file for file in self.entries if file not in dont_delete]:
+                self._delete(file)
+
+
+def delete_files_created_by_app(
+    blocks: Blocks, age: int | None, max_bytes: int | None = None
+) -> None:
+    """Delete files that have not been accessed for more than age seconds, and the least
+    recently used files if the cache is larger than max_bytes. If age is None, delete all files.
+    """
     dont_delete = set()
     for component in blocks.blocks.values():
         dont_delete.update(getattr(component, "keep_in_cache", set()))
-    for temp_set in blocks.temp_file_sets:
-        # We use a copy of the set to avoid modifying the set while iterating over it
-        # otherwise we would get an exception: Set changed size during iteration
-        to_remove = set()
-        for file in temp_set:
-            if file in dont_delete:
-                continue
-            try:
-                file_path = Path(file)
-                modified_time = datetime.fromtimestamp(file_path.lstat().st_ctime)
-                if age is None or (datetime.now() - modified_time).seconds > age:
-                    os.remove(file)
-                    to_remove.add(file)
-            except FileNotFoundError:
-                continue
-        temp_set -= to_remove
+    if blocks.cache_index is None:
+        blocks.cache_index = CacheIndex()
+    cache_index = blocks.cache_index
+    cache_index.sync(blocks.temp_file_sets)
+    if age is None:
+        cache_index.delete_all(dont_delete)
+    else:
+        cache_index.delete_expired(age, dont_delete)
+        if max_bytes is not None:
+            cache_index.delete_least_recently_used(max_bytes, dont_delete)
 
 
-async def delete_files_on_schedule(app: App, frequency: int, age: int) -> None:
-    """Startup task to delete files created by the app based on time since last modification."""
+async def delete_files_on_schedule(
+    app: App, frequency: int, age: int, max_bytes: int | None = None
+) -> None:
+    """Startup task to delete files created by the app based on time since last access."""
     while True:
         await asyncio.sleep(frequency)
         await anyio.to_thread.run_sync(
-            delete_files_created_by_app, app.get_blocks(), age
+            delete_files_created_by_app, app.get_blocks(), age, max_bytes
         )
 
 
 @asynccontextmanager
 async def _lifespan_handler(
-    app: App, frequency: int = 1, age: int = 1
+    app: App, frequency: int = 1, age: int = 1, max_bytes: int | None = None
 ) -> AsyncGenerator:
     """A context manager that triggers the startup and shutdown events of the app."""
-    asyncio.create_task(delete_files_on_schedule(app, frequency, age))
+    asyncio.create_task(delete_files_on_schedule(app, frequency, age, max_bytes))
     yield
     delete_files_created_by_app(app.get_blocks(), age=None)
 
 
+async def _expire_deferred_images():
+    """Drop the deferred images that were not requested in time every minute."""
+    while True:
+        await asyncio.sleep(60)
+        processing_utils.expire_deferred_images()
+
+
+@asynccontextmanager
+async def _expire_deferred_images_handler():
+    """When the server launches, regularly drop the expired deferred images."""
+    asyncio.create_task(_expire_deferred_images())
+    yield
+
+
 async def _delete_state(app: App):
     """Delete all expired state every second."""
     while True:
@@ -990,6 +1156,7 @@ def create_lifespan_handler(
     user_lifespan: Callable[[App], AbstractAsyncContextManager] | None,
     frequency: int | None = 1,
     age: int | None = 1,
+    max_bytes: int | None = None,
 ) -> Callable[[App], AbstractAsyncContextManager]:
     """Return a context manager that applies _lifespan_handler and user_lifespan if it exists."""
 
@@ -997,8 +1164,11 @@ def create_lifespan_handler(
     async def _handler(app: App):
         async with AsyncExitStack() as stack:
             await stack.enter_async_context(_delete_state_handler(app))
+            await stack.enter_async_context(_expire_deferred_images_handler())
             if frequency and age:
-                await stack.enter_async_context(_lifespan_handler(app, frequency, age))
+                await stack.enter_async_context(
+                    _lifespan_handler(app, frequency, age, max_bytes)
+                )
             if user_lifespan is not None:
                 await stack.enter_async_context(user_lifespan(app))
             yield
@@ -1006,26 +1176,211 @@ def create_lifespan_handler(
     return _handler
 
 
+@python_dataclass
+class MediaStreamSegment:
+    duration: float
+    extension: str
+    # The data of the segment, if it is not in the file of the stream
+    data: bytes | None = None
+    # Otherwise, the position of the data of the segment in the file of the stream
+    offset: int = 0
+    length: int = 0
+
+
 class MediaStream:
-    def __init__(self, desired_output_format: str | None = None):
-        self.segments: list[MediaStreamChunk] = []
+    """
+    The segments of a streamed audio or video output and the HLS playlist that lists them.
+
+    If a `cache_dir` is provided, the data of the segments is appended to a file in it instead
+    of being kept in memory, and is read back through a memory map when a segment is
+    requested. If a `window_size` is provided (or the GRADIO_STREAM_WINDOW_SEGMENTS environment
+    variable is set), the playlist is a live playlist that only lists the last `window_size`
+    segments, and the older segments are dropped, so that neither the playlist nor the data
+    of the stream grows with its length. The file of the stream is then rewritten without
+    the data of the dropped segments once it is at least as large as that of the others.
+    """
+
+    def __init__(
+        self,
+        desired_output_format: str | None = None,
+        cache_dir: str | Path | None = None,
+        window_size: int | None = None,
+    ):
+        self.segments: dict[str, MediaStreamSegment] = {}  # by id, in order
         self.combined_file: str | None = None
         self.ended = False
-        self.segment_index = 0
-        self.playlist = "#EXTM3U\n#EXT-X-PLAYLIST-TYPE:EVENT\n#EXT-X-TARGETDURATION:10\n#EXT-X-VERSION:4\n#EXT-X-MEDIA-SEQUENCE:0\n"
+        self.closed = False
         self.max_duration = 5
         self.desired_output_format = desired_output_format
+        if window_size is None and os.getenv("GRADIO_STREAM_WINDOW_SEGMENTS"):
+            window_size = int(os.environ["GRADIO_STREAM_WINDOW_SEGMENTS"])
+        self.window_size = window_size
+        self.media_sequence = 0
+        self.discontinuity_sequence = 0
+        # The lines of the segments in the playlist, and whether they end with a discontinuity
+        self.playlist_entries: deque[tuple[str, bool]] = deque()
+        self._playlist: str | None = None
+        self.path: str | None = None
+        self._file = None
+        self._size = 0
+        # The size of the data of the dropped segments at the start of the file
+        self._dropped_size = 0
+        self._map: mmap.mmap | None = None
+        self._map_lock = threading.Lock()
+        if cache_dir is not None:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            fd, self.path = mkstemp(dir=cache_dir, prefix="stream-", suffix=".bin")
+            self._file = os.fdopen(fd, "ab")
 
     async def add_segment(self, data: MediaStreamChunk | None):
-        if not data:
+        if not data or self.closed:
             return
 
         segment_id = str(uuid.uuid4())
-        self.segments.append({"id": segment_id, **data})
-        self.max_duration = max(self.max_duration, data["duration"]) + 1
+        segment = MediaStreamSegment(
+            duration=data["duration"], extension=data["extension"]
+        )
+        if self.path is None:
+            segment.data = data["data"]
+        else:
+            segment.offset = self._size
+            segment.length = len(data["data"])
+            if wasm_utils.IS_WASM:
+                self._append(data["data"])
+            else:
+                await anyio.to_thread.run_sync(self._append, data["data"])
+            self._size += segment.length
+        self.segments[segment_id] = segment
+        self.max_duration = max(self.max_duration, math.ceil(data["duration"]) + 1)
+
+        # HLS expects the start time of the video segments to be continuous
+        # Instead of re-encoding the user video chunks, we add a discontinuity tag
+        discontinuity = segment.extension == ".ts"
+        entry = f"#EXTINF:{segment.duration:.3f},\n{segment_id}{segment.extension}\n"
+        if discontinuity:
+            entry += "#EXT-X-DISCONTINUITY\n"
+        self.playlist_entries.append((entry, discontinuity))
+        if self.window_size is not None:
+            while len(self.playlist_entries) > self.window_size:
+                _, removed_discontinuity = self.playlist_entries.popleft()
+                self.media_sequence += 1
+                self.discontinuity_sequence += removed_discontinuity
+                self._drop_segment(next(iter(self.segments)))
+            if self.path is not None and self._dropped_size >= max(
+                self._size - self._dropped_size, 1
+            ):
+                if wasm_utils.IS_WASM:
+                    self._compact()
+                else:
+                    await anyio.to_thread.run_sync(self._compact)
+        self._playlist = None
+
+    def _drop_segment(self, segment_id: str):
+        segment = self.segments.pop(segment_id)
+        with self._map_lock:
+            segment.data = None
+            self._dropped_size += segment.length
+            segment.length = 0
+
+    def _compact(self):
+        """Rewrites the file of the stream without the data of the dropped segments, which
+        is all at its start, as the oldest segments are dropped first."""
+        start = self._dropped_size
+        fd, temp_path = mkstemp(dir=Path(self.path).parent, prefix="stream-")  # type: ignore
+        try:
+            with os.fdopen(fd, "wb") as dst, open(self.path, "rb") as src:  # type: ignore
+                src.seek(start)
+                shutil.copyfileobj(src, dst)
+            with self._map_lock:
+                if self._map is not None:
+                    self._map.close()
+                    self._map = None
+                os.replace(temp_path, self.path)  # type: ignore
+                for segment in self.segments.values():
+                    segment.offset -= start
+                self._size -= start
+                self._dropped_size = 0
+                if self._file is not None:
+                    self._file.close()
+                    self._file = open(self.path, "ab")  # type: ignore
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def _append(self, data: bytes):
+        if self._file is None:
+            # The stream was ended before this segment was added, so the file is not kept
+            # open, as nothing would close it again
+            with open(self.path, "ab") as f:  # type: ignore
+                f.write(data)
+            return
+        self._file.write(data)
+        self._file.flush()
+
+    def get_segment(self, segment_id: str) -> MediaStreamSegment | None:
+        return self.segments.get(segment_id)
+
+    def read_segment(self, segment: MediaStreamSegment) -> bytes:
+        if segment.data is not None:
+            return segment.data
+        with self._map_lock:
+            # The segment is read under the lock, as its offset changes when the file of the
+            # stream is compacted (and its length is 0 once it is dropped)
+            if segment.length == 0:
+                return b""
+            end = segment.offset + segment.length
+            if not self.ended:
+                if self._map is None or len(self._map) < end:
+                    # Map the file again, as it has grown since it was last mapped
+                    if self._map is not None:
+                        self._map.close()
+                    with open(self.path, "rb") as f:  # type: ignore
+                        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                return self._map[segment.offset : end]
+            # Once the stream has ended, its file no longer grows and is read without keeping
+            # a map (and a file descriptor) open for as long as the stream is kept
+            with open(self.path, "rb") as f:  # type: ignore
+                f.seek(segment.offset)
+                return f.read(segment.length)
+
+    def read_segments(self) -> list[bytes]:
+        return [self.read_segment(segment) for segment in self.segments.values()]
+
+    def playlist(self) -> str:
+        """Returns the HLS playlist of the stream. It is only rebuilt after a segment is added
+        or the stream ends, not every time it is polled."""
+        if self._playlist is None:
+            playlist = "#EXTM3U\n"
+            if self.window_size is None:
+                playlist += "#EXT-X-PLAYLIST-TYPE:EVENT\n"
+            playlist += f"#EXT-X-TARGETDURATION:{self.max_duration}\n#EXT-X-VERSION:4\n#EXT-X-MEDIA-SEQUENCE:{self.media_sequence}\n"
+            if self.discontinuity_sequence:
+                playlist += (
+                    f"#EXT-X-DISCONTINUITY-SEQUENCE:{self.discontinuity_sequence}\n"
+                )
+            playlist += "".join(entry for entry, _ in self.playlist_entries)
+            if self.ended:
+                playlist += "#EXT-X-ENDLIST\n"
+            self._playlist = playlist
+        return self._playlist
 
     def end_stream(self):
         self.ended = True
+        self._playlist = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        with self._map_lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def close(self):
+        """Ends the stream and deletes the file of its segments."""
+        self.closed = True
+        self.end_stream()
+        if self.path is not None:
+            Path(self.path).unlink(missing_ok=True)
 
 
 def create_url_safe_hash(data: bytes, digest_size=8):
@@ -20,7 +20,6 @@ import traceback
 import warnings
 from collections.abc import AsyncIterator, Callable
 from pathlib import Path
-from queue import Empty as EmptyQueue
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -30,9 +29,11 @@ from typing import (
     cast,
 )
 
+import anyio
 import fastapi
 import httpx
 import markupsafe
+import numpy as np
 import orjson
 from fastapi import (
     APIRouter,
@@ -63,9 +64,9 @@ from starlette.datastructures import UploadFile as StarletteUploadFile
 from starlette.responses import RedirectResponse
 
 import gradio
-from gradio import ranged_response, route_utils, utils, wasm_utils
+from gradio import processing_utils, ranged_response, route_utils, utils, wasm_utils
 from gradio.brotli_middleware import BrotliMiddleware
-from gradio.context import Context
+from gradio.context import Context, LocalContext
 from gradio.data_classes import (
     CancelBody,
     ComponentServerBlobBody,
@@ -190,6 +191,17 @@ def toorjson(value):
     )
 
 
+def numpy_to_list(value):
+    """
+    The `default` of `json.dumps` for the numpy arrays that components return to keep their
+    data in a buffer (e.g. the rows of a plot), which orjson serializes natively. NaN values
+    are written as null, like orjson does, rather than as a bare NaN, which is not valid JSON.
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return utils.ndarray_to_list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 templates = Jinja2Templates(directory=STATIC_TEMPLATE_LIB)
 templates.env.filters["toorjson"] = toorjson
 
@@ -991,6 +1003,11 @@ class App(FastAPI):
                 raise HTTPException(403, f"File not allowed: {path_or_url}.")
 
             abs_path = utils.abspath(path_or_url)
+            if (
+                await processing_utils.async_encode_deferred_image(abs_path)
+                and blocks.cache_index is not None
+            ):
+                blocks.cache_index.add_file(abs_path, blocks.temp_file_sets)
             # Catch potential permission errors to not display the full traceback
             # see https://github.com/gradio-app/gradio/issues/11194
             try:
@@ -1009,6 +1026,8 @@ class App(FastAPI):
             )
             if not allowed:
                 raise HTTPException(403, f"File not allowed: {path_or_url}.")
+            if blocks.cache_index is not None:
+                blocks.cache_index.touch(abs_path)
 
             mime_type, _ = mimetypes.guess_type(abs_path)
             if mime_type in XSS_SAFE_MIMETYPES or reason == "allowed":
@@ -1088,21 +1107,8 @@ class App(FastAPI):
             if not stream:
                 return Response(status_code=404)
 
-            playlist = f"#EXTM3U\n#EXT-X-PLAYLIST-TYPE:EVENT\n#EXT-X-TARGETDURATION:{stream.max_duration}\n#EXT-X-VERSION:4\n#EXT-X-MEDIA-SEQUENCE:0\n"
-
-            for segment in stream.segments:
-                playlist += f"#EXTINF:{segment['duration']:.3f},\n"
-                playlist += f"{segment['id']}{segment['extension']}\n"  # type: ignore
-                # HLS expects the start time of the video segments to be continuous
-                # Instead of re-encoding the user video chunks, we add a discontinuity tag
-                if segment["extension"] == ".ts":
-                    playlist += "#EXT-X-DISCONTINUITY\n"
-
-            if stream.ended:
-                playlist += "#EXT-X-ENDLIST\n"
-
             return Response(
-                content=playlist, media_type="application/vnd.apple.mpegurl"
+                content=stream.playlist(), media_type="application/vnd.apple.mpegurl"
             )
 
         @router.get("/stream/{session_hash}/{run}/{component_id}/{segment_id}.{ext}")
@@ -1121,15 +1127,23 @@ class App(FastAPI):
             if not stream:
                 return Response(status_code=404, content="Stream not found")
 
-            segment = next((s for s in stream.segments if s["id"] == segment_id), None)  # type: ignore
+            segment = stream.get_segment(segment_id)
 
             if segment is None:
                 return Response(status_code=404, content="Segment not found")
 
+            blocks = app.get_blocks()
+            if stream.path is not None and blocks.cache_index is not None:
+                blocks.cache_index.touch(stream.path)
+            data = (
+                stream.read_segment(segment)
+                if wasm_utils.IS_WASM
+                else await anyio.to_thread.run_sync(stream.read_segment, segment)
+            )
             if ext == "aac":
-                return Response(content=segment["data"], media_type="audio/aac")
+                return Response(content=data, media_type="audio/aac")
             else:
-                return Response(content=segment["data"], media_type="video/MP2T")
+                return Response(content=data, media_type="video/MP2T")
 
         @router.get("/stream/{session_hash}/{run}/{component_id}/playlist-file")
         async def _(session_hash: str, run: int, component_id: int):
@@ -1144,7 +1158,11 @@ class App(FastAPI):
                 return Response(status_code=404)
 
             if not stream.combined_file:
-                stream_data = [s["data"] for s in stream.segments]
+                stream_data = (
+                    stream.read_segments()
+                    if wasm_utils.IS_WASM
+                    else await anyio.to_thread.run_sync(stream.read_segments)
+                )
                 combined_file = (
                     await app.get_blocks()
                     .get_component(component_id)
@@ -1225,6 +1243,7 @@ class App(FastAPI):
                         # This will mark the state to be deleted in an hour
                         if session_hash in app.state_holder.session_data:
                             app.state_holder.session_data[session_hash].is_closed = True
+                        app.get_blocks().discard_streams(session_hash)
                         for (
                             event_id
                         ) in app.get_blocks()._queue.pending_event_ids_session.get(
@@ -1391,7 +1410,7 @@ class App(FastAPI):
                     data = message.message
                 else:
                     return None
-                return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+                return f"event: {event}\ndata: {json.dumps(data, default=numpy_to_list)}\n\n"
 
             return await queue_data_helper(request, event_id, process_msg)
 
@@ -1401,7 +1420,7 @@ class App(FastAPI):
             session_hash: str,
         ):
             def process_msg(message: EventMessage) -> str:
-                return f"data: {orjson.dumps(message.model_dump(), default=str).decode('utf-8')}\n\n"
+                return f"data: {orjson.dumps(message.model_dump(), option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode('utf-8')}\n\n"
 
             return await queue_data_helper(request, session_hash, process_msg)
 
@@ -1414,7 +1433,9 @@ class App(FastAPI):
 
             async def sse_stream(request: fastapi.Request):
                 try:
-                    last_heartbeat = time.perf_counter()
+                    heartbeat_rate = 15
+                    loop = asyncio.get_running_loop()
+                    next_heartbeat = loop.time() + heartbeat_rate
                     while True:
                         if await request.is_disconnected():
                             await blocks._queue.clean_events(session_hash=session_hash)
@@ -1428,23 +1449,22 @@ class App(FastAPI):
                                 status_code=status.HTTP_404_NOT_FOUND,
                             )
 
-                        heartbeat_rate = 15
-                        check_rate = 0.05
-                        message = None
-                        try:
-                            messages = blocks._queue.pending_messages_per_session[
-                                session_hash
-                            ]
-                            message = messages.get_nowait()
-                        except EmptyQueue:
-                            await asyncio.sleep(check_rate)
-                            if time.perf_counter() - last_heartbeat > heartbeat_rate:
-                                # Fix this
-                                message = HeartbeatMessage()
-                                # Need to reset last_heartbeat with perf_counter
-                                # otherwise only a single hearbeat msg will be sent
-                                # and then the stream will retry leading to infinite queue 😬
-                                last_heartbeat = time.perf_counter()
+                        messages = blocks._queue.pending_messages_per_session[
+                            session_hash
+                        ]
+                        # Rather than polling, wait until a message is put for this session,
+                        # the queue is stopped, or it is time to send the next heartbeat.
+                        message = (
+                            None
+                            if blocks._queue.stopped
+                            else await messages.get(
+                                timeout=max(next_heartbeat - loop.time(), 0)
+                            )
+                        )
+                        if message is None and loop.time() >= next_heartbeat:
+                            message = HeartbeatMessage()
+                        if message is not None:
+                            next_heartbeat = loop.time() + heartbeat_rate
 
                         if blocks._queue.stopped:
                             message = UnexpectedErrorMessage(
@@ -1455,6 +1475,9 @@ class App(FastAPI):
                             response = process_msg(message)
                             if response is not None:
                                 yield response
+                            if isinstance(message, UnexpectedErrorMessage):
+                                # The queue has stopped, so no more messages will be put
+                                return
                             if (
                                 isinstance(message, ProcessCompletedMessage)
                                 and message.event_id
@@ -1574,6 +1597,8 @@ class App(FastAPI):
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Function not found.",
                 )
+            LocalContext.blocks.set(app.get_blocks())
+            LocalContext.session_hash.set(body.session_hash)
             if inspect.iscoroutinefunction(fn):
                 return await fn(body.data)
             else:
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import datetime
 import os
+import pickle
+import sqlite3
+import sys
+import tempfile
 import threading
-from collections import OrderedDict
+import uuid
+import warnings
+from collections import Counter, OrderedDict
 from collections.abc import Iterator
 from copy import copy, deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -13,39 +20,313 @@ if TYPE_CHECKING:
     from gradio.components import State
 
 
+class StateBackend:
+    """
+    Stores the pickled `state_data` of sessions that no longer fit in the memory of the
+    StateHolder, so that they can be restored when the session is used again instead of being
+    lost. Subclass this to store sessions in an external store.
+
+    If `shared` is True, the backend is assumed to be shared between several worker processes:
+    the state of a session is written to the backend after every event and reloaded from the
+    backend when the session is used after another worker saved it, so that any worker can
+    serve any session. Shared backends have to implement `version`.
+    """
+
+    shared = False
+
+    def load(self, session_id: str) -> bytes | None:
+        raise NotImplementedError
+
+    def save(self, session_id: str, data: bytes) -> str | None:
+        """Saves the state of a session. Returns its new `version` if the backend is shared."""
+        raise NotImplementedError
+
+    def version(self, session_id: str) -> str | None:
+        """
+        Returns the version of the saved state of a session, which changes every time it is
+        saved, or None if it is not saved. Only used if the backend is shared.
+        """
+        raise NotImplementedError
+
+    def delete(self, session_id: str):
+        raise NotImplementedError
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.load(session_id) is not None
+
+
+class InMemoryStateBackend(StateBackend):
+    """
+    Keeps spilled sessions in memory in their (compact) pickled form, and drops the least
+    recently used ones once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 2**30):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.data: OrderedDict[str, bytes] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def load(self, session_id: str) -> bytes | None:
+        with self.lock:
+            if session_id not in self.data:
+                return None
+            self.data.move_to_end(session_id)
+            return self.data[session_id]
+
+    def save(self, session_id: str, data: bytes):
+        with self.lock:
+            if session_id in self.data:
+                self.size -= len(self.data.pop(session_id))
+            self.data[session_id] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and self.data:
+                _, dropped = self.data.popitem(last=False)
+                self.size -= len(dropped)
+
+    def delete(self, session_id: str):
+        with self.lock:
+            if session_id in self.data:
+                self.size -= len(self.data.pop(session_id))
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self.data
+
+
+class SQLiteStateBackend(StateBackend):
+    """
+    Spills sessions to a local sqlite database. If several worker processes are given the same
+    `path` and `shared=True`, they share the state of every session (e.g. as a stand-in for an
+    external store when running several workers behind a load balancer on one machine).
+    """
+
+    def __init__(self, path: str | Path | None = None, shared: bool = False):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="gradio_state_", suffix=".sqlite3")
+            os.close(fd)
+        self.path = str(path)
+        self.shared = shared
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(session_id TEXT PRIMARY KEY, data BLOB NOT NULL, version TEXT NOT NULL)"
+            )
+
+    def load(self, session_id: str) -> bytes | None:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, session_id: str, data: bytes) -> str:
+        version = uuid.uuid4().hex
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, data, version) "
+                "VALUES (?, ?, ?)",
+                (session_id, data, version),
+            )
+        return version
+
+    def version(self, session_id: str) -> str | None:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, session_id: str):
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+
+    def __contains__(self, session_id: str) -> bool:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+
+def estimate_size(obj: Any, seen: set[int] | None = None) -> int:
+    """
+    Returns an estimate of the memory used by `obj` and the objects it contains, in bytes.
+    Arrays (and other objects that have an `nbytes` attribute) are not traversed.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += estimate_size(key, seen) + estimate_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += estimate_size(item, seen)
+    return size
+
+
 class StateHolder:
-    def __init__(self):
+    """
+    Holds the SessionState of every session. Once more than `capacity` sessions are held, or
+    the estimated size of the held sessions exceeds `memory_budget` bytes, the least recently
+    used sessions are removed from memory. If a `backend` is set, their `state_data` is spilled
+    to it and restored when the session is used again; otherwise it is dropped.
+
+    `stats` counts "hits" and "misses" (sessions that were or were not held in memory when
+    they were used), "spills", "restores" and "drops" for monitoring.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int | None = None,
+        backend: StateBackend | None = None,
+    ):
         self.capacity = 10000
+        self.memory_budget = memory_budget
+        self.backend = backend
         self.session_data: OrderedDict[str, SessionState] = OrderedDict()
+        self.session_sizes: dict[str, int] = {}
+        # The versions of the sessions in a shared backend that the held sessions are at
+        self.session_versions: dict[str, str | None] = {}
+        self.total_size = 0
         self.time_last_used: dict[str, datetime.datetime] = {}
+        self.stats: Counter[str] = Counter()
         self.lock = threading.Lock()
 
     def set_blocks(self, blocks: Blocks):
         self.blocks = blocks
         blocks.state_holder = self
         self.capacity = blocks.state_session_capacity
+        self.memory_budget = blocks.state_memory_budget
+        self.backend = blocks.state_backend
 
     def __getitem__(self, session_id: str) -> SessionState:
         if session_id not in self.session_data:
-            self.session_data[session_id] = SessionState(self.blocks)
+            self.stats["misses"] += 1
+            session_state = SessionState(self.blocks)
+            if self._restore(session_id, session_state):
+                self.stats["restores"] += 1
+            self.session_data[session_id] = session_state
+        else:
+            self.stats["hits"] += 1
+            if (
+                self.backend is not None
+                and self.backend.shared
+                and self.backend.version(session_id)
+                != self.session_versions.get(session_id)
+            ):
+                # Another worker saved the session since it was loaded or saved here. The
+                # session is not reloaded otherwise, so that the state of an event that is
+                # still running here (e.g. a generator) is not overwritten
+                self._restore(session_id, self.session_data[session_id])
         self.update(session_id)
         self.time_last_used[session_id] = datetime.datetime.now()
         return self.session_data[session_id]
 
     def __contains__(self, session_id: str):
-        return session_id in self.session_data
+        return session_id in self.session_data or (
+            self.backend is not None and session_id in self.backend
+        )
 
-    def update(self, session_id: str):
+    def update(self, session_id: str, resize: bool = False):
+        """
+        Marks the session as the most recently used one and removes the least recently used
+        sessions from memory if needed. The size of the session is only estimated again if
+        `resize` is True (i.e. after it changed) or it is not known yet, as this walks the
+        whole `state_data` of the session.
+        """
         with self.lock:
             if session_id in self.session_data:
                 self.session_data.move_to_end(session_id)
-            if len(self.session_data) > self.capacity:
-                self.session_data.popitem(last=False)
+                if self.memory_budget is not None and (
+                    resize or session_id not in self.session_sizes
+                ):
+                    self._set_size(
+                        session_id, self.session_data[session_id].estimated_size()
+                    )
+            while len(self.session_data) > self.capacity or (
+                self.memory_budget is not None
+                and self.total_size > self.memory_budget
+                and len(self.session_data) > 1
+            ):
+                evicted_id, evicted = self.session_data.popitem(last=False)
+                self._set_size(evicted_id, None)
+                self.time_last_used.pop(evicted_id, None)
+                self.session_versions.pop(evicted_id, None)
+                spilled = self._spill(evicted_id, evicted)
+                self.stats["spills" if spilled else "drops"] += 1
+
+    def save(self, session_id: str):
+        """
+        Called after an event of the session has been processed, so that the new size of the
+        session counts towards the memory budget and, if the backend is shared, the new state
+        is visible to the other workers.
+        """
+        if session_id not in self.session_data:
+            return
+        if self.backend is not None and self.backend.shared:
+            self._spill(session_id, self.session_data[session_id])
+        self.update(session_id, resize=True)
+
+    def _set_size(self, session_id: str, size: int | None):
+        self.total_size -= self.session_sizes.pop(session_id, 0)
+        if size is not None:
+            self.session_sizes[session_id] = size
+            self.total_size += size
+
+    def _spill(self, session_id: str, session_state: SessionState) -> bool:
+        """Saves the state of a session to the backend. Returns whether it was saved."""
+        if self.backend is None:
+            return False
+        try:
+            data = pickle.dumps(
+                (session_state.state_data, session_state._state_ttl),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as e:
+            warnings.warn(
+                f"The state of session {session_id} could not be pickled and will be lost: {e}"
+            )
+            return False
+        version = self.backend.save(session_id, data)
+        if self.backend.shared:
+            self.session_versions[session_id] = version
+        return True
+
+    def _restore(self, session_id: str, session_state: SessionState) -> bool:
+        """Loads the state of a session from the backend. Returns whether it was found."""
+        if self.backend is None:
+            return False
+        # The version is read before the state, so that if the state is saved again in
+        # between, the session is only reloaded once more rather than not at all
+        version = self.backend.version(session_id) if self.backend.shared else None
+        data = self.backend.load(session_id)
+        if data is None:
+            return False
+        session_state.state_data, session_state._state_ttl = pickle.loads(data)
+        if self.backend.shared:
+            self.session_versions[session_id] = version
+        else:
+            self.backend.delete(session_id)
+        return True
 
     def delete_all_expired_state(
         self,
     ):
-        for session_id in self.session_data:
+        # Deleting state can save the session, which moves it to the end of `session_data`
+        for session_id in list(self.session_data):
             self.delete_state(session_id, expired_only=True)
 
     def delete_state(self, session_id: str, expired_only: bool = False):
@@ -59,18 +340,18 @@ class StateHolder:
                 to_delete.append(component._id)
         for component in to_delete:
             del session_state.state_data[component]
+        if self.backend is not None and self.backend.shared and to_delete:
+            self.save(session_id)
 
 
 class SessionState:
     def __init__(self, blocks: Blocks):
         self.blocks_config = copy(blocks.default_config)
-        # Keep a separate deep copy of the config so we can recreate
-        # the state for deep links
-        self.config_values = {
-            k: self.blocks_config.config_for_block(k, [], v)
-            for k, v in self.blocks_config.blocks.items()
-            if k in blocks.blocks
-        }
+        # Keep separate copies of the configs of the blocks that are updated in this session
+        # so we can recreate the state for deep links. The configs of the blocks that are
+        # shared with the default config are only created when they are needed.
+        self.default_blocks = blocks.blocks
+        self.config_values: dict[int, dict] = {}
         self.state_data: dict[int, Any] = {}
         self._state_ttl = {}
         self.is_closed = False
@@ -129,11 +410,21 @@ class SessionState:
         else:
             return key in self.blocks_config.blocks
 
+    def estimated_size(self) -> int:
+        return estimate_size(self.state_data) + estimate_size(self.config_values)
+
     @property
     def components(self) -> Iterator[dict]:
-        for _, config in self.config_values.items():
+        for _id, block in self.default_blocks.items():
+            if _id in self.config_values:
+                config = self.config_values[_id]
+            else:
+                config = self.blocks_config.config_for_block(_id, [], block)
             if config:
                 yield config
+        for _id, config in self.config_values.items():
+            if _id not in self.default_blocks and config:
+                yield config
 
     @property
     def state_components(self) -> Iterator[tuple[State, Any, bool]]:
@@ -656,6 +656,7 @@ class Numpy(components.Dataframe):
         show_fullscreen_button: bool = False,
         max_chars: int | None = None,
         show_copy_button: bool = False,
+        page_size: int | None = None,
     ):
         super().__init__(
             value=value,
@@ -689,6 +690,7 @@ class Numpy(components.Dataframe):
             max_chars=max_chars,
             show_copy_button=show_copy_button,
             static_columns=static_columns,
+            page_size=page_size,
         )
 
 
@@ -741,6 +743,7 @@ class Matrix(components.Dataframe):
         max_chars: int | None = None,
         show_copy_button: bool = False,
         static_columns: list[int] | None = None,
+        page_size: int | None = None,
     ):
         super().__init__(
             value=value,
@@ -774,6 +777,7 @@ class Matrix(components.Dataframe):
             max_chars=max_chars,
             show_copy_button=show_copy_button,
             static_columns=static_columns,
+            page_size=page_size,
         )
 
 
@@ -826,6 +830,7 @@ class List(components.Dataframe):
         max_chars: int | None = None,
         show_copy_button: bool = False,
         static_columns: list[int] | None = None,
+        page_size: int | None = None,
     ):
         super().__init__(
             value=value,
@@ -859,6 +864,7 @@ class List(components.Dataframe):
             show_fullscreen_button=show_fullscreen_button,
             max_chars=max_chars,
             show_copy_button=show_copy_button,
+            page_size=page_size,
         )
 
 
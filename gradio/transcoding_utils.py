@@ -0,0 +1,306 @@
+"""
+Converts the chunks of streamed Video and Audio outputs into the formats that are served in
+HLS playlists, i.e. MPEG-TS segments for video and ADTS segments for audio.
+
+If PyAV is installed, chunks are converted in-process, which avoids starting an ffmpeg process
+(and warming up its encoders) for every chunk. Chunks whose codecs can already be played by
+browsers (h264 video and aac audio) are remuxed without being re-encoded.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import anyio
+
+from gradio import processing_utils
+
+if TYPE_CHECKING:
+    import av
+
+# The codecs and pixel formats that can be remuxed into a stream that browsers can play
+REMUX_VIDEO_CODECS = {"h264"}
+REMUX_PIXEL_FORMATS = {"yuv420p", "yuvj420p"}
+REMUX_AUDIO_CODECS = {"aac"}
+
+FFMPEG_REMUX_OPTIONS = ["-c", "copy", "-bsf:v", "h264_mp4toannexb", "-f", "mpegts"]
+FFMPEG_ENCODE_OPTIONS = [
+    "-c:v",
+    "libx264",
+    "-c:a",
+    "aac",
+    "-f",
+    "mpegts",
+    "-bsf:v",
+    "h264_mp4toannexb",
+    "-bsf:a",
+    "aac_adtstoasc",
+]
+
+
+@lru_cache(maxsize=1)
+def pyav_installed() -> bool:
+    try:
+        import av  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def can_remux(streams: list[dict[str, Any]]) -> bool:
+    """
+    Returns whether media with the given streams, as listed by `ffprobe -show_streams`, can be
+    copied into an MPEG-TS segment that browsers can play, without being re-encoded.
+    """
+    has_video = False
+    for stream in streams:
+        if stream.get("codec_type") == "video":
+            has_video = True
+            if (
+                stream.get("codec_name") not in REMUX_VIDEO_CODECS
+                or stream.get("pix_fmt") not in REMUX_PIXEL_FORMATS
+            ):
+                return False
+        elif stream.get("codec_type") == "audio":
+            if stream.get("codec_name") not in REMUX_AUDIO_CODECS:
+                return False
+    return has_video
+
+
+def _pyav_streams(container: av.container.InputContainer) -> list[dict[str, Any]]:
+    # The streams of the container, in the same format as the output of ffprobe
+    streams = []
+    for stream in container.streams.video:
+        streams.append(
+            {
+                "codec_type": "video",
+                "codec_name": stream.codec_context.name,
+                "pix_fmt": stream.codec_context.pix_fmt,
+            }
+        )
+    for stream in container.streams.audio:
+        streams.append({"codec_type": "audio", "codec_name": stream.codec_context.name})
+    return streams
+
+
+async def async_probe_streams(filename: str) -> list[dict[str, Any]]:
+    """Returns the streams of a media file, as listed by `ffprobe -show_streams`."""
+    stdout, _ = await processing_utils.async_run_media_subprocess(
+        [
+            "ffprobe",
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_streams",
+            filename,
+        ]
+    )
+    return json.loads(stdout).get("streams", [])
+
+
+class _Timeline:
+    # Tracks the time span of the packets written to a segment, to compute its duration
+
+    def __init__(self):
+        self.start: float | None = None
+        self.end: float | None = None
+
+    def add(self, packets: list[av.Packet]):
+        for packet in packets:
+            if packet.pts is None or packet.time_base is None:
+                continue
+            start = float(packet.pts * packet.time_base)
+            end = float((packet.pts + (packet.duration or 0)) * packet.time_base)
+            self.start = start if self.start is None else min(self.start, start)
+            self.end = end if self.end is None else max(self.end, end)
+
+    @property
+    def duration(self) -> float | None:
+        if self.start is None or self.end is None or self.end <= self.start:
+            return None
+        return self.end - self.start
+
+
+class VideoStreamTranscoder:
+    """
+    Converts the .mp4 chunks of a single video stream into MPEG-TS segments. Whether the chunks
+    can be remuxed instead of re-encoded is only checked for the first chunk, as the chunks of a
+    stream are expected to be encoded in the same way.
+
+    Parameters:
+        use_pyav: whether to convert the chunks in-process with PyAV. If None, PyAV is used if it
+            is installed. Otherwise, an ffmpeg process is started for every chunk.
+    """
+
+    def __init__(self, use_pyav: bool | None = None):
+        self.use_pyav = pyav_installed() if use_pyav is None else use_pyav
+        self.remux: bool | None = None
+
+    async def convert(self, mp4_file: str, ts_file: str) -> float | None:
+        """
+        Converts the mp4 file to an MPEG-TS file and returns the duration of the converted
+        video, or None if it could not be determined.
+        """
+        if self.use_pyav:
+            return await anyio.to_thread.run_sync(
+                self._convert_with_pyav,
+                mp4_file,
+                ts_file,
+                limiter=processing_utils.get_media_subprocess_limiter(),
+            )
+        if self.remux is None:
+            self.remux = can_remux(await async_probe_streams(mp4_file))
+        command = [
+            "ffmpeg",
+            "-y",
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-i",
+            mp4_file,
+            *(FFMPEG_REMUX_OPTIONS if self.remux else FFMPEG_ENCODE_OPTIONS),
+            ts_file,
+        ]
+        stdout, _ = await processing_utils.async_run_media_subprocess(command)
+
+        # The progress output ends with the position of the last frame that was written
+        duration = None
+        for line in stdout.decode().splitlines():
+            key, _, value = line.partition("=")
+            if key == "out_time_us" and value.strip().isdigit():
+                duration = int(value) / 1_000_000
+        return duration or None
+
+    def _convert_with_pyav(self, mp4_file: str, ts_file: str) -> float | None:
+        import av
+
+        timeline = _Timeline()
+        with av.open(mp4_file) as input_container:
+            if self.remux is None:
+                self.remux = can_remux(_pyav_streams(input_container))
+            input_streams = [
+                *input_container.streams.video[:1],
+                *input_container.streams.audio[:1],
+            ]
+            with av.open(ts_file, mode="w", format="mpegts") as output_container:
+                if self.remux:
+                    _remux(input_container, input_streams, output_container, timeline)
+                else:
+                    _transcode(
+                        input_container, input_streams, output_container, timeline
+                    )
+        return timeline.duration
+
+
+def _add_stream_from_template(
+    output_container: av.container.OutputContainer, stream: av.stream.Stream
+) -> av.stream.Stream:
+    if hasattr(output_container, "add_stream_from_template"):
+        return output_container.add_stream_from_template(stream)
+    return output_container.add_stream(template=stream)  # PyAV < 14
+
+
+def _remux(
+    input_container: av.container.InputContainer,
+    input_streams: list[av.stream.Stream],
+    output_container: av.container.OutputContainer,
+    timeline: _Timeline,
+):
+    output_streams = {
+        stream.index: _add_stream_from_template(output_container, stream)
+        for stream in input_streams
+    }
+    for packet in input_container.demux(input_streams):
+        if packet.dts is None:  # empty packets flush the demuxer
+            continue
+        packet.stream = output_streams[packet.stream.index]
+        timeline.add([packet])
+        output_container.mux(packet)
+
+
+def _transcode(
+    input_container: av.container.InputContainer,
+    input_streams: list[av.stream.Stream],
+    output_container: av.container.OutputContainer,
+    timeline: _Timeline,
+    video_codec: str = "libx264",
+    audio_codec: str = "aac",
+):
+    output_streams = {}
+    for stream in input_streams:
+        if stream.type == "video":
+            output_stream = output_container.add_stream(
+                video_codec, rate=stream.average_rate or 30
+            )
+            output_stream.codec_context.width = stream.codec_context.width
+            output_stream.codec_context.height = stream.codec_context.height
+            output_stream.codec_context.pix_fmt = "yuv420p"
+        else:
+            output_stream = output_container.add_stream(
+                audio_codec, rate=stream.codec_context.sample_rate
+            )
+            # Other layouts than mono are downmixed to stereo, which every browser can play
+            output_stream.codec_context.layout = (
+                "mono" if len(stream.codec_context.layout.channels) == 1 else "stereo"
+            )
+        output_streams[stream.index] = output_stream
+
+    for packet in input_container.demux(input_streams):
+        output_stream = output_streams[packet.stream.index]
+        for frame in packet.decode():
+            packets = output_stream.encode(frame)
+            timeline.add(packets)
+            output_container.mux(packets)
+    for output_stream in output_streams.values():
+        packets = output_stream.encode(None)
+        timeline.add(packets)
+        output_container.mux(packets)
+
+
+def convert_audio_to_adts(data: bytes) -> tuple[bytes, float]:
+    """
+    Converts audio in any format supported by PyAV to AAC in an ADTS container, and returns it
+    with its duration in seconds. Audio that is already encoded as AAC is remuxed.
+    """
+    import av
+
+    timeline = _Timeline()
+    buffer = io.BytesIO()
+    with av.open(io.BytesIO(data)) as input_container:
+        input_streams = input_container.streams.audio[:1]
+        with av.open(buffer, mode="w", format="adts") as output_container:
+            if input_streams and input_streams[0].codec_context.name == "aac":
+                _remux(input_container, input_streams, output_container, timeline)
+            else:
+                _transcode(input_container, input_streams, output_container, timeline)
+    return buffer.getvalue(), timeline.duration or 0.0
+
+
+class TranscoderCache(OrderedDict):
+    """
+    The transcoders of the streams of a component, by the id of the stream output. As there is
+    no notification when a stream ends, the least recently used transcoders are dropped once
+    there are more than `max_size`.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        super().__init__()
+        self.max_size = max_size
+
+    def get_transcoder(
+        self, output_id: str, first_chunk: bool
+    ) -> VideoStreamTranscoder:
+        transcoder = None if first_chunk else self.get(output_id)
+        if transcoder is None:
+            transcoder = VideoStreamTranscoder()
+            self[output_id] = transcoder
+            while len(self) > self.max_size:
+                self.popitem(last=False)
+        else:
+            self.move_to_end(output_id)
+        return transcoder
@@ -14,6 +14,7 @@ import inspect
 import json
 import json.decoder
 import os
+import pickle
 import pkgutil
 import posixpath
 import re
@@ -33,7 +34,6 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from collections.abc import (
     Callable,
-    Hashable,
     Iterable,
     Iterator,
     MutableMapping,
@@ -42,6 +42,8 @@ from collections.abc import (
 from contextlib import contextmanager
 from functools import wraps
 from io import BytesIO
+from itertools import compress, count
+from operator import ne
 from pathlib import Path
 from types import ModuleType, NoneType
 from typing import (
@@ -74,6 +76,8 @@ from gradio.data_classes import (
 from gradio.exceptions import Error, InvalidPathError
 
 if TYPE_CHECKING:  # Only import for type checking (is False at runtime).
+    import numpy as np
+
     from gradio.blocks import BlockContext, Blocks
     from gradio.components import Component
     from gradio.routes import App, Request
@@ -126,6 +130,26 @@ def safe_get_stop_event() -> asyncio.Event:
         return asyncio.Event()
 
 
+def set_event_threadsafe(
+    event: asyncio.Event, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """
+    Sets an asyncio.Event whose waiters run on `loop`. Unlike `event.set()`, this is safe
+    to call from a thread other than the one running `loop`, e.g. from a function that the
+    queue is running in a worker thread.
+    """
+    if loop is None or loop.is_closed():
+        return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        event.set()
+    else:
+        loop.call_soon_threadsafe(event.set)
+
+
 class DynamicBoolean(int):
     def __init__(self, value: int):
         self.value = bool(value)
@@ -363,6 +387,21 @@ def watchfn(reloader: SourceFileReloader):
         time.sleep(0.05)
 
 
+def ndarray_to_list(value: np.ndarray | np.generic) -> Any:
+    """
+    Converts a numpy array (or scalar) to Python objects that can be written as JSON, with
+    NaN and infinite values as None (i.e. null), as orjson and pandas' `to_json` write them.
+    """
+    import numpy as np
+
+    if value.dtype.kind in "fc" and not np.isfinite(value).all():
+        finite = np.isfinite(value)
+        value = np.asarray(value).astype(object)
+        value[~finite] = None
+        return value.tolist() if value.ndim else value.item()
+    return value.tolist()
+
+
 def deep_equal(a: Any, b: Any) -> bool:
     """
     Deep equality check for component values.
@@ -1289,42 +1328,62 @@ def get_cache_folder() -> Path:
 
 
 def diff(old, new):
-    def compare_objects(obj1, obj2, path=None):
-        if path is None:
-            path = []
-        edits = []
+    """
+    Returns the edits that turn `old` into `new`, in the format that
+    `gradio_client.utils.apply_diff` applies. Only the values that differ are traversed, each
+    value is compared at most once per level, and strings that were appended to are only
+    compared up to the length of the old string, so diffing consecutive outputs of a
+    generator (which mostly share or extend the previous output) stays cheap for long
+    histories.
+    """
 
-        if obj1 == obj2:
-            return edits
+    def equal(obj1, obj2) -> bool:
+        # numpy arrays (e.g. the rows of a plot) compare element-wise, so they are compared
+        # by their serialized value instead
+        try:
+            return bool(obj1 == obj2)
+        except ValueError:
+            return deep_equal(obj1, obj2)
+
+    def compare_objects(obj1, obj2, path):
+        if obj1 is obj2:
+            return []
 
         if type(obj1) is not type(obj2):
-            edits.append(["replace", path, obj2])
-            return edits
+            return [] if equal(obj1, obj2) else [["replace", path, obj2]]
 
-        if isinstance(obj1, str) and obj2.startswith(obj1):
-            edits.append(["append", path, obj2[len(obj1) :]])
-            return edits
+        if isinstance(obj1, str):
+            if len(obj2) > len(obj1) and obj2.startswith(obj1):
+                return [["append", path, obj2[len(obj1) :]]]
+            return [] if obj1 == obj2 else [["replace", path, obj2]]
 
         if isinstance(obj1, list):
+            edits = []
             common_length = min(len(obj1), len(obj2))
-            for i in range(common_length):
+            # Find the elements that differ without leaving C (identical elements are not
+            # compared), so unchanged elements of long lists are cheap to skip
+            try:
+                changed = list(compress(count(), map(ne, obj1, obj2)))
+            except ValueError:
+                changed = [
+                    i for i in range(common_length) if not equal(obj1[i], obj2[i])
+                ]
+            for i in changed:
                 edits.extend(compare_objects(obj1[i], obj2[i], path + [i]))
-            for i in range(common_length, len(obj1)):
-                edits.append(["delete", path + [i], None])
+            # Deleting an element shifts the following elements back by one, so every
+            # trailing element is deleted at the same index
+            for _ in range(common_length, len(obj1)):
+                edits.append(["delete", path + [common_length], None])
             for i in range(common_length, len(obj2)):
                 edits.append(["add", path + [i], obj2[i]])
-            # Deletes are always placed at the end
-            # So subtract 1 since deleting one element will shift all the indices
-            deletes_seen = 0
-            for edit in edits:
-                if edit[0] == "delete" and isinstance(edit[1][-1], int):
-                    edit[1][-1] -= deletes_seen
-                    deletes_seen += 1
             return edits
 
         if isinstance(obj1, dict):
+            edits = []
             for key in obj1:
                 if key in obj2:
+                    # The values are not compared here first, as that would compare the
+                    # unchanged part of every level of the tree again at each level
                     edits.extend(compare_objects(obj1[key], obj2[key], path + [key]))
                 else:
                     edits.append(["delete", path + [key], None])
@@ -1333,10 +1392,9 @@ def diff(old, new):
                     edits.append(["add", path + [key], obj2[key]])
             return edits
 
-        edits.append(["replace", path, obj2])
-        return edits
+        return [] if equal(obj1, obj2) else [["replace", path, obj2]]
 
-    return compare_objects(old, new)
+    return compare_objects(old, new, [])
 
 
 def get_upload_folder() -> str:
@@ -1479,28 +1537,107 @@ def connect_heartbeat(config: BlocksConfigDict, blocks) -> bool:
     return any_state or any_unload or any_stream
 
 
-def deep_hash(obj):
-    """Compute a hash for a deeply nested data structure."""
-    hasher = hashlib.sha256()
+class _DeepHashPickler(pickle.Pickler):
+    """
+    Pickles the containers and scalars of a value by content, and every other object by
+    its hash (or by its identity if it is not hashable), like deep_hash() has always done.
+    This way, a gr.State holding e.g. a model or a database connection is not serialized
+    just to detect whether it changed. Numpy arrays and other buffers are hashed by content.
+    The items of dicts and sets are pickled in the order of their hashes, so that equal
+    dicts and sets have the same hash regardless of the order of their items.
+    """
+
+    def persistent_id(self, obj):
+        # Unlike reducer_override, this is also called for exact dicts and sets
+        if type(obj) is dict and len(obj) > 1:
+            return ("dict", sorted(obj.items(), key=_hash_of_key))
+        if type(obj) is set or type(obj) is frozenset:
+            return ("set", sorted(obj, key=hash))
+        return None
+
+    content_types = (str, bytes, bytearray, int, float, complex, dict, list, tuple, set)
+
+    def reducer_override(self, obj):
+        if isinstance(obj, self.content_types) or obj is _deep_hash_token:
+            return NotImplemented
+        if (numpy := sys.modules.get("numpy")) is not None and isinstance(
+            obj, numpy.ndarray
+        ):
+            return NotImplemented
+        if isinstance(obj, memoryview):
+            return bytes, (obj.tobytes(),)
+        try:
+            token = hash(obj)
+        except TypeError:
+            token = id(obj)
+        return _deep_hash_token, (token,)
+
+
+def _deep_hash_token(token: int):
+    return token
+
+
+def _hash_of_key(item: tuple[Any, Any]) -> int:
+    return hash(item[0])
+
+
+class _HashWriter:
+    __slots__ = ("update",)
+
+    def __init__(self, hasher):
+        self.update = hasher.update
+
+    def write(self, data):
+        self.update(data)
+
+
+def deep_hash(obj) -> str:
+    """
+    Compute a hash for a deeply nested data structure. This is used to detect whether a
+    function changed the value of a gr.State, so it only needs to be stable within a
+    process. The value is streamed through the pickler, which walks builtin containers in
+    C, into a blake2b hasher, and the buffers of numpy arrays are hashed without copying.
+    Equal values have the same hash, whatever the order of the items of their dicts and
+    sets, and whether or not they contain the same object more than once.
+    """
+    # The pickler is first used in fast mode, i.e. without its memo, so that an object that
+    # is contained twice is pickled twice rather than as a reference to its first copy.
+    # Values that contain themselves can only be pickled with the memo.
+    for fast in (True, False):
+        hasher = hashlib.blake2b(digest_size=16)
+        pickler = _DeepHashPickler(
+            _HashWriter(hasher),
+            protocol=5,
+            buffer_callback=lambda buffer, hasher=hasher: hasher.update(buffer.raw()),
+        )
+        pickler.fast = fast
+        try:
+            pickler.dump(obj)
+        except Exception:
+            continue
+        return hasher.hexdigest()
+    # e.g. a value that cannot be pickled, such as a generator in a list
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr(_deep_hash_items(obj)).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _deep_hash_items(obj):
     if isinstance(obj, (int, float, str, bytes)):
-        items = obj
+        return obj
     elif isinstance(obj, dict):
-        items = tuple(
-            [
-                (k, deep_hash(v))
-                for k, v in sorted(obj.items(), key=lambda x: hash(x[0]))
-            ]
+        return tuple(
+            (k, _deep_hash_items(v))
+            for k, v in sorted(obj.items(), key=lambda x: hash(x[0]))
         )
     elif isinstance(obj, (list, tuple)):
-        items = tuple(deep_hash(x) for x in obj)
+        return tuple(_deep_hash_items(x) for x in obj)
     elif isinstance(obj, set):
-        items = tuple(deep_hash(x) for x in sorted(obj, key=hash))
-    elif isinstance(obj, Hashable):
-        items = str(hash(obj)).encode("utf-8")
-    else:
-        items = str(id(obj)).encode("utf-8")
-    hasher.update(repr(items).encode("utf-8"))
-    return hasher.hexdigest()
+        return tuple(_deep_hash_items(x) for x in sorted(obj, key=hash))
+    try:
+        return hash(obj)
+    except TypeError:
+        return id(obj)
 
 
 def error_payload(
@@ -9,4 +9,9 @@ export type DataframeValue = {
 	data: Data;
 	headers: Headers;
 	metadata: Metadata;
+	// only set if the rows are loaded a page at a time from the server
+	frame_id?: string;
+	total_rows?: number;
+	row_indices?: number[];
+	edits?: [number, number, string | number][];
 };
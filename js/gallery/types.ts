@@ -3,6 +3,7 @@ import type { FileData } from "@gradio/client";
 export interface GalleryImage {
 	image: FileData;
 	caption: string | null;
+	thumbnail?: FileData | null;
 }
 
 export interface GalleryVideo {
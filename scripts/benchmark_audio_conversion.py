@@ -0,0 +1,111 @@
+"""
+A script that benchmarks the conversion of audio samples returned by a function to a 16-bit
+WAV file, i.e. `processing_utils.audio_to_file` (with `convert_to_16_bit_wav`), and the
+reading of samples decoded by pydub in `processing_utils.audio_from_file`. It compares them
+with the previous conversions, which allocated a float64 array for every step and went through
+pydub (and a Python array) to write and read the samples. The peak memory is measured with
+tracemalloc, which tracks the allocations of numpy arrays.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_audio_conversion.py
+
+You can specify the duration of the audio in seconds with -d:
+>> python scripts/benchmark_audio_conversion.py -d 600
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import numpy as np
+from pydub import AudioSegment
+
+from gradio import processing_utils
+
+parser = argparse.ArgumentParser(description="Benchmark audio sample conversions")
+parser.add_argument("-d", "--duration", type=int, default=180)
+parser.add_argument("-s", "--sample_rate", type=int, default=48000)
+parser.add_argument("-r", "--repeats", type=int, default=5)
+args = parser.parse_args()
+
+warnings.simplefilter("ignore")
+rng = np.random.default_rng(0)
+shape = (args.duration * args.sample_rate, 2)
+samples = {
+    "float32": rng.uniform(-0.5, 0.5, shape).astype(np.float32),
+    "float64": rng.uniform(-0.5, 0.5, shape),
+    "int32": rng.integers(-(2**31), 2**31 - 1, shape, dtype=np.int32),
+}
+output = Path(tempfile.mkdtemp()) / "audio.wav"
+
+
+def convert_with_temporaries(data: np.ndarray) -> np.ndarray:
+    if data.dtype == np.int32:
+        return (data / 65536).astype(np.int16)
+    data = data / np.abs(data).max()
+    data = data * 32767
+    return data.astype(np.int16)
+
+
+def write_with_pydub(data: np.ndarray):
+    data = convert_with_temporaries(data)
+    audio = AudioSegment(
+        data.tobytes(), frame_rate=args.sample_rate, sample_width=2, channels=2
+    )
+    audio.export(output, format="wav").close()
+
+
+def read_with_array(segment: AudioSegment) -> np.ndarray:
+    return np.array(segment.get_array_of_samples()).reshape(-1, segment.channels)
+
+
+def read_with_frombuffer(segment: AudioSegment) -> np.ndarray:
+    # The same read as processing_utils.audio_from_file, which copies the samples once
+    data = np.frombuffer(segment.raw_data, dtype="<i2").astype("=i2")
+    return data.reshape(-1, segment.channels)
+
+
+def measure(function, *arguments) -> tuple[float, float]:
+    times = []
+    tracemalloc.start()
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        function(*arguments)
+        times.append(time.perf_counter() - start)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def report(name: str, function, *arguments):
+    best, peak = measure(function, *arguments)
+    print(f"  {name}: min={best * 1000:.1f}ms peak={peak / 1e6:.1f}MB")
+
+
+for dtype, data in samples.items():
+    print(
+        f"{dtype} {args.duration}s stereo at {args.sample_rate}Hz: {data.nbytes / 1e6:.1f}MB"
+    )
+    report("convert (temporaries)", convert_with_temporaries, data)
+    report("convert_to_16_bit_wav", processing_utils.convert_to_16_bit_wav, data)
+    report("write (pydub)", write_with_pydub, data)
+    report(
+        "audio_to_file",
+        processing_utils.audio_to_file,
+        args.sample_rate,
+        data,
+        output,
+    )
+
+segment = AudioSegment(
+    processing_utils.convert_to_16_bit_wav(samples["float32"]).tobytes(),
+    frame_rate=args.sample_rate,
+    sample_width=2,
+    channels=2,
+)
+print(f"reading the samples of an AudioSegment of {len(segment.raw_data) / 1e6:.1f}MB")
+report("get_array_of_samples", read_with_array, segment)
+report("frombuffer", read_with_frombuffer, segment)
@@ -0,0 +1,64 @@
+"""
+A script that benchmarks `utils.diff` on the outputs of a streaming chatbot, i.e. the time
+it takes to compute the diff between two consecutive yields of a generator that streams a
+response token by token at the end of a long chat history. It can be used to compare a given
+branch against the main branch.
+
+Each yield is a fresh copy of the history (as `Chatbot.postprocess` would produce), in
+which only the content of the last message has grown by one token.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_diff.py
+
+You can specify the number of messages in the history with -n and the number of streamed
+tokens with -t:
+>> python scripts/benchmark_diff.py -n 5000 -t 500
+"""
+
+import argparse
+import statistics
+import time
+
+from gradio.utils import diff
+
+parser = argparse.ArgumentParser(description="Benchmark utils.diff")
+parser.add_argument("-n", "--num_messages", type=int, default=2000)
+parser.add_argument("-t", "--num_tokens", type=int, default=200)
+args = parser.parse_args()
+
+history = [
+    {
+        "role": "user" if i % 2 == 0 else "assistant",
+        "content": f"This is message number {i} of the conversation. " * 5,
+        "metadata": {"title": None, "id": i},
+        "options": [],
+    }
+    for i in range(args.num_messages)
+]
+
+
+def postprocess(response: str) -> list[dict]:
+    return [
+        {**message, "metadata": dict(message["metadata"])} for message in history
+    ] + [{"role": "assistant", "content": response, "metadata": {}, "options": []}]
+
+
+response = ""
+previous = postprocess(response)
+timings = []
+for _ in range(args.num_tokens):
+    response += "token "
+    current = postprocess(response)
+    start = time.perf_counter()
+    edits = diff(previous, current)
+    timings.append(time.perf_counter() - start)
+    if edits != [["append", [args.num_messages, "content"], "token "]]:
+        raise RuntimeError(f"Unexpected edits: {edits}")
+    previous = current
+
+print(f"messages={args.num_messages} tokens={args.num_tokens}")
+print(
+    f"  diff per token: mean={statistics.mean(timings) * 1000:.3f}ms "
+    f"median={statistics.median(timings) * 1000:.3f}ms "
+    f"total={sum(timings) * 1000:.1f}ms"
+)
@@ -0,0 +1,71 @@
+"""
+A script that benchmarks the end-to-end postprocessing of a Gallery output, i.e.
+`Gallery.postprocess` followed by `processing_utils.async_move_files_to_cache`, which copies
+every image into the cache. It can be used to compare a given branch against the main
+branch, or different values of the fan-out limit.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_gallery_postprocess.py
+
+You can specify the number of images with -n, their size in pixels with -s and the maximum
+number of images moved into the cache at the same time with -c (-c 1 moves them one at a
+time, as before files were moved concurrently):
+>> python scripts/benchmark_gallery_postprocess.py -n 500 -s 1024 -c 1
+"""
+
+import argparse
+import asyncio
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import gradio as gr
+from gradio import processing_utils
+
+parser = argparse.ArgumentParser(description="Benchmark Gallery postprocessing")
+parser.add_argument("-n", "--num_images", type=int, default=200)
+parser.add_argument("-s", "--size", type=int, default=512)
+parser.add_argument("-c", "--max_concurrency", type=int, default=None)
+parser.add_argument("-r", "--repeats", type=int, default=5)
+args = parser.parse_args()
+
+source_dir = Path(tempfile.mkdtemp())
+rng = np.random.default_rng(0)
+for i in range(args.num_images):
+    pixels = rng.integers(0, 255, (args.size, args.size, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(source_dir / f"{i}.png")
+
+
+async def postprocess(gallery: gr.Gallery) -> float:
+    start = time.perf_counter()
+    value = gallery.postprocess(
+        [str(source_dir / f"{i}.png") for i in range(args.num_images)]
+    )
+    await processing_utils.async_move_files_to_cache(
+        value, gallery, postprocess=True, max_concurrency=args.max_concurrency
+    )
+    return time.perf_counter() - start
+
+
+timings = []
+for _ in range(args.repeats):
+    # A new cache directory for each run, so that every image is copied again
+    cache_dir = tempfile.mkdtemp()
+    gallery = gr.Gallery()
+    gallery.GRADIO_CACHE = cache_dir
+    timings.append(asyncio.run(postprocess(gallery)))
+    shutil.rmtree(cache_dir)
+shutil.rmtree(source_dir)
+
+print(
+    f"images={args.num_images} size={args.size}px max_concurrency={args.max_concurrency}"
+)
+print(
+    f"  postprocess: mean={statistics.mean(timings) * 1000:.1f}ms "
+    f"min={min(timings) * 1000:.1f}ms"
+)
@@ -0,0 +1,74 @@
+"""
+A script that benchmarks the end-to-end serialization of a LinePlot output, i.e.
+`LinePlot.postprocess` followed by the `orjson.dumps` of the SSE message that sends it to the
+browser. It compares the rows kept as a numpy array with the rows converted to Python lists
+through `DataFrame.to_json`, as before numeric columns were serialized from their buffers.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_native_plot.py
+
+You can specify the number of rows of the plot with -n:
+>> python scripts/benchmark_native_plot.py -n 100000
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+import orjson
+import pandas as pd
+
+import gradio as gr
+from gradio.components.native_plot import PlotData
+
+parser = argparse.ArgumentParser(description="Benchmark LinePlot serialization")
+parser.add_argument("-n", "--num_rows", type=int, default=1_000_000)
+parser.add_argument("-r", "--repeats", type=int, default=5)
+args = parser.parse_args()
+
+rng = np.random.default_rng(0)
+df = pd.DataFrame(
+    {
+        "time": pd.date_range("2024-01-01", periods=args.num_rows, freq="s"),
+        "value": rng.normal(size=args.num_rows).cumsum(),
+    }
+)
+plot = gr.LinePlot(x="time", y="value")
+
+
+def postprocess_as_lists() -> PlotData:
+    split_json = json.loads(df.to_json(orient="split", date_unit="ms"))
+    return PlotData(
+        columns=split_json["columns"],
+        data=split_json["data"],
+        datatypes={"time": "temporal", "value": "quantitative"},
+        mark="line",
+    )
+
+
+def serialize(postprocess) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    value = postprocess().model_dump()
+    postprocessed = time.perf_counter()
+    message = {"msg": "process_completed", "output": {"data": [value]}}
+    payload = orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
+    return postprocessed - start, time.perf_counter() - postprocessed, len(payload)
+
+
+for name, postprocess in [
+    ("lists", postprocess_as_lists),
+    ("numpy", lambda: plot.postprocess(df)),
+]:
+    timings = [serialize(postprocess) for _ in range(args.repeats)]
+    postprocess_times, dump_times, sizes = zip(*timings, strict=False)
+    print(f"{name} rows={args.num_rows} payload={sizes[0] / 1e6:.1f}MB")
+    print(
+        f"  postprocess: mean={statistics.mean(postprocess_times) * 1000:.1f}ms "
+        f"min={min(postprocess_times) * 1000:.1f}ms"
+    )
+    print(
+        f"  orjson.dumps: mean={statistics.mean(dump_times) * 1000:.1f}ms "
+        f"min={min(dump_times) * 1000:.1f}ms"
+    )
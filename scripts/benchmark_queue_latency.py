@@ -0,0 +1,83 @@
+"""
+A script that benchmarks the scheduling latency of the queue, i.e. the time between an event
+joining the queue and the queue starting to process it. It can be used to compare the
+latency on a given branch vs the main branch, as it only relies on the timestamps that the
+queue already records (`Queue.event_analytics`) and on the `begin_time` that is passed to
+`Queue.process_events`.
+
+Two scenarios are measured:
+  - "sequential": one job at a time, so the queue is idle whenever a job is pushed.
+  - "burst": `-c` jobs are submitted at once against a function with a concurrency limit
+    of 1, so every job (except the first) has to wait for a worker to be freed up.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_queue_latency.py
+
+You can specify the number of jobs with the -n parameter and the burst size with -c:
+>> python scripts/benchmark_queue_latency.py -n 500 -c 50
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import wait
+
+from gradio_client import Client
+
+import gradio as gr
+
+with gr.Blocks() as demo:
+    inp = gr.Textbox()
+    out = gr.Textbox()
+    inp.submit(lambda x: x, inp, out, api_name="echo", concurrency_limit=1)
+
+demo.queue()
+queue = demo._queue
+start_latencies: list[float] = []
+original_process_events = queue.process_events
+
+
+async def process_events_with_timing(events, batch, begin_time):
+    for event in events:
+        start_latencies.append(begin_time - queue.event_analytics[event._id]["time"])  # type: ignore
+    return await original_process_events(events, batch, begin_time)
+
+
+queue.process_events = process_events_with_timing
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, round(q * (len(values) - 1)))]
+
+
+def report(name: str, latencies: list[float]):
+    print(
+        f"{name:>10}: n={len(latencies)}  "
+        f"p50={percentile(latencies, 0.5) * 1000:.2f}ms  "
+        f"p99={percentile(latencies, 0.99) * 1000:.2f}ms  "
+        f"mean={statistics.mean(latencies) * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark queue scheduling latency")
+    parser.add_argument("-n", "--n_jobs", type=int, help="number of jobs", default=200)
+    parser.add_argument("-c", "--burst", type=int, help="jobs per burst", default=20)
+    args = parser.parse_args()
+
+    _, local_url, _ = demo.launch(prevent_thread_lock=True, quiet=True)
+    client = Client(local_url, verbose=False)
+
+    for i in range(args.n_jobs):
+        client.predict(str(i), api_name="/echo")
+    report("sequential", start_latencies)
+
+    start_latencies.clear()
+    for _ in range(max(1, args.n_jobs // args.burst)):
+        jobs = [client.submit(str(i), api_name="/echo") for i in range(args.burst)]
+        wait(jobs)
+    time.sleep(0.1)
+    report("burst", start_latencies)
+
+    demo.close()
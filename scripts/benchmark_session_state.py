@@ -0,0 +1,57 @@
+"""
+A script that benchmarks the memory used by, and the time it takes to create, the `SessionState`
+of each session of an app with many components. It can be used to compare a given branch
+against the main branch.
+
+The app has `-c` textboxes and every session updates the value of `-u` of them, which is
+similar to a real app where most sessions only change a few components.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_session_state.py
+
+You can specify the number of sessions with -n, the number of components with -c and the
+number of components updated per session with -u:
+>> python scripts/benchmark_session_state.py -n 10000 -c 300 -u 5
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import gradio as gr
+from gradio.state_holder import StateHolder
+
+parser = argparse.ArgumentParser(description="Benchmark SessionState memory usage")
+parser.add_argument("-n", "--num_sessions", type=int, default=2000)
+parser.add_argument("-c", "--num_components", type=int, default=300)
+parser.add_argument("-u", "--num_updates", type=int, default=5)
+args = parser.parse_args()
+
+with gr.Blocks() as demo:
+    textboxes = [gr.Textbox(f"value {i}") for i in range(args.num_components)]
+
+state_holder = StateHolder()
+state_holder.set_blocks(demo)
+state_holder.capacity = args.num_sessions
+
+tracemalloc.start()
+baseline, _ = tracemalloc.get_traced_memory()
+start = time.perf_counter()
+for i in range(args.num_sessions):
+    state = state_holder[f"session-{i}"]
+    for textbox in textboxes[: args.num_updates]:
+        state._update_value_in_config(textbox._id, f"updated {i}")
+elapsed = time.perf_counter() - start
+current, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+print(
+    f"sessions={args.num_sessions} components={args.num_components} "
+    f"updates/session={args.num_updates}"
+)
+print(
+    f"  memory: {(current - baseline) / 2**20:.1f}MB total, "
+    f"{(current - baseline) / args.num_sessions / 1024:.1f}KB per session, "
+    f"peak {(peak - baseline) / 2**20:.1f}MB"
+)
+print(f"  time:   {elapsed / args.num_sessions * 1e6:.0f}us per session")
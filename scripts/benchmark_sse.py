@@ -0,0 +1,136 @@
+"""
+A load test for the `/queue/data` SSE endpoint. It can be used to compare a given branch
+against the main branch and measures:
+
+  - "idle": the server CPU time spent per second on sessions that are connected to
+    `/queue/data` but are waiting in the queue (no messages are being sent to them).
+  - "latency": the time between a streaming generator yielding a token and the
+    corresponding SSE frame being received by the client.
+
+The app runs in the same process as the load generator, so the CPU time that is reported
+includes the (idle) clients, which is negligible compared to the server.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_sse.py
+
+You can specify the number of idle sessions with -n and the number of streamed tokens with -t:
+>> python scripts/benchmark_sse.py -n 2000 -t 500
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import threading
+import time
+import uuid
+
+import httpx
+
+import gradio as gr
+from gradio.route_utils import API_PREFIX
+
+release_blocker = threading.Event()
+
+
+def blocker(x):
+    release_blocker.wait()
+    return x
+
+
+def stream_timestamps(n):
+    for _ in range(int(n)):
+        time.sleep(0.01)
+        yield f"t={time.time()}"
+
+
+with gr.Blocks() as demo:
+    inp = gr.Textbox()
+    out = gr.Textbox()
+    inp.submit(blocker, inp, out, api_name="blocker", concurrency_limit=1)
+    inp.change(stream_timestamps, inp, out, api_name="stream", concurrency_limit=None)
+
+
+async def join(client: httpx.AsyncClient, fn_index: int, data: list) -> str:
+    session_hash = uuid.uuid4().hex
+    resp = await client.post(
+        f"{API_PREFIX}/queue/join",
+        json={"data": data, "fn_index": fn_index, "session_hash": session_hash},
+    )
+    resp.raise_for_status()
+    return session_hash
+
+
+async def listen(client: httpx.AsyncClient, session_hash: str, on_line=None):
+    async with client.stream(
+        "GET", f"{API_PREFIX}/queue/data", params={"session_hash": session_hash}
+    ) as response:
+        async for line in response.aiter_lines():
+            if on_line is not None:
+                on_line(line)
+            if line.startswith("data:") and json.loads(line[5:])["msg"] in (
+                "process_completed",
+                "close_stream",
+            ):
+                return
+
+
+async def measure_idle(client: httpx.AsyncClient, n_sessions: int, duration: float):
+    # The first session occupies the only worker so that every other session stays idle
+    session_hashes = [await join(client, 0, ["x"]) for _ in range(n_sessions + 1)]
+    listeners = [
+        asyncio.create_task(listen(client, session_hash))
+        for session_hash in session_hashes
+    ]
+    await asyncio.sleep(2)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(duration)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    release_blocker.set()
+    await asyncio.gather(*listeners)
+    return cpu, wall
+
+
+async def measure_latency(client: httpx.AsyncClient, n_tokens: int):
+    latencies: list[float] = []
+
+    def on_line(line: str):
+        received = time.time()
+        for timestamp in re.findall(r"t=([0-9.]+)", line):
+            latencies.append(received - float(timestamp))
+
+    session_hash = await join(client, 1, [str(n_tokens)])
+    await listen(client, session_hash, on_line)
+    return latencies
+
+
+async def main(n_sessions: int, n_tokens: int, duration: float):
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        base_url=demo.local_url, limits=limits, timeout=None
+    ) as client:
+        cpu, wall = await measure_idle(client, n_sessions, duration)
+        print(
+            f"idle: {n_sessions} sessions, {cpu / wall * 1000:.1f}ms CPU/s in total, "
+            f"{cpu / wall / n_sessions * 1e6:.1f}us CPU/s per session"
+        )
+        latencies = sorted(await measure_latency(client, n_tokens))
+        print(
+            f"latency: {len(latencies)} tokens, "
+            f"p50={statistics.median(latencies) * 1000:.2f}ms "
+            f"p99={latencies[int(0.99 * (len(latencies) - 1))] * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the SSE endpoint")
+    parser.add_argument("-n", "--n_sessions", type=int, default=500)
+    parser.add_argument("-t", "--n_tokens", type=int, default=200)
+    parser.add_argument("-d", "--duration", type=float, default=5)
+    args = parser.parse_args()
+
+    demo.queue(max_size=None).launch(prevent_thread_lock=True, quiet=True)
+    asyncio.run(main(args.n_sessions, args.n_tokens, args.duration))
+    demo.close()
@@ -0,0 +1,68 @@
+"""
+A script that benchmarks the conversion of the .mp4 chunks of a streamed Video output into the
+MPEG-TS segments of its HLS playlist, in chunks per second. It compares re-encoding every chunk
+with a new ffmpeg process (as before chunks could be remuxed), remuxing the chunks with ffmpeg,
+and converting the chunks in-process with PyAV. The modes whose dependencies are not installed
+are skipped.
+
+Navigate to the root directory of the gradio repo and run:
+>> python scripts/benchmark_video_streaming.py
+
+You can specify the number of chunks with -n, the video to stream as chunks with -f (it should be
+encoded with h264 and aac, so that it can be remuxed) and the number of concurrent streams with -s:
+>> python scripts/benchmark_video_streaming.py -n 50 -f test/test_files/video_sample.mp4 -s 4
+"""
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from gradio import processing_utils, transcoding_utils
+
+parser = argparse.ArgumentParser(description="Benchmark Video streaming")
+parser.add_argument("-n", "--num_chunks", type=int, default=20)
+parser.add_argument(
+    "-f", "--file", type=str, default="test/test_files/video_sample.mp4"
+)
+parser.add_argument("-s", "--streams", type=int, default=1)
+args = parser.parse_args()
+
+chunk_dir = Path(tempfile.mkdtemp())
+
+
+async def stream(index: int, use_pyav: bool, remux: bool):
+    transcoder = transcoding_utils.VideoStreamTranscoder(use_pyav=use_pyav)
+    transcoder.remux = remux
+    for i in range(args.num_chunks):
+        mp4_file = chunk_dir / f"{index}-{i}.mp4"
+        shutil.copy(args.file, mp4_file)
+        await transcoder.convert(str(mp4_file), str(mp4_file.with_suffix(".ts")))
+
+
+async def benchmark(use_pyav: bool, remux: bool) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[stream(index, use_pyav, remux) for index in range(args.streams)]
+    )
+    return time.perf_counter() - start
+
+
+modes = []
+if processing_utils.ffmpeg_installed():
+    modes += [("ffmpeg encode", False, False), ("ffmpeg remux", False, True)]
+if transcoding_utils.pyav_installed():
+    modes += [("pyav encode", True, False), ("pyav remux", True, True)]
+if not modes:
+    print("Neither ffmpeg nor PyAV is installed")
+
+print(f"chunks={args.num_chunks} streams={args.streams} file={args.file}")
+for name, use_pyav, remux in modes:
+    elapsed = asyncio.run(benchmark(use_pyav, remux))
+    print(
+        f"  {name}: {args.num_chunks * args.streams / elapsed:.1f} chunks/s "
+        f"({elapsed * 1000:.0f}ms)"
+    )
+shutil.rmtree(chunk_dir)
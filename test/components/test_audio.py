@@ -2,6 +2,7 @@ import filecmp
 from copy import deepcopy
 from difflib import SequenceMatcher
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -143,6 +144,38 @@ class TestAudio:
         audio = gr.Audio(value=x_wav["path"])
         assert utils.is_in_or_equal(audio.value["path"], audio.GRADIO_CACHE)
 
+    def test_preprocess_checks_length_without_decoding_twice(self, test_file_dir):
+        payload = FileData(path=str(test_file_dir / "audio_sample.wav"))
+        with patch.object(
+            processing_utils, "audio_from_file", wraps=processing_utils.audio_from_file
+        ) as audio_from_file:
+            sample_rate, data = gr.Audio(type="numpy", min_length=1).preprocess(payload)
+            assert audio_from_file.call_count == 1
+            assert len(data) / sample_rate == pytest.approx(1.00575)
+
+            with pytest.raises(gr.Error, match="Audio is too long"):
+                gr.Audio(type="numpy", max_length=0.5).preprocess(payload)
+            assert audio_from_file.call_count == 1
+
+    def test_preprocess_checks_length_of_other_containers(
+        self, test_file_dir, tmp_path
+    ):
+        # The duration of files that are not WAV, MP3, FLAC or Ogg comes from ffprobe, and
+        # must not be guessed from bytes in the file that look like an MP3 frame
+        path = tmp_path / "clip.m4a"
+        path.write_bytes((test_file_dir / "muted_video_sample.mp4").read_bytes())
+        payload = FileData(path=str(path))
+        with (
+            patch.object(processing_utils, "ffmpeg_installed", return_value=True),
+            patch.object(
+                processing_utils, "get_media_metadata", return_value={"duration": 5.0}
+            ),
+        ):
+            audio = gr.Audio(type="filepath", min_length=2, max_length=10)
+            assert audio.preprocess(payload) == str(path)
+            with pytest.raises(gr.Error, match="Audio is too long"):
+                gr.Audio(type="filepath", max_length=4).preprocess(payload)
+
     def test_in_interface(self):
         def reverse_audio(audio):
             sr, data = audio
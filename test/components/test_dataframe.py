@@ -1,3 +1,4 @@
+from contextvars import copy_context
 from datetime import datetime
 
 import numpy as np
@@ -6,7 +7,8 @@ import polars as pl
 import pytest
 
 import gradio as gr
-from gradio.components.dataframe import DataframeData
+from gradio.components.dataframe import DataframeData, LazyFrameStore
+from gradio.context import LocalContext
 
 
 class TestDataframe:
@@ -65,6 +67,8 @@ class TestDataframe:
             "show_fullscreen_button": False,
             "show_copy_button": False,
             "max_chars": None,
+            "page_size": None,
+            "server_fns": ["get_rows"],
         }
         dataframe_input = gr.Dataframe()
         output = dataframe_input.preprocess(DataframeData(**x_data))
@@ -117,6 +121,8 @@ class TestDataframe:
             "show_fullscreen_button": False,
             "max_chars": None,
             "show_copy_button": False,
+            "page_size": None,
+            "server_fns": ["get_rows"],
         }
 
         dataframe_input = gr.Dataframe(column_widths=["100px", 200, "50%"])
@@ -509,3 +515,174 @@ class TestDataframe:
         )
         result = ["str", "number", "number", "str", "str", "date", "bool"]
         assert dataframe.datatype == result
+
+
+def run_in_session(session_hash, fn, *args, blocks=None):
+    def run():
+        LocalContext.session_hash.set(session_hash)
+        LocalContext.blocks.set(blocks)
+        return fn(*args)
+
+    return copy_context().run(run)
+
+
+class TestLazyDataframe:
+    def test_only_first_page_is_sent(self):
+        df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 7})
+        dataframe = gr.Dataframe(page_size=10)
+        value = dataframe.postprocess(df)
+        assert value.data == df.head(10).values.tolist()
+        assert value.total_rows == 1000
+        assert value.row_indices == list(range(10))
+        assert dataframe.row_count[1] == "fixed"
+        assert dataframe.col_count[1] == "fixed"
+
+    def test_small_values_are_sent_at_once(self):
+        dataframe = gr.Dataframe(page_size=10)
+        value = dataframe.postprocess(pd.DataFrame({"a": [1, 2, 3]}))
+        assert value.model_dump() == {
+            "headers": ["a"],
+            "data": [[1], [2], [3]],
+            "metadata": None,
+        }
+
+    def test_get_rows_sorts_and_filters_whole_frame(self):
+        df = pd.DataFrame(
+            {
+                "name": [f"item {i}" for i in range(1000)],
+                "price": np.arange(1000) % 100,
+            }
+        )
+        dataframe = gr.Dataframe(page_size=10)
+        value = dataframe.postprocess(df)
+        page = dataframe.get_rows(
+            {
+                "frame_id": value.frame_id,
+                "start": 0,
+                "end": 3,
+                "sort_columns": [
+                    {"col": 1, "direction": "desc"},
+                    {"col": 0, "direction": "asc"},
+                ],
+                "filter_columns": [
+                    {
+                        "col": 0,
+                        "datatype": "string",
+                        "filter": "Ends with",
+                        "value": "9",
+                    },
+                    {"col": 1, "datatype": "number", "filter": ">", "value": "50"},
+                ],
+            }
+        )
+        assert page["total_rows"] == 50
+        assert page["data"] == [["item 199", 99], ["item 299", 99], ["item 399", 99]]
+        assert page["row_indices"] == [199, 299, 399]
+
+    def test_edited_cells_are_applied_to_whole_frame(self):
+        df = pd.DataFrame({"a": np.arange(1000), "b": ["x"] * 1000})
+        dataframe = gr.Dataframe(page_size=10)
+        value = dataframe.postprocess(df)
+        payload = DataframeData(
+            headers=value.headers,
+            data=value.data,
+            frame_id=value.frame_id,
+            edits=[(500, 0, 5), (999, 1, "y")],
+        )
+        output = dataframe.preprocess(payload)
+        assert isinstance(output, pd.DataFrame)
+        assert output.shape == (1000, 2)
+        assert output["a"][500] == 5
+        assert output["b"][999] == "y"
+        assert df["a"][500] == 500
+
+    def test_returned_frame_is_copied(self):
+        df = pd.DataFrame({"a": np.arange(100)})
+        dataframe = gr.Dataframe(page_size=10)
+        value = dataframe.postprocess(df)
+        df.loc[50, "a"] = -1
+        page = dataframe.get_rows({"frame_id": value.frame_id, "start": 50, "end": 51})
+        assert page["data"] == [[50]]
+
+    def test_missing_frame_raises_error(self):
+        with gr.Blocks() as demo:
+            dataframe = gr.Dataframe(page_size=10)
+        df = pd.DataFrame({"a": np.arange(100)})
+        value = run_in_session("1", dataframe.postprocess, df, blocks=demo)
+        payload = DataframeData(
+            headers=value.headers,
+            data=value.data,
+            frame_id=value.frame_id,
+            edits=[(50, 0, 5)],
+        )
+        assert (
+            run_in_session("1", dataframe.preprocess, payload, blocks=demo)["a"][50]
+            == 5
+        )
+        # Frames are only available to the session they were sent to
+        with pytest.raises(gr.Error, match="no longer stored"):
+            run_in_session("2", dataframe.preprocess, payload, blocks=demo)
+        with pytest.raises(gr.Error, match="no longer stored"):
+            run_in_session(
+                "2",
+                dataframe.get_rows,
+                {"frame_id": value.frame_id, "start": 0, "end": 10},
+                blocks=demo,
+            )
+        # and to the Blocks they were sent from
+        with gr.Blocks() as other_demo:
+            pass
+        with pytest.raises(gr.Error, match="no longer stored"):
+            run_in_session("1", dataframe.preprocess, payload, blocks=other_demo)
+
+        # A session only keeps the last frame that the Dataframe sent to it
+        run_in_session("1", dataframe.postprocess, df, blocks=demo)
+        with pytest.raises(gr.Error, match="no longer stored"):
+            run_in_session("1", dataframe.preprocess, payload, blocks=demo)
+
+    def test_frames_of_rendered_blocks_are_kept(self):
+        df = pd.DataFrame({"a": np.arange(100)})
+        with gr.Blocks() as inner:
+            dataframe = gr.Dataframe(df, page_size=10)
+        with gr.Blocks() as demo:
+            inner.render()
+        page = run_in_session(
+            "1",
+            dataframe.get_rows,
+            {"frame_id": dataframe.value["frame_id"], "start": 50, "end": 51},
+            blocks=demo,
+        )
+        assert page["data"] == [[50]]
+        assert demo.lazy_frames.size > 0
+        assert inner.lazy_frames.size == 0
+
+    def test_frames_are_dropped_after_ttl_or_over_budget(self):
+        df = pd.DataFrame({"a": np.arange(100)})
+        nbytes = df.memory_usage(deep=True).sum()
+        with gr.Blocks() as demo:
+            dataframe = gr.Dataframe(page_size=10)
+        demo.lazy_frames = store = LazyFrameStore(max_bytes=nbytes * 3)
+        initial_id = run_in_session(None, dataframe.postprocess, df, blocks=demo)
+        initial_id = initial_id.frame_id
+        frame_ids = [
+            run_in_session(str(i), dataframe.postprocess, df, blocks=demo).frame_id
+            for i in range(3)
+        ]
+        assert store.get("0", frame_ids[0]) is None
+        assert store.get("1", frame_ids[1]) is not None
+        assert store.get("2", frame_ids[2]) is not None
+
+        store.ttl = 0
+        assert store.get("2", frame_ids[2]) is None
+        # Frames sent outside of a session are kept, e.g. for the initial value, but
+        # count towards the budget
+        assert store.size == nbytes
+        assert store.get("3", initial_id) is not None
+
+        # and are only dropped once no frames of sessions can be dropped instead
+        store.ttl = 3600
+        store.max_bytes = nbytes * 1.5
+        frame_id = run_in_session("1", dataframe.postprocess, df, blocks=demo).frame_id
+        assert store.get("1", frame_id) is not None
+        assert store.get("3", initial_id) is None
+        assert store.size == nbytes
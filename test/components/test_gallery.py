@@ -130,3 +130,24 @@ class TestGallery:
             assert output.root[0].image.path and output.root[0].image.path.endswith(
                 ".jpeg"
             )
+
+    def test_gallery_thumbnails(self):
+        gallery = gr.Gallery(thumbnail_size=64)
+        image = np.random.randint(0, 255, (300, 200, 3), dtype=np.uint8)
+        output = gallery.postprocess(
+            [image, PIL.Image.fromarray(image), "test/test_files/bus.png"]
+        )
+        for item in output.root:
+            assert isinstance(item, GalleryImage) and item.thumbnail
+            assert max(PIL.Image.open(item.thumbnail.path).size) <= 64
+        assert isinstance(output.root[0], GalleryImage)
+        assert PIL.Image.open(output.root[0].image.path).size == (200, 300)
+        assert output.root[2].image.path == "test/test_files/bus.png"
+
+        # The files of an image that is returned again are reused
+        again = gallery.postprocess([image])
+        assert again.root[0].model_dump() == output.root[0].model_dump()
+
+    def test_gallery_without_thumbnails(self):
+        output = gr.Gallery().postprocess(["test/test_files/bus.png"])
+        assert "thumbnail" not in output.model_dump()[0]
@@ -1,4 +1,11 @@
+import json
+
+import numpy as np
+import orjson
+import pandas as pd
+
 import gradio as gr
+from gradio.routes import numpy_to_list
 
 from .plot_data import barley, simple
 
@@ -30,3 +37,104 @@ class TestNativePlot:
             y="yield",
         )
         assert plot.value["mark"] == "bar"
+
+    def test_numeric_rows_are_kept_as_numpy_array(self):
+        df = pd.DataFrame(
+            {
+                "time": pd.date_range("2024-01-01", periods=3, freq="h"),
+                "count": [1, 2, 3],
+            }
+        )
+        value = gr.LinePlot(x="time", y="count").postprocess(df).model_dump()
+        assert isinstance(value["data"], np.ndarray)
+        assert value["data"].dtype == np.int64
+        assert value["data"].flags.c_contiguous
+        assert value["columns"] == ["time", "count"]
+        assert orjson.dumps(
+            value["data"], option=orjson.OPT_SERIALIZE_NUMPY
+        ) == orjson.dumps(
+            orjson.loads(df.to_json(orient="split", date_unit="ms"))["data"]
+        )
+
+        df = pd.DataFrame({"x": [0.5, 1.5, 2.5], "y": [1.5, np.nan, 3.0]})
+        value = gr.LinePlot(x="x", y="y").postprocess(df).model_dump()
+        assert isinstance(value["data"], np.ndarray)
+        assert (
+            orjson.dumps(value["data"], option=orjson.OPT_SERIALIZE_NUMPY)
+            == b"[[0.5,1.5],[1.5,null],[2.5,3.0]]"
+        )
+
+    def test_mixed_int_and_float_rows_keep_ints(self):
+        df = pd.DataFrame({"x": [1, 2], "y": [1.0, np.nan]})
+        value = gr.LinePlot(x="x", y="y").postprocess(df)
+        assert value is not None
+        assert value.data == [[1, 1.0], [2, None]]
+        assert json.dumps(value.model_dump()["data"]) == "[[1, 1.0], [2, null]]"
+
+    def test_numeric_rows_are_flagged_as_lists(self, tmp_path):
+        df = pd.DataFrame({"x": [1.0, 2.0], "y": [0.5, np.nan]})
+        plot = gr.LinePlot(x="x", y="y")
+        value = plot.postprocess(df)
+        assert value is not None
+        assert isinstance(value.data, np.ndarray)
+        rows = [[1.0, 0.5], [2.0, None]]
+        assert json.loads(plot.flag(value.model_dump(), tmp_path))["data"] == rows
+        assert json.loads(value.model_dump_json())["data"] == rows
+        assert (
+            json.dumps(value.data, default=numpy_to_list) == "[[1.0, 0.5], [2.0, null]]"
+        )
+
+    def test_non_numeric_rows_are_serialized_as_json(self):
+        plot = gr.BarPlot(x="a", y="b")
+        value = plot.postprocess(simple).model_dump()
+        assert isinstance(value["data"], list)
+        assert value["data"][0][0] == "A"
+
+    def test_max_points_decimates_lines_to_min_and_max_of_each_bucket(self):
+        x = np.arange(10_000, dtype=np.float64)
+        df = pd.DataFrame({"x": x, "y": np.sin(x)})
+        value = gr.LinePlot(x="x", y="y", max_points=100).postprocess(df)
+        assert value is not None
+        assert len(value.data) <= 100
+        assert not value.aggregated
+        y = value.data[:, 1]
+        assert y.max() == df["y"].max()
+        assert y.min() == df["y"].min()
+        assert np.all(np.diff(value.data[:, 0]) > 0)
+
+    def test_max_points_aggregates_bins_on_the_server(self):
+        df = pd.DataFrame(
+            {
+                "time": pd.date_range("2024-01-01", periods=7200, freq="s"),
+                "value": np.ones(7200),
+                "series": ["a", "b"] * 3600,
+            }
+        )
+        plot = gr.BarPlot(
+            x="time",
+            y="value",
+            color="series",
+            x_bin="1h",
+            y_aggregate="count",
+            max_points=100,
+        )
+        value = plot.postprocess(df)
+        assert value is not None
+        assert value.aggregated
+        assert value.columns == ["time", "series", "value"]
+        assert value.datatypes["time"] == "temporal"
+        assert sorted(row[-1] for row in value.data) == [1800, 1800, 1800, 1800]
+
+    def test_max_points_only_sends_rows_within_x_lim(self):
+        df = pd.DataFrame({"x": np.arange(10_000), "y": np.arange(10_000)})
+        value = gr.LinePlot(
+            x="x", y="y", x_lim=[100, 199], max_points=1000
+        ).postprocess(df)
+        assert value is not None
+        assert value.data[:, 0].tolist() == list(range(100, 200))
+
+    def test_rows_are_not_reduced_without_max_points(self):
+        df = pd.DataFrame({"x": np.arange(10_000), "y": np.arange(10_000)})
+        value = gr.LinePlot(x="x", y="y", x_lim=[100, 199]).postprocess(df)
+        assert value is not None
+        assert len(value.data) == 10_000
@@ -1,6 +1,8 @@
+import asyncio
 import os
 import shutil
 import tempfile
+import time
 from copy import deepcopy
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -201,6 +203,46 @@ class TestVideo:
             output = output.model_dump()
             assert processing_utils.video_is_playable(output["video"]["path"])
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        not processing_utils.ffmpeg_installed(), reason="ffmpeg is not installed"
+    )
+    async def test_stream_output_does_not_block_event_loop(
+        self, tmp_path, test_file_dir
+    ):
+        video = gr.Video(streaming=True)
+        files = []
+        for i in range(4):
+            files.append(str(tmp_path / f"{i}.mp4"))
+            shutil.copy(test_file_dir / "video_sample.mp4", files[-1])
+
+        max_lag = 0.0
+        done = False
+
+        async def measure_lag():
+            nonlocal max_lag
+            while not done:
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+
+        ticker = asyncio.create_task(measure_lag())
+        chunks = await asyncio.gather(
+            *[
+                video.stream_output(file, f"stream-{i}", first_chunk=True)
+                for i, file in enumerate(files)
+            ]
+        )
+        done = True
+        await ticker
+
+        for chunk, _ in chunks:
+            assert chunk is not None
+            assert chunk["extension"] == ".ts"
+            assert chunk["duration"] > 0
+            assert chunk["data"]
+        assert max_lag < 0.2
+
     @patch("pathlib.Path.exists", MagicMock(return_value=False))
     @patch("gradio.components.video.FFmpeg")
     def test_video_preprocessing_flips_video_for_webcam(self, mock_ffmpeg):
@@ -0,0 +1,120 @@
+import struct
+import wave
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from gradio.audio_utils import duration_from_header, read_wav, write_wav
+
+
+@pytest.mark.parametrize(
+    "file_name, duration",
+    [
+        ("audio_sample.wav", 1.00575),
+        ("audio_sample.mp3", 1.0),
+        ("audio_sample.flac", 0.5),
+        ("audio_sample.ogg", 1.0),
+    ],
+)
+def test_duration_from_header(file_name, duration, test_file_dir):
+    assert duration_from_header(test_file_dir / file_name) == pytest.approx(duration)
+
+
+def test_duration_from_header_of_unknown_files(tmp_path, test_file_dir):
+    for file_name in [
+        "video_sample.mp4",
+        "muted_video_sample.mp4",
+        "playable_but_bad_container.mp4",
+        "video_sample.webm",
+        "sample_file.pdf",
+    ]:
+        assert duration_from_header(test_file_dir / file_name) is None
+    (tmp_path / "empty.wav").write_bytes(b"")
+    assert duration_from_header(tmp_path / "empty.wav") is None
+    assert duration_from_header(tmp_path / "missing.wav") is None
+
+
+def test_duration_from_header_of_mp3_without_id3_tag(tmp_path, test_file_dir):
+    data = (test_file_dir / "audio_sample.mp3").read_bytes()
+    frames = data[data.index(b"\xff\xe3") :]
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(frames)
+    assert duration_from_header(path) == pytest.approx(1.0)
+    # Sync bytes that are not at the start of a file without an ID3v2 tag are ignored
+    path.write_bytes(b"\x00" + frames)
+    assert duration_from_header(path) is None
+
+
+@pytest.mark.parametrize("sample_width", [1, 2, 3, 4])
+@pytest.mark.parametrize("channels", [1, 2])
+def test_read_wav_matches_pydub(sample_width, channels, tmp_path):
+    path = tmp_path / "audio.wav"
+    rng = np.random.default_rng(0)
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(sample_width)
+        f.setframerate(16000)
+        f.writeframes(
+            rng.integers(0, 256, 1000 * channels * sample_width, np.uint8).tobytes()
+        )
+
+    sample_rate, data = read_wav(path)  # type: ignore
+    segment = AudioSegment.from_file(path)
+    expected = np.array(segment.get_array_of_samples())
+    if channels > 1:
+        expected = expected.reshape(-1, channels)
+    assert sample_rate == 16000
+    assert data.dtype == expected.dtype
+    np.testing.assert_array_equal(data, expected)
+    assert duration_from_header(path) == pytest.approx(1000 / 16000)
+
+
+def test_read_wav_of_other_formats(tmp_path, test_file_dir):
+    # 32-bit float samples are left to ffmpeg
+    path = tmp_path / "float.wav"
+    samples = np.zeros(800, dtype="<f4").tobytes()
+    fmt = struct.pack("<HHIIHH", 3, 1, 8000, 8000 * 4, 4, 32)
+    path.write_bytes(
+        b"RIFF"
+        + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(samples))
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt))
+        + fmt
+        + b"data"
+        + struct.pack("<I", len(samples))
+        + samples
+    )
+    assert read_wav(path) is None
+    assert duration_from_header(path) == pytest.approx(0.1)
+    assert read_wav(test_file_dir / "audio_sample.mp3") is None
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.int32])
+@pytest.mark.parametrize("shape", [(1000,), (1000, 2)])
+def test_write_wav_matches_wave(dtype, shape, tmp_path, monkeypatch):
+    monkeypatch.setattr("gradio.audio_utils.WAV_WRITE_CHUNK_FRAMES", 300)
+    info = np.iinfo(dtype)
+    data = np.random.default_rng(0).integers(info.min, info.max, shape, dtype)
+    write_wav(tmp_path / "audio.wav", 16000, data)
+
+    with wave.open(str(tmp_path / "expected.wav"), "wb") as f:
+        f.setnchannels(1 if len(shape) == 1 else shape[1])
+        f.setsampwidth(data.dtype.itemsize)
+        f.setframerate(16000)
+        f.writeframes(data.tobytes())
+    assert (tmp_path / "audio.wav").read_bytes() == (
+        tmp_path / "expected.wav"
+    ).read_bytes()
+
+    # Samples that are not contiguous are written in the same order
+    write_wav(tmp_path / "transposed.wav", 16000, np.asfortranarray(data))
+    sample_rate, read = read_wav(tmp_path / "transposed.wav")  # type: ignore
+    assert sample_rate == 16000
+    np.testing.assert_array_equal(read, data)
+
+
+def test_write_wav_of_other_formats(tmp_path):
+    with pytest.raises(ValueError):
+        write_wav(tmp_path / "audio.wav", 16000, np.zeros(10, dtype=np.float32))
@@ -1,11 +1,13 @@
 import asyncio
 import copy
+import datetime
 import io
 import json
 import os
 import pathlib
 import random
 import sys
+import threading
 import time
 import uuid
 import warnings
@@ -24,11 +26,17 @@ from gradio_client import Client, media_data
 from PIL import Image
 
 import gradio as gr
-from gradio import blocks, helpers
+from gradio import blocks, helpers, processing_utils
 from gradio.data_classes import GradioModel, GradioRootModel
 from gradio.events import SelectData
 from gradio.exceptions import DuplicateBlockError
 from gradio.route_utils import API_PREFIX
+from gradio.state_holder import (
+    InMemoryStateBackend,
+    SessionState,
+    SQLiteStateBackend,
+    StateHolder,
+)
 from gradio.utils import assert_configs_are_equivalent_besides_ids, cancel_tasks
 
 pytest_plugins = ("pytest_asyncio",)
@@ -578,6 +586,29 @@ class TestBlocksPostprocessing:
             for o, c in zip(output, io_components, strict=False)
         )
 
+    @pytest.mark.asyncio
+    async def test_postprocess_moves_files_to_cache_once(self):
+        with gr.Blocks() as demo:
+            gallery = gr.Gallery()
+            btn = gr.Button()
+            btn.click(lambda: None, inputs=[], outputs=gallery)
+
+        state = SessionState(demo)
+        with patch(
+            "gradio.processing_utils.async_move_files_to_cache",
+            wraps=processing_utils.async_move_files_to_cache,
+        ) as move_files_to_cache:
+            output = await demo.postprocess_data(
+                demo.fns[0], [("gradio/test_data/cheetah1.jpg", "cheetah")], state
+            )
+        assert move_files_to_cache.call_count == 1
+        assert state.config_values[gallery._id]["props"]["value"] is output[0]
+
+        file = output[0][0]["image"]
+        url = file["url"]
+        processing_utils.add_root_url(output, "http://localhost:7860", None)
+        assert file["url"] == url
+
     @pytest.mark.asyncio
     async def test_blocks_does_not_replace_keyword_literal(self):
         with gr.Blocks() as demo:
@@ -934,6 +965,180 @@ class TestStateHolder:
             client.predict(api_name="/set_multiselect")
             assert client.predict("Choice 1", api_name="/predict") == ["Choice 1"]
 
+    def test_session_state_only_stores_updated_configs(self):
+        with gr.Blocks() as demo:
+            textbox = gr.Textbox("default")
+            dropdown = gr.Dropdown(choices=["a", "b"], value="a")
+
+        def values(state):
+            configs = {c["id"]: c for c in state.components}
+            return [
+                configs[_id]["props"]["value"] for _id in (textbox._id, dropdown._id)
+            ]
+
+        state = SessionState(demo)
+        assert state.config_values == {}
+        assert values(state) == ["default", "a"]
+
+        state._update_value_in_config(textbox._id, "updated")
+        assert list(state.config_values) == [textbox._id]
+        assert values(state) == ["updated", "a"]
+        assert SessionState(demo).config_values == {}
+        assert textbox.value == "default"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("change_detection", ["value", "identity"])
+    async def test_state_change_detection(self, change_detection):
+        with gr.Blocks() as demo:
+            state = gr.State([], change_detection=change_detection)
+            btn = gr.Button()
+            btn.click(lambda x: x.append(1) or x, state, state)
+            btn.click(lambda x: [*x, 1], state, state)
+            state.change(lambda: None)
+
+        session = SessionState(demo)
+        output = await demo.process_api(0, [None], state=session)
+        assert output["changed_state_ids"] == (
+            [state._id] if change_detection == "value" else []
+        )
+        output = await demo.process_api(1, [None], state=session)
+        assert output["changed_state_ids"] == [state._id]
+        assert session[state._id] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_state_change_detection_by_version(self):
+        class History(list):
+            version = 0
+
+            def add(self, item):
+                self.append(item)
+                self.version += 1
+                return self
+
+        with gr.Blocks() as demo:
+            state = gr.State(
+                History(), change_detection=lambda history: history.version
+            )
+            btn = gr.Button()
+            btn.click(lambda x: x.add(1), state, state)
+            # Changes that do not update the version are not detected
+            btn.click(lambda x: x.append(2) or x, state, state)
+            state.change(lambda: None)
+
+        session = SessionState(demo)
+        output = await demo.process_api(0, [None], state=session)
+        assert output["changed_state_ids"] == [state._id]
+        output = await demo.process_api(1, [None], state=session)
+        assert output["changed_state_ids"] == []
+        assert session[state._id] == [1, 2]
+
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_state_holder_spills_evicted_sessions_to_backend(self, backend, tmp_path):
+        with gr.Blocks() as demo:
+            state = gr.State()
+        demo.state_session_capacity = 1
+        demo.state_backend = (
+            InMemoryStateBackend()
+            if backend == "memory"
+            else SQLiteStateBackend(tmp_path / "state.db")
+        )
+        state_holder = StateHolder()
+        state_holder.set_blocks(demo)
+
+        state_holder["1"][state._id] = [1, 2, 3]
+        state_holder["2"][state._id] = "two"
+        assert "1" not in state_holder.session_data
+        assert "1" in state_holder
+        assert state_holder["1"][state._id] == [1, 2, 3]
+        assert state_holder["2"][state._id] == "two"
+        assert state_holder.stats == {"misses": 4, "spills": 3, "restores": 2}
+
+    def test_state_holder_memory_budget(self):
+        with gr.Blocks() as demo:
+            state = gr.State()
+        demo.state_memory_budget = 50_000
+        state_holder = StateHolder()
+        state_holder.set_blocks(demo)
+
+        for i in range(10):
+            state_holder[str(i)][state._id] = "x" * 20_000
+            state_holder.save(str(i))
+        assert list(state_holder.session_data) == ["8", "9"]
+        assert state_holder.stats["drops"] == 8
+
+    def test_state_holder_only_estimates_size_after_save(self):
+        with gr.Blocks() as demo:
+            state = gr.State()
+        demo.state_memory_budget = 50_000
+        state_holder = StateHolder()
+        state_holder.set_blocks(demo)
+
+        state_holder["1"][state._id] = "x" * 20_000
+        with patch.object(
+            SessionState, "estimated_size", return_value=0
+        ) as estimated_size:
+            for _ in range(3):
+                state_holder["1"]
+            assert estimated_size.call_count == 0
+            state_holder.save("1")
+            assert estimated_size.call_count == 1
+
+    def test_delete_expired_state_with_shared_backend(self, tmp_path):
+        with gr.Blocks() as demo:
+            state = gr.State(time_to_live=0)
+        demo.state_backend = SQLiteStateBackend(tmp_path / "state.db", shared=True)
+        state_holder = StateHolder()
+        state_holder.set_blocks(demo)
+        expired = datetime.datetime.now() - datetime.timedelta(seconds=10)
+        for session_id in ["1", "2", "3"]:
+            state_holder[session_id][state._id] = session_id
+            state_holder[session_id]._state_ttl[state._id] = (0, expired)
+
+        state_holder.delete_all_expired_state()
+        for session_id in ["1", "2", "3"]:
+            assert state._id not in state_holder[session_id].state_data
+
+    def test_shared_sqlite_state_backend_between_workers(self, tmp_path):
+        with gr.Blocks() as demo:
+            state = gr.State()
+        demo.state_backend = SQLiteStateBackend(tmp_path / "state.db", shared=True)
+        worker_1 = StateHolder()
+        worker_1.set_blocks(demo)
+        worker_1["session"][state._id] = {"count": 1}
+        worker_1.save("session")
+
+        demo.state_backend = SQLiteStateBackend(tmp_path / "state.db", shared=True)
+        worker_2 = StateHolder()
+        worker_2.set_blocks(demo)
+        assert worker_2["session"][state._id] == {"count": 1}
+        worker_2["session"][state._id] = {"count": 2}
+        worker_2.save("session")
+        assert worker_1["session"][state._id] == {"count": 2}
+
+    def test_shared_state_backend_only_reloads_sessions_saved_elsewhere(self, tmp_path):
+        with gr.Blocks() as demo:
+            state = gr.State()
+        demo.state_backend = SQLiteStateBackend(tmp_path / "state.db", shared=True)
+        worker_1 = StateHolder()
+        worker_1.set_blocks(demo)
+        worker_1["session"][state._id] = {"count": 1}
+        worker_1.save("session")
+
+        # An event that is still running changes the state without saving it yet
+        worker_1["session"][state._id]["count"] = 2
+        with patch.object(
+            SQLiteStateBackend, "load", wraps=demo.state_backend.load
+        ) as load:
+            assert worker_1["session"][state._id] == {"count": 2}
+            load.assert_not_called()
+
+        demo.state_backend = SQLiteStateBackend(tmp_path / "state.db", shared=True)
+        worker_2 = StateHolder()
+        worker_2.set_blocks(demo)
+        worker_2["session"][state._id] = {"count": 3}
+        worker_2.save("session")
+        assert worker_1["session"][state._id] == {"count": 3}
+
 
 class TestCallFunction:
     @pytest.mark.asyncio
@@ -1114,6 +1319,37 @@ class TestBatchProcessing:
         output = demo("Abubakar")
         assert output == "Hello Abubakar"
 
+    @pytest.mark.asyncio
+    async def test_parallel_processing_of_batch(self):
+        def batch_fn(words):
+            return ([word.upper() for word in words],)
+
+        with gr.Blocks() as demo:
+            text = gr.Textbox()
+            output = gr.Textbox()
+            btn = gr.Button()
+            btn.click(
+                batch_fn,
+                inputs=text,
+                outputs=output,
+                batch=True,
+                parallel_processing=True,
+            )
+
+        threads = set()
+
+        def slow_preprocess(payload):
+            threads.add(threading.get_ident())
+            time.sleep(0.2)
+            return payload
+
+        text.preprocess = slow_preprocess
+        start = time.perf_counter()
+        output = await demo.process_api(0, [["a", "b", "c", "d"]])
+        assert time.perf_counter() - start < 0.6
+        assert output["data"] == [("A", "B", "C", "D")]
+        assert len(threads) == 4 and threading.get_ident() not in threads
+
     @pytest.mark.asyncio
     async def test_functions_multiple_parameters(self):
         def regular_fn(word1, word2):
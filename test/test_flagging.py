@@ -1,6 +1,10 @@
+import json
 import os
 import pathlib
+import sqlite3
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from unittest.mock import MagicMock
 
 import pytest
@@ -45,7 +49,127 @@ class TestDefaultFlagging:
             io = gr.Interface(lambda x: x, "text", "text", flagging_dir=tmpdirname)
             io.launch(prevent_thread_lock=True)
             io.flagging_callback.flag(["test", "test"])
-            assert os.listdir(tmpdirname) == ["dataset1.csv"]
+            assert sorted(os.listdir(tmpdirname)) == ["dataset1.csv"]
+            io.flagging_callback.flush()
+            assert sorted(os.listdir(tmpdirname)) == [
+                ".dataset1.csv.rows",
+                "dataset1.csv",
+            ]
+
+    def test_row_count_persists_across_restarts(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            textbox = gr.Textbox(label="text")
+            logger = flagging.CSVLogger(verbose=False)
+            logger.setup([textbox], tmpdirname)
+            assert logger.flag(["a"]) == 1
+            assert logger.flag(["multi\nline"]) == 2
+            logger.flush()
+
+            # The row count is read from the file next to the dataset instead of counting rows
+            row_count_file = pathlib.Path(tmpdirname) / ".dataset1.csv.rows"
+            saved = json.loads(row_count_file.read_text())
+            assert saved["rows"] == 2
+            row_count_file.write_text(json.dumps({**saved, "rows": 100}))
+            logger = flagging.CSVLogger(verbose=False)
+            logger.setup([textbox], tmpdirname)
+            assert logger.flag(["b"]) == 101
+
+            # The rows are counted again if the file was changed by something else
+            with open(os.path.join(tmpdirname, "dataset1.csv"), "a") as f:
+                f.write("c,2024-01-01\n")
+            logger = flagging.CSVLogger(verbose=False)
+            logger.setup([textbox], tmpdirname)
+            assert logger.flag(["d"]) == 5
+
+    def test_row_count_saved_in_batches(self, monkeypatch):
+        monkeypatch.setattr(flagging.CSVLogger, "row_count_save_interval", 3)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            logger = flagging.CSVLogger(verbose=False)
+            logger.setup([gr.Textbox(label="text")], tmpdirname)
+            row_count_file = pathlib.Path(tmpdirname) / ".dataset1.csv.rows"
+            logger.flag(["a"])
+            logger.flag(["b"])
+            assert not row_count_file.exists()
+            logger.flag(["c"])
+            assert json.loads(row_count_file.read_text())["rows"] == 3
+            logger.flag(["d"])
+            assert json.loads(row_count_file.read_text())["rows"] == 3
+            logger.flush()
+            assert json.loads(row_count_file.read_text())["rows"] == 4
+
+    def test_flush_registered_once(self, monkeypatch):
+        register = MagicMock()
+        monkeypatch.setattr(flagging.atexit, "register", register)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            logger = flagging.CSVLogger(verbose=False)
+            logger.setup([gr.Textbox(label="text")], tmpdirname)
+            logger.setup([gr.Textbox(label="text")], tmpdirname)
+            register.assert_called_once_with(logger.flush)
+
+    def test_buffered_writes(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            logger = flagging.CSVLogger(verbose=False, buffer_size=3)
+            logger.setup([gr.Textbox(label="text")], tmpdirname)
+            dataset = pathlib.Path(tmpdirname) / "dataset1.csv"
+            assert logger.flag(["a"]) == 1
+            assert logger.flag(["b"]) == 2
+            assert len(dataset.read_text().splitlines()) == 1
+            assert logger.flag(["c"]) == 3
+            assert len(dataset.read_text().splitlines()) == 4
+            assert logger.flag(["d"]) == 4
+            logger.flush()
+            assert len(dataset.read_text().splitlines()) == 5
+
+
+class TestSQLiteFlagging:
+    def test_sqlite_flagging_callback(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            io = gr.Interface(
+                lambda x: x,
+                "text",
+                "text",
+                flagging_dir=tmpdirname,
+                flagging_callback=flagging.SQLiteLogger(),
+            )
+            io.launch(prevent_thread_lock=True)
+            assert io.flagging_callback.flag(["test", "test"]) == 1
+            assert io.flagging_callback.flag(["test2", "test2"]) == 2
+            io.close()
+
+            with closing(
+                sqlite3.connect(os.path.join(tmpdirname, "dataset.db"))
+            ) as connection:
+                rows = connection.execute(
+                    "SELECT * FROM dataset ORDER BY id"
+                ).fetchall()
+            assert [row[:3] for row in rows] == [
+                (1, "test", "test"),
+                (2, "test2", "test2"),
+            ]
+
+    def test_new_table_when_columns_change(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            logger = flagging.SQLiteLogger(verbose=False)
+            logger.setup([gr.Textbox(label="a")], tmpdirname)
+            assert logger.flag(["1"]) == 1
+            logger = flagging.SQLiteLogger(verbose=False)
+            logger.setup([gr.Textbox(label="a")], tmpdirname)
+            assert logger.flag(["2"]) == 2
+            logger = flagging.SQLiteLogger(verbose=False)
+            logger.setup([gr.Textbox(label="b")], tmpdirname)
+            assert logger.flag(["3"]) == 1
+            assert logger.dataset_table == "dataset2"
+
+    def test_concurrent_first_flags_create_table_once(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            logger = flagging.SQLiteLogger(verbose=False)
+            logger.setup([gr.Textbox(label="a")], tmpdirname)
+            create_table = MagicMock(wraps=logger._create_table)
+            logger._create_table = create_table
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                counts = list(executor.map(logger.flag, [[str(i)] for i in range(8)]))
+            create_table.assert_called_once()
+            assert sorted(counts) == list(range(1, 9))
 
 
 class TestSimpleFlagging:
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 import tempfile
 import time
@@ -293,6 +294,21 @@ class TestProcessExamples:
             "data:audio/wav;base64,UklGRgA/"
         )
 
+    def test_caching_numeric_plot(self, patched_cache_folder, connect):
+        import pandas as pd
+
+        df = pd.DataFrame({"x": [1, 2, 3], "y": [1.5, 2.5, 0.5]})
+        io = gr.Interface(
+            lambda _: df,
+            "text",
+            gr.LinePlot(x="x", y="y"),
+            examples=[["World"]],
+            cache_examples=True,
+        )
+        with connect(io):
+            prediction = io.examples_handler.load_from_cache(0)
+        assert json.loads(prediction[0])["data"] == [[1.0, 1.5], [2.0, 2.5], [3.0, 0.5]]
+
     def test_caching_with_update(self, patched_cache_folder, connect):
         io = gr.Interface(
             lambda x: gr.update(visible=False),
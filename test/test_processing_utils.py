@@ -1,6 +1,9 @@
+import asyncio
 import os
 import shutil
+import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,6 +12,7 @@ import numpy as np
 import pytest
 from gradio_client import media_data
 from PIL import Image, ImageCms
+from pydub import AudioSegment
 
 from gradio import components, data_classes, processing_utils, utils
 from gradio.route_utils import API_PREFIX
@@ -49,6 +53,104 @@ class TestTempFileManagement:
         assert len([f for f in gradio_temp_dir.glob("**/*") if f.is_file()]) == 2
         assert Path(f).name == "cheetah1-copy.jpg"
 
+    def test_save_file_to_cache_reads_file_once(self, gradio_temp_dir, monkeypatch):
+        monkeypatch.setenv("GRADIO_CACHE_STAT_FAST_PATH", "True")
+        src = gradio_temp_dir / "src" / "data.bin"
+        src.parent.mkdir()
+        src.write_bytes(os.urandom(3 * 1024 * 1024))
+
+        with patch.object(processing_utils, "_reflink", return_value=False):
+            with patch.object(
+                processing_utils, "hash_file", wraps=processing_utils.hash_file
+            ) as hash_file:
+                f = processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir)
+        hash_file.assert_not_called()
+        assert Path(f).read_bytes() == src.read_bytes()
+        assert Path(f).parent.name == processing_utils.hash_file(src)
+        assert list(gradio_temp_dir.glob(".tmp-*")) == []
+
+        with patch.object(processing_utils, "copy_and_hash_file") as copy_and_hash:
+            assert (
+                processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir) == f
+            )
+        copy_and_hash.assert_not_called()
+
+        src.write_bytes(b"changed")
+        f2 = processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir)
+        assert f2 != f
+        assert Path(f2).read_bytes() == b"changed"
+
+    def test_save_file_to_cache_rereads_files_by_default(self, gradio_temp_dir):
+        src = gradio_temp_dir / "src" / "data.bin"
+        src.parent.mkdir()
+        src.write_bytes(b"before")
+        stat = src.stat()
+        f = processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir)
+        # Rewritten in place with the same size and mtime, e.g. by `cp -p`
+        src.write_bytes(b"after!")
+        os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        f2 = processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir)
+        assert f2 != f
+        assert Path(f2).read_bytes() == b"after!"
+
+    def test_save_file_to_cache_hardlinks(self, gradio_temp_dir, monkeypatch):
+        monkeypatch.setenv("GRADIO_CACHE_HARDLINKS", "True")
+        src = gradio_temp_dir / "src" / "data.bin"
+        src.parent.mkdir()
+        src.write_bytes(b"some data")
+        f = processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir)
+        assert os.stat(f).st_ino == os.stat(src).st_ino
+        assert Path(f).parent.name == processing_utils.hash_file(src)
+
+    @pytest.mark.skipif(os.name == "nt", reason="Windows has no POSIX file modes")
+    def test_cache_files_are_not_private(self, gradio_temp_dir):
+        src = gradio_temp_dir / "src" / "data.bin"
+        src.parent.mkdir()
+        src.write_bytes(b"some data")
+        src.chmod(0o600)
+        f1 = processing_utils.save_file_to_cache(src, cache_dir=gradio_temp_dir)
+        f2 = processing_utils.save_bytes_to_cache(
+            b"other data", "data.bin", cache_dir=gradio_temp_dir
+        )
+        umask = os.umask(0)
+        os.umask(umask)
+        for f in [f1, f2]:
+            assert os.stat(f).st_mode & 0o777 == 0o666 & ~umask
+
+    @pytest.mark.asyncio
+    async def test_async_move_resource_to_block_cache_does_not_block_event_loop(
+        self, gradio_temp_dir, monkeypatch
+    ):
+        # The 2 GB file is sparse and hardlinked into the cache, so that the test only
+        # spends time hashing it rather than writing it to disk
+        monkeypatch.setenv("GRADIO_CACHE_HARDLINKS", "True")
+        src = gradio_temp_dir / "src" / "large.bin"
+        src.parent.mkdir()
+        with open(src, "wb") as f:
+            f.truncate(2 * 1024**3)
+        block = components.File()
+        block.GRADIO_CACHE = str(gradio_temp_dir / "cache")
+
+        lag = 0.0
+
+        async def probe_event_loop_lag():
+            nonlocal lag
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lag = max(lag, time.perf_counter() - start - 0.01)
+
+        probe = asyncio.create_task(probe_event_loop_lag())
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        f = await block.async_move_resource_to_block_cache(src)
+        duration = time.perf_counter() - start
+        await asyncio.sleep(0.05)
+        probe.cancel()
+
+        assert f is not None and os.path.getsize(f) == 2 * 1024**3
+        assert lag < min(0.2, duration / 2)
+
     def test_save_b64_to_cache(self, gradio_temp_dir):
         base64_file_1 = media_data.BASE64_IMAGE
         base64_file_2 = media_data.BASE64_AUDIO["data"]
@@ -179,6 +281,61 @@ class TestImagePreprocessing:
 
         assert len({img_path, img_metadata_path, img_cp1_path, img_cp2_path}) == 4
 
+    def test_save_img_with_thumbnail(self, gradio_temp_dir):
+        arr = np.random.randint(0, 255, size=(300, 200, 3), dtype=np.uint8)
+        path, thumbnail_path = processing_utils.save_img_with_thumbnail(
+            arr, cache_dir=gradio_temp_dir, thumbnail_size=50, defer=True
+        )
+        assert Image.open(thumbnail_path).size == (33, 50)
+        assert not Path(path).exists()
+        assert processing_utils.encode_deferred_image(path)
+        assert Image.open(path).size == (200, 300)
+        assert not processing_utils.encode_deferred_image(path)
+
+        # An image that is small enough is its own thumbnail
+        small = np.random.randint(0, 255, size=(30, 20, 3), dtype=np.uint8)
+        path, thumbnail_path = processing_utils.save_img_with_thumbnail(
+            small, cache_dir=gradio_temp_dir, thumbnail_size=50, defer=True
+        )
+        assert path == thumbnail_path and Path(path).exists()
+
+    def test_deferred_images_are_dropped(self, gradio_temp_dir, monkeypatch):
+        def defer():
+            arr = np.random.randint(0, 255, size=(300, 200, 3), dtype=np.uint8)
+            return processing_utils.save_img_with_thumbnail(
+                arr, cache_dir=gradio_temp_dir, thumbnail_size=50, defer=True
+            )
+
+        # Images that are not requested in time
+        path, _ = defer()
+        monkeypatch.setattr(processing_utils, "DEFERRED_IMAGES_TTL", 0)
+        processing_utils.expire_deferred_images()
+        assert not processing_utils.encode_deferred_image(path)
+        monkeypatch.undo()
+
+        # Images whose directory was deleted from the cache
+        path, thumbnail_path = defer()
+        other_path, _ = defer()
+        assert Path(other_path).parent != Path(path).parent
+        processing_utils.discard_deferred_images(Path(thumbnail_path).parent)
+        assert not processing_utils.encode_deferred_image(path)
+        assert Path(path).parent not in processing_utils._deferred_images.by_directory
+        assert processing_utils.encode_deferred_image(other_path)
+
+        path, thumbnail_path = defer()
+        shutil.rmtree(Path(thumbnail_path).parent)
+        assert not processing_utils.encode_deferred_image(path)
+        assert not Path(path).exists()
+
+    def test_map_in_image_encoder_pool(self):
+        def encode(i):
+            # Nested calls run in the calling thread of the pool instead of waiting for it
+            return processing_utils.map_in_image_encoder_pool(lambda j: i * j, [1, 2])
+
+        assert processing_utils.map_in_image_encoder_pool(encode, range(20)) == [
+            [i, 2 * i] for i in range(20)
+        ]
+
     def test_resize_and_crop(self):
         img = Image.open("gradio/test_data/test_image.png")
         new_img = processing_utils.resize_and_crop(img, (20, 20))
@@ -221,6 +378,65 @@ class TestAudioPreprocessing:
         assert np.allclose(audio, audio_)
         assert audio_.dtype == "int16"
 
+    @pytest.mark.parametrize(
+        "dtype, expected",
+        [
+            (np.int32, lambda data: (data / 65536).astype(np.int16)),
+            (np.uint16, lambda data: data.astype(np.int64) - 32768),
+            (np.uint8, lambda data: data.astype(np.int64) * 257 - 32768),
+            (np.int8, lambda data: data.astype(np.int64) * 256),
+        ],
+    )
+    def test_convert_integers_to_16_bit_wav(self, dtype, expected, monkeypatch):
+        monkeypatch.setattr(processing_utils, "AUDIO_CONVERSION_CHUNK_SIZE", 300)
+        info = np.iinfo(dtype)
+        data = np.random.default_rng(0).integers(
+            info.min, info.max, (1000, 2), dtype, endpoint=True
+        )
+        with pytest.warns(UserWarning):
+            converted = processing_utils.convert_to_16_bit_wav(data)
+        assert converted.dtype == np.int16
+        np.testing.assert_array_equal(converted, expected(data))
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32, np.float16])
+    def test_convert_floats_to_16_bit_wav(self, dtype, monkeypatch):
+        monkeypatch.setattr(processing_utils, "AUDIO_CONVERSION_CHUNK_SIZE", 300)
+        data = np.random.default_rng(0).normal(size=(1000, 2)).astype(dtype)
+        original = data.copy()
+        out = np.empty(data.shape, dtype=np.int16)
+        with pytest.warns(UserWarning):
+            converted = processing_utils.convert_to_16_bit_wav(data, out=out)
+        assert converted is out
+        np.testing.assert_array_equal(
+            converted, (data / np.abs(data).max() * 32767).astype(np.int16)
+        )
+        np.testing.assert_array_equal(data, original)
+
+        with pytest.raises(ValueError):
+            processing_utils.convert_to_16_bit_wav(data, out=out[:10])
+
+    def test_audio_to_file_matches_pydub(self, tmp_path):
+        data = np.random.default_rng(0).normal(size=(1000, 2))
+        processing_utils.audio_to_file(16000, data, tmp_path / "audio.wav")
+        samples = processing_utils.convert_to_16_bit_wav(data)
+        AudioSegment(
+            samples.tobytes(), frame_rate=16000, sample_width=2, channels=2
+        ).export(tmp_path / "expected.wav", format="wav").close()
+        assert (tmp_path / "audio.wav").read_bytes() == (
+            tmp_path / "expected.wav"
+        ).read_bytes()
+
+    def test_audio_from_file_reads_pydub_samples(self):
+        samples = np.arange(-500, 500, dtype=np.int16)
+        segment = AudioSegment(
+            samples.tobytes(), frame_rate=8000, sample_width=2, channels=2
+        )
+        with patch.object(AudioSegment, "from_file", return_value=segment):
+            sample_rate, data = processing_utils.audio_from_file("audio.mp3")
+        assert sample_rate == 8000
+        np.testing.assert_array_equal(data, samples.reshape(-1, 2))
+        assert data.flags.writeable
+
 
 class TestOutputPreprocessing:
     float_dtype_list = [
@@ -408,6 +624,71 @@ async def test_json_data_not_moved_to_cache():
     )
 
 
+@pytest.mark.asyncio
+async def test_async_move_files_to_cache_moves_files_concurrently(gradio_temp_dir):
+    block = components.Gallery()
+    moved = []
+    running = max_running = 0
+
+    async def move_resource_to_block_cache(path):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        moved.append(path)
+        return str(gradio_temp_dir / path)
+
+    block.async_move_resource_to_block_cache = move_resource_to_block_cache
+    data = [
+        {"image": {"path": f"{i % 10}.png", "meta": {"_type": "gradio.FileData"}}}
+        for i in range(20)
+    ]
+    result = await processing_utils.async_move_files_to_cache(
+        data, block, max_concurrency=4
+    )
+
+    assert [item["image"]["path"] for item in result] == [
+        str(gradio_temp_dir / f"{i % 10}.png") for i in range(20)
+    ]
+    assert sorted(moved) == [f"{i}.png" for i in range(10)]
+    assert max_running == 4
+
+
+@pytest.mark.asyncio
+async def test_async_run_media_subprocess_does_not_block_event_loop(monkeypatch):
+    monkeypatch.setenv("GRADIO_MEDIA_SUBPROCESSES", "2")
+    max_lag = 0.0
+    done = False
+
+    async def measure_lag():
+        nonlocal max_lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+
+    ticker = asyncio.create_task(measure_lag())
+    command = [sys.executable, "-c", "import time; time.sleep(0.3); print('done')"]
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[processing_utils.async_run_media_subprocess(command) for _ in range(4)]
+    )
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker
+
+    assert [stdout.strip() for stdout, _ in results] == [b"done"] * 4
+    # At most 2 processes run at the same time, so the 4 processes take 2 rounds
+    assert elapsed >= 0.6
+    assert max_lag < 0.2
+
+    with pytest.raises(RuntimeError, match="FFmpeg command failed: oops"):
+        await processing_utils.async_run_media_subprocess(
+            [sys.executable, "-c", "import sys; sys.exit('oops')"]
+        )
+
+
 def test_public_request_pass():
     tempdir = tempfile.TemporaryDirectory()
     file = processing_utils.ssrf_protected_download(
@@ -444,6 +725,71 @@ async def test_async_private_request_fail():
         )
 
 
+class TestMediaMetadata:
+    def test_metadata_is_probed_once_and_persisted(self, tmp_path, test_file_dir):
+        hash_dir = tmp_path / ("a" * 64)
+        hash_dir.mkdir()
+        video = hash_dir / "video.mp4"
+        shutil.copy(test_file_dir / "video_sample.mp4", video)
+        metadata = {"duration": 5.0, "video_codec": "h264"}
+
+        with patch.object(
+            processing_utils, "probe_media_metadata", return_value=metadata
+        ) as probe:
+            assert processing_utils.get_media_metadata(video) == metadata
+            assert processing_utils.get_media_metadata(str(video)) == metadata
+            assert probe.call_count == 1
+            assert processing_utils.get_video_length(video) == 5.0
+            assert processing_utils.video_is_playable(str(video))
+            assert probe.call_count == 1
+
+            # The persisted metadata is reused after a restart
+            processing_utils._media_metadata.clear()
+            assert processing_utils.get_media_metadata(video) == metadata
+            assert probe.call_count == 1
+
+            # Files that changed are probed again
+            with open(video, "ab") as f:
+                f.write(b"0")
+            processing_utils.get_media_metadata(video)
+            assert probe.call_count == 2
+
+        assert (hash_dir / ".video.mp4.metadata.json").exists()
+        processing_utils.delete_media_metadata(video)
+        assert not (hash_dir / ".video.mp4.metadata.json").exists()
+
+    def test_metadata_of_files_outside_the_cache_is_not_persisted(self, tmp_path):
+        audio = tmp_path / "audio.wav"
+        audio.write_bytes(b"RIFF")
+        with patch.object(
+            processing_utils, "probe_media_metadata", return_value={"duration": 1.0}
+        ) as probe:
+            assert processing_utils.get_media_metadata(audio) == {"duration": 1.0}
+            assert processing_utils.get_media_metadata(audio) == {"duration": 1.0}
+        assert probe.call_count == 1
+        assert list(tmp_path.iterdir()) == [audio]
+
+    def test_get_audio_duration(self, tmp_path, test_file_dir):
+        audio = test_file_dir / "audio_sample.wav"
+        with patch.object(processing_utils, "ffmpeg_installed", return_value=False):
+            assert processing_utils.get_audio_duration(audio) == pytest.approx(
+                1.006, abs=0.001
+            )
+
+        # The duration of formats whose headers are not read comes from ffprobe
+        audio = tmp_path / "audio.m4a"
+        audio.write_bytes(b"\x00" * 100)
+        with patch.object(processing_utils, "ffmpeg_installed", return_value=False):
+            assert processing_utils.get_audio_duration(audio) is None
+        with (
+            patch.object(processing_utils, "ffmpeg_installed", return_value=True),
+            patch.object(
+                processing_utils, "get_media_metadata", return_value={"duration": 2.0}
+            ),
+        ):
+            assert processing_utils.get_audio_duration(audio) == 2.0
+
+
 class TestAudioFormatDetection:
     @pytest.mark.parametrize(
         "file_path,expected",
@@ -1,4 +1,7 @@
+import asyncio
+import threading
 import time
+from collections import Counter
 from concurrent.futures import wait
 
 import gradio_client as grc
@@ -6,7 +9,13 @@ import pytest
 from fastapi.testclient import TestClient
 
 import gradio as gr
+from gradio.queueing import Event, MessageQueue
 from gradio.route_utils import API_PREFIX
+from gradio.server_messages import (
+    EstimationMessage,
+    ProcessCompletedMessage,
+    ProcessGeneratingMessage,
+)
 
 
 class TestQueueing:
@@ -213,3 +222,159 @@ class TestQueueing:
                     mul_job_2,
                 ]
             )
+
+
+@pytest.mark.asyncio
+async def test_queue_starts_events_when_notified_instead_of_polling(monkeypatch):
+    with gr.Blocks() as demo:
+        name = gr.Textbox()
+        name.submit(lambda x: x, name, name)
+    demo.queue()
+    queue = demo._queue
+    fn = demo.fns[0]
+
+    started = asyncio.Event()
+
+    async def process_events(events, batch, begin_time):
+        started.set()
+
+    monkeypatch.setattr(queue, "process_events", process_events)
+    queue.active_jobs = [None] * queue.max_thread_count
+    queue.processing_signal = asyncio.Event()
+    queue.processing_loop = asyncio.get_running_loop()
+    processing_task = asyncio.create_task(queue.start_processing())
+    await asyncio.sleep(0)
+    try:
+        queue.create_event_queue_for_fn(fn)
+        event = Event("session", fn, None, None)  # type: ignore
+        queue.event_analytics[event._id] = {"status": "queued"}
+        event_queue = queue.event_queue_per_concurrency_id[fn.concurrency_id]
+        event_queue.append(event)
+        queue.queue_size += 1
+        queue.update_ready_concurrency_ids(event_queue)
+
+        # Without a notification, the scheduler should stay parked on the signal
+        await asyncio.sleep(0.2)
+        assert not started.is_set()
+
+        queue.notify_processor()
+        await asyncio.wait_for(started.wait(), timeout=1)
+        assert queue.event_analytics[event._id]["status"] == "processing"
+    finally:
+        queue.close()
+        await asyncio.wait_for(processing_task, timeout=1)
+
+
+def test_get_events_batches_per_fn_and_serves_concurrency_ids_round_robin():
+    with gr.Blocks() as demo:
+        name = gr.Textbox()
+        name.submit(lambda x: x, name, name, batch=True, max_batch_size=2)
+        name.change(lambda x: x, name, name, concurrency_id="other")
+    demo.queue()
+    queue = demo._queue
+    batch_fn, other_fn = demo.fns[0], demo.fns[1]
+    events = {}
+    for fn in [batch_fn, other_fn, batch_fn, batch_fn, other_fn]:
+        queue.create_event_queue_for_fn(fn)
+        event = Event("session", fn, None, None)  # type: ignore
+        event_queue = queue.event_queue_per_concurrency_id[fn.concurrency_id]
+        event_queue.append(event)
+        queue.queue_size += 1
+        queue.update_ready_concurrency_ids(event_queue)
+        events.setdefault(fn, []).append(event)
+    assert len(queue) == 5
+
+    taken = []
+    while event_batch := queue.get_events():
+        taken.append(event_batch[0])
+        event_queue = queue.event_queue_per_concurrency_id[event_batch[2]]
+        queue.update_ready_concurrency_ids(event_queue)
+
+    assert taken == [
+        events[batch_fn][:2],
+        [events[other_fn][0]],
+        [events[batch_fn][2]],
+        [events[other_fn][1]],
+    ]
+    assert len(queue) == 0
+    assert not queue.ready_concurrency_ids
+
+
+@pytest.mark.asyncio
+async def test_message_queue_wakes_waiting_stream_from_another_thread():
+    messages = MessageQueue()
+    assert await messages.get(timeout=0.01) is None
+
+    message = EstimationMessage(queue_size=1)
+    timer = threading.Timer(0.05, messages.put_nowait, args=(message,))
+    start = time.monotonic()
+    timer.start()
+    assert await messages.get(timeout=5) is message
+    assert time.monotonic() - start < 1
+    assert len(messages) == 0
+
+    messages.wake()
+    assert await messages.get(timeout=5) is None
+
+
+def generating_message(token: str) -> ProcessGeneratingMessage:
+    return ProcessGeneratingMessage(
+        output={"data": [[["append", [], token]]], "changed_state_ids": []},
+        success=True,
+        event_id="event",
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_queue_coalesces_intermediate_outputs():
+    counts = Counter()
+    messages = MessageQueue(counts)
+    messages.put_nowait(generating_message("a"), coalesce=(0.2, 1000))
+    messages.put_nowait(generating_message("b"), coalesce=(0.2, 1000))
+    messages.put_nowait(generating_message("c"), coalesce=(0.2, 1000))
+
+    frame = await messages.get(timeout=1)
+    assert isinstance(frame, ProcessGeneratingMessage)
+    assert frame.output["data"] == [
+        [["append", [], "a"], ["append", [], "b"], ["append", [], "c"]]
+    ]
+    assert counts == {"messages_in": 3, "frames_out": 1}
+
+    # A message that is not coalesced flushes the open frame without waiting for its deadline
+    messages.put_nowait(generating_message("d"), coalesce=(10, 1000))
+    completed = ProcessCompletedMessage(output={}, success=True, event_id="event")
+    messages.put_nowait(completed)
+    start = time.monotonic()
+    frame = await messages.get(timeout=1)
+    assert frame is not None and frame.output["data"] == [[["append", [], "d"]]]
+    assert await messages.get(timeout=1) is completed
+    assert time.monotonic() - start < 1
+
+    # Frames that reach the maximum size are sent right away
+    messages.put_nowait(generating_message("e"), coalesce=(10, 1))
+    messages.put_nowait(generating_message("f"), coalesce=(10, 1))
+    start = time.monotonic()
+    assert (await messages.get(timeout=1)).output["data"] == [[["append", [], "e"]]]  # type: ignore
+    assert (await messages.get(timeout=1)).output["data"] == [[["append", [], "f"]]]  # type: ignore
+    assert time.monotonic() - start < 1
+
+
+def test_coalesced_streaming_outputs_are_applied_in_order(connect):
+    def stream(n):
+        text = ""
+        for i in range(int(n)):
+            text += str(i % 10)
+            yield text
+
+    with gr.Blocks() as demo:
+        num = gr.Number()
+        out = gr.Textbox()
+        num.submit(stream, num, out, coalesce_window=0.2)
+
+    with connect(demo) as client:
+        job = client.submit(200, fn_index=0)
+        assert job.result() == "".join(str(i % 10) for i in range(200))
+        assert job.outputs()[-1] == job.result()
+
+    counts = demo._queue.coalescing_counts
+    assert 0 < counts["frames_out"] < counts["messages_in"]
@@ -1,5 +1,6 @@
 """Contains tests for networking.py and app.py"""
 
+import asyncio
 import functools
 import inspect
 import json
@@ -22,6 +23,7 @@ import starlette.routing
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 from gradio_client import media_data
+from PIL import Image
 
 import gradio as gr
 from gradio import (
@@ -37,7 +39,9 @@ from gradio import (
 from gradio.route_utils import (
     API_PREFIX,
     FnIndexInferError,
+    MediaStream,
     compare_passwords_securely,
+    delete_files_created_by_app,
     get_api_call_path,
     get_request_origin,
     get_root_url,
@@ -402,6 +406,24 @@ class TestRoutes:
         assert file_response_with_partial_range.is_success
         assert len(file_response_with_partial_range.text) == 11
 
+    def test_get_deferred_gallery_image(self):
+        image = np.random.randint(0, 255, (200, 300, 3), dtype=np.uint8)
+        app, _, _ = gr.Interface(
+            lambda: [image], None, gr.Gallery(thumbnail_size=32)
+        ).launch(prevent_thread_lock=True)
+        client = TestClient(app)
+        response = client.post(
+            f"{API_PREFIX}/api/predict/",
+            json={"data": [], "fn_index": 0, "session_hash": "_"},
+        ).json()
+        item = response["data"][0][0]
+        assert Path(item["thumbnail"]["path"]).exists()
+        # The full resolution image is only encoded when it is first requested
+        assert not Path(item["image"]["path"]).exists()
+        file_response = client.get(f"{API_PREFIX}/file={item['image']['path']}")
+        assert file_response.is_success
+        assert Image.open(item["image"]["path"]).size == (300, 200)
+
     def test_mount_gradio_app(self):
         app = FastAPI()
 
@@ -688,6 +710,55 @@ class TestRoutes:
         assert "IN CUSTOM LIFESPAN" in captured.out
         assert "AFTER CUSTOM LIFESPAN" in captured.out
 
+    def test_delete_cache_max_bytes_evicts_least_recently_used(self, gradio_temp_dir):
+        with gr.Blocks() as demo:
+            file = gr.File()
+            pinned = gr.File()
+
+        paths = []
+        for i in range(4):
+            path = gradio_temp_dir / str(i) / "file.txt"
+            path.parent.mkdir()
+            path.write_bytes(b"x" * 100)
+            paths.append(str(path))
+            (pinned if i == 0 else file).temp_files.add(str(path))
+        pinned.keep_in_cache.add(paths[0])
+
+        delete_files_created_by_app(demo, age=3600)
+        assert demo.cache_index is not None
+        assert demo.cache_index.total_size == 400
+        demo.cache_index.touch(paths[1])
+        delete_files_created_by_app(demo, age=3600, max_bytes=250)
+        assert [os.path.exists(p) for p in paths] == [True, True, False, False]
+        assert file.temp_files == {paths[1]}
+
+        demo.cache_index.touch(paths[1])
+        time.sleep(1.1)
+        delete_files_created_by_app(demo, age=1)
+        assert [os.path.exists(p) for p in paths] == [True, False, False, False]
+
+        assert list(demo.cache_index.entries) == [paths[0]]
+
+    def test_delete_cache_only_deletes_files_of_the_app(self, gradio_temp_dir):
+        with gr.Blocks() as demo:
+            file = gr.File()
+        with gr.Blocks() as other_demo:
+            other_file = gr.File()
+
+        paths = []
+        for i, component in enumerate([file, other_file]):
+            path = gradio_temp_dir / str(i) / "file.txt"
+            path.parent.mkdir()
+            path.write_bytes(b"x" * 100)
+            paths.append(str(path))
+            component.temp_files.add(str(path))
+
+        delete_files_created_by_app(other_demo, age=3600)
+        delete_files_created_by_app(demo, age=3600, max_bytes=0)
+        assert [os.path.exists(p) for p in paths] == [False, True]
+        delete_files_created_by_app(demo, age=None)
+        assert os.path.exists(paths[1])
+
     def test_monitoring_link(self):
         with Blocks() as demo:
             i = Textbox()
@@ -723,6 +794,122 @@ def test_api_listener(connect):
         assert client.predict(a=1, b=3, c="testing", api_name="/addition") == (4, "es")
 
 
+class TestMediaStream:
+    @pytest.mark.asyncio
+    async def test_segments_are_stored_in_a_file(self, gradio_temp_dir):
+        stream = MediaStream(cache_dir=gradio_temp_dir)
+        for i in range(3):
+            await stream.add_segment(
+                {"data": bytes([i]) * 10, "duration": 1.5, "extension": ".aac"}
+            )
+        assert stream.path and os.path.getsize(stream.path) == 30
+        segment_ids = list(stream.segments)
+        assert stream.read_segment(stream.segments[segment_ids[1]]) == b"\x01" * 10
+        assert stream.read_segments() == [bytes([i]) * 10 for i in range(3)]
+
+        playlist = stream.playlist()
+        assert "#EXT-X-PLAYLIST-TYPE:EVENT\n" in playlist
+        assert [line for line in playlist.splitlines() if "aac" in line] == [
+            f"{segment_id}.aac" for segment_id in segment_ids
+        ]
+        assert "#EXT-X-ENDLIST" not in playlist
+        assert stream._map is not None
+        stream.end_stream()
+        assert stream._map is None
+        assert stream.playlist().endswith("#EXT-X-ENDLIST\n")
+        assert stream.read_segments() == [bytes([i]) * 10 for i in range(3)]
+        assert stream._map is None
+        stream.close()
+        assert not os.path.exists(stream.path)
+
+    @pytest.mark.asyncio
+    async def test_segment_added_after_end_does_not_keep_file_open(
+        self, gradio_temp_dir
+    ):
+        stream = MediaStream(cache_dir=gradio_temp_dir)
+        await stream.add_segment({"data": b"a", "duration": 1, "extension": ".aac"})
+        stream.end_stream()
+        await stream.add_segment({"data": b"b", "duration": 1, "extension": ".aac"})
+        assert stream._file is None
+        assert stream.read_segments() == [b"a", b"b"]
+
+    @pytest.mark.asyncio
+    async def test_discard_streams(self, gradio_temp_dir):
+        with gr.Blocks() as demo:
+            audio = gr.Audio(streaming=True)
+            other_audio = gr.Audio(streaming=True)
+
+        async def create_stream():
+            stream = MediaStream(cache_dir=gradio_temp_dir)
+            await stream.add_segment({"data": b"a", "duration": 1, "extension": ".aac"})
+            return stream
+
+        ended, streaming, other = [await create_stream() for _ in range(3)]
+        ended.end_stream()
+        demo.pending_streams["session"][1] = {audio._id: ended}
+        demo.pending_streams["session"][2] = {audio._id: streaming}
+        demo.pending_streams["session"][3] = {other_audio._id: other}
+
+        demo.discard_streams("session", audio._id, ended_only=True)
+        assert ended.closed and not os.path.exists(ended.path)  # type: ignore
+        assert not streaming.closed and not other.closed
+        assert list(demo.pending_streams["session"]) == [2, 3]
+
+        demo.discard_streams("session")
+        assert streaming.closed and other.closed
+        assert "session" not in demo.pending_streams
+
+    @pytest.mark.asyncio
+    async def test_sliding_window(self):
+        stream = MediaStream(window_size=2)
+        for _ in range(5):
+            await stream.add_segment({"data": b"x", "duration": 1, "extension": ".ts"})
+        playlist = stream.playlist()
+        assert "#EXT-X-PLAYLIST-TYPE" not in playlist
+        assert "#EXT-X-MEDIA-SEQUENCE:3\n" in playlist
+        assert "#EXT-X-DISCONTINUITY-SEQUENCE:3\n" in playlist
+        assert playlist.count("#EXTINF") == 2
+        assert list(stream.segments)[-1] in playlist
+        assert len(stream.segments) == 2
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_compacts_file(self, gradio_temp_dir):
+        stream = MediaStream(cache_dir=gradio_temp_dir, window_size=2)
+        await stream.add_segment(
+            {"data": b"a" * 10, "duration": 1, "extension": ".aac"}
+        )
+        first = next(iter(stream.segments.values()))
+        for i in range(1, 10):
+            await stream.add_segment(
+                {"data": bytes([i]) * 10, "duration": 1, "extension": ".aac"}
+            )
+            assert os.path.getsize(stream.path) <= 40  # type: ignore
+        assert stream.read_segments() == [b"\x08" * 10, b"\x09" * 10]
+        assert stream.read_segment(first) == b""
+        stream.end_stream()
+        assert stream.read_segments() == [b"\x08" * 10, b"\x09" * 10]
+        stream.close()
+
+    def test_stream_routes(self, gradio_temp_dir):
+        with gr.Blocks() as demo:
+            audio = gr.Audio(streaming=True)
+        app, _, _ = demo.launch(prevent_thread_lock=True)
+        client = TestClient(app)
+        stream = MediaStream(cache_dir=gradio_temp_dir)
+        asyncio.run(
+            stream.add_segment({"data": b"abc", "duration": 1, "extension": ".aac"})
+        )
+        demo.pending_streams["session"][1] = {audio._id: stream}
+        prefix = f"{API_PREFIX}/stream/session/1/{audio._id}"
+
+        playlist = client.get(f"{prefix}/playlist.m3u8").text
+        assert playlist == stream.playlist()
+        segment_id = next(iter(stream.segments))
+        assert client.get(f"{prefix}/{segment_id}.aac").content == b"abc"
+        assert client.get(f"{prefix}/missing.aac").status_code == 404
+        demo.close()
+
+
 class TestApp:
     def test_create_app(self):
         app = routes.App.create_app(Interface(lambda x: x, "text", "text"))
@@ -1714,6 +1901,8 @@ def test_mount_gradio_app_args_match_launch_args():
         "share_server_protocol",
         "share_server_tls_certificate",
         "state_session_capacity",
+        "state_memory_budget",
+        "state_backend",
         "_frontend",
         "self",
         "strict_cors",
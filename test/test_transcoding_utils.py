@@ -0,0 +1,94 @@
+import shutil
+
+import pytest
+
+from gradio import processing_utils, transcoding_utils
+
+
+class TestCanRemux:
+    def test_h264_and_aac_can_be_remuxed(self):
+        assert transcoding_utils.can_remux(
+            [
+                {"codec_type": "video", "codec_name": "h264", "pix_fmt": "yuv420p"},
+                {"codec_type": "audio", "codec_name": "aac"},
+                {"codec_type": "data", "codec_name": "bin_data"},
+            ]
+        )
+        assert transcoding_utils.can_remux(
+            [{"codec_type": "video", "codec_name": "h264", "pix_fmt": "yuv420p"}]
+        )
+
+    def test_other_codecs_are_reencoded(self):
+        assert not transcoding_utils.can_remux(
+            [
+                {"codec_type": "video", "codec_name": "h264", "pix_fmt": "yuv420p"},
+                {"codec_type": "audio", "codec_name": "mp3"},
+            ]
+        )
+        assert not transcoding_utils.can_remux(
+            [{"codec_type": "video", "codec_name": "vp9", "pix_fmt": "yuv420p"}]
+        )
+        assert not transcoding_utils.can_remux(
+            [{"codec_type": "video", "codec_name": "h264", "pix_fmt": "yuv444p"}]
+        )
+        assert not transcoding_utils.can_remux(
+            [{"codec_type": "audio", "codec_name": "aac"}]
+        )
+
+
+def test_transcoder_cache():
+    cache = transcoding_utils.TranscoderCache(max_size=2)
+    first = cache.get_transcoder("a", first_chunk=True)
+    first.remux = True
+    assert cache.get_transcoder("a", first_chunk=False) is first
+    cache.get_transcoder("b", first_chunk=True)
+    cache.get_transcoder("a", first_chunk=False)
+    cache.get_transcoder("c", first_chunk=True)
+    assert list(cache) == ["a", "c"]
+    # A new run of a stream with the same id starts with a new transcoder
+    assert cache.get_transcoder("a", first_chunk=True).remux is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "use_pyav",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not transcoding_utils.pyav_installed(), reason="PyAV is not installed"
+            ),
+        ),
+        pytest.param(
+            False,
+            marks=pytest.mark.skipif(
+                not processing_utils.ffmpeg_installed(),
+                reason="ffmpeg is not installed",
+            ),
+        ),
+    ],
+)
+async def test_video_stream_transcoder_remuxes_h264(use_pyav, tmp_path, test_file_dir):
+    transcoder = transcoding_utils.VideoStreamTranscoder(use_pyav=use_pyav)
+    for i in range(2):
+        mp4_file = tmp_path / f"{i}.mp4"
+        shutil.copy(test_file_dir / "video_sample.mp4", mp4_file)
+        duration = await transcoder.convert(str(mp4_file), str(tmp_path / f"{i}.ts"))
+        assert duration == pytest.approx(5, abs=0.1)
+        assert transcoder.remux
+        assert (tmp_path / f"{i}.ts").read_bytes()[0] == 0x47  # MPEG-TS sync byte
+
+
+@pytest.mark.skipif(
+    not transcoding_utils.pyav_installed(), reason="PyAV is not installed"
+)
+def test_convert_audio_to_adts(test_file_dir):
+    wav = (test_file_dir / "audio_sample.wav").read_bytes()
+    adts, duration = transcoding_utils.convert_audio_to_adts(wav)
+    assert adts[:2] in (b"\xff\xf1", b"\xff\xf9")  # ADTS sync word
+    assert duration == pytest.approx(1.1, abs=0.1)
+
+    # AAC is remuxed as is
+    remuxed, remuxed_duration = transcoding_utils.convert_audio_to_adts(adts)
+    assert len(remuxed) == len(adts)
+    assert remuxed_duration == pytest.approx(duration, abs=0.05)
@@ -12,6 +12,7 @@ from unittest.mock import patch
 import numpy as np
 import pytest
 from gradio_client.exceptions import AppError
+from gradio_client.utils import apply_diff
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
@@ -27,6 +28,7 @@ from gradio.utils import (
     assert_configs_are_equivalent_besides_ids,
     check_function_inputs_match,
     colab_check,
+    deep_hash,
     delete_none,
     diff,
     download_if_url,
@@ -538,10 +540,49 @@ def test_get_extension_from_file_path_or_url(path_or_url, extension):
                 ["delete", ["data", 1], None],
             ],
         ),
+        (
+            [[1, 2, 3], "a"],
+            [[1], "ab", "c"],
+            [
+                ["delete", [0, 1], None],
+                ["delete", [0, 1], None],
+                ["append", [1], "b"],
+                ["add", [2], "c"],
+            ],
+        ),
+        ([1, {"a": 1}], [1.0, {"a": 1.0}], []),
     ],
 )
 def test_diff(old, new, expected_diff):
     assert diff(old, new) == expected_diff
+    assert apply_diff(old, expected_diff) == new
+
+
+def test_diff_of_streamed_chat_history_only_contains_changes():
+    history = [
+        {"role": "user" if i % 2 else "assistant", "content": f"message {i}"}
+        for i in range(2000)
+    ]
+    old = [dict(message) for message in history]
+    new = [dict(message) for message in history] + [
+        {"role": "assistant", "content": "Hi"}
+    ]
+    new[-2]["content"] += "!"
+    assert diff(old, new) == [
+        ["append", [1999, "content"], "!"],
+        ["add", [2000], {"role": "assistant", "content": "Hi"}],
+    ]
+
+
+def test_diff_of_numpy_arrays():
+    rows = np.array([[1.0, 2.0], [3.0, 4.0]])
+    old = {"columns": ["x", "y"], "data": rows}
+    assert diff(old, {"columns": ["x", "y"], "data": rows.copy()}) == []
+    new_rows = np.array([[1.0, 2.0], [3.0, 5.0]])
+    assert diff(old, {"columns": ["x", "y"], "data": new_rows}) == [
+        ["replace", ["data"], new_rows]
+    ]
+    assert diff([rows, 1], [rows.copy(), 2]) == [["replace", [1], 2]]
 
 
 class TestFunctionParams:
@@ -697,6 +738,47 @@ class TestUnhashableKeyDict:
             d["nonexistent"]
 
 
+class TestDeepHash:
+    def test_detects_changes_made_in_place(self):
+        value = {"history": [{"role": "user", "content": "hi"}], "array": np.zeros(3)}
+        h = deep_hash(value)
+        assert deep_hash({**value}) == h
+        value["history"].append({"role": "assistant", "content": "hello"})
+        assert deep_hash(value) != h
+        h = deep_hash(value)
+        value["array"][1] = 1
+        assert deep_hash(value) != h
+
+    def test_equal_values_have_the_same_hash(self):
+        assert deep_hash({"a": 1, "b": {"x": [1], "y": 2}}) == deep_hash(
+            {"b": {"y": 2, "x": [1]}, "a": 1}
+        )
+        assert deep_hash({"c", "a", "b"}) == deep_hash({"a", "b", "c"})
+        assert deep_hash([frozenset(range(100))]) == deep_hash(
+            [frozenset(reversed(range(100)))]
+        )
+        item = {"role": "user", "content": "hi"}
+        assert deep_hash([item, item]) == deep_hash([item, dict(item)])
+        assert deep_hash({"a": 1, "b": 2}) != deep_hash({"a": 1, "b": 3})
+
+    def test_hashes_values_that_contain_themselves(self):
+        value: list = [1]
+        value.append(value)
+        assert deep_hash(value) == deep_hash(value)
+
+    def test_hashes_other_objects_by_identity(self):
+        class Model:
+            def __init__(self):
+                self.weights = list(range(10))
+
+        model = Model()
+        h = deep_hash([model, (i for i in range(3))])
+        model.weights.append(10)
+        assert deep_hash([model]) == deep_hash([model])
+        assert deep_hash([model]) != deep_hash([Model()])
+        assert h != deep_hash([model])
+
+
 class TestSafeDeepCopy:
     def test_safe_deepcopy_dict(self):
         original = {"key1": [1, 2, {"nested_key": "value"}], "key2": "simple_string"}